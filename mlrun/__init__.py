@@ -24,6 +24,8 @@ __all__ = [
     "get_secret_or_env",
 ]
 
+import importlib
+import importlib.util
 import warnings
 from os import environ, path
 
@@ -43,38 +45,55 @@ from .platforms import (
     mount_v3io_legacy,
     v3io_cred,
 )
-from .projects import (
-    ProjectMetadata,
-    build_function,
-    deploy_function,
-    get_or_create_project,
-    load_project,
-    new_project,
-    pipeline_context,
-    run_function,
-)
-from .projects.project import _add_username_to_project_name_if_needed
-from .run import (
-    _run_pipeline,
-    code_to_function,
-    function_to_module,
-    get_dataitem,
-    get_object,
-    get_or_create_ctx,
-    get_pipeline,
-    handler,
-    import_function,
-    new_function,
-    run_local,
-    run_pipeline,
-    wait_for_pipeline_completion,
-)
 from .runtimes import ArtifactType, new_model_server
 from .secrets import get_secret_or_env
 from .utils.version import Version
 
 __version__ = Version().get()["version"]
 
+# the projects and run API objects are imported on first access (PEP 562), so "import mlrun" (e.g. in a
+# serving function or a job) doesn't import the projects/pipelines modules
+_lazy_imports = {
+    "ProjectMetadata": ".projects",
+    "build_function": ".projects",
+    "deploy_function": ".projects",
+    "get_or_create_project": ".projects",
+    "load_project": ".projects",
+    "new_project": ".projects",
+    "pipeline_context": ".projects",
+    "run_function": ".projects",
+    "_add_username_to_project_name_if_needed": ".projects.project",
+    "_run_pipeline": ".run",
+    "code_to_function": ".run",
+    "function_to_module": ".run",
+    "get_dataitem": ".run",
+    "get_object": ".run",
+    "get_or_create_ctx": ".run",
+    "get_pipeline": ".run",
+    "handler": ".run",
+    "import_function": ".run",
+    "new_function": ".run",
+    "run_local": ".run",
+    "run_pipeline": ".run",
+    "wait_for_pipeline_completion": ".run",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    elif not name.startswith("__") and importlib.util.find_spec(f"{__name__}.{name}"):
+        # sub packages/modules which used to be imported (indirectly) with the package
+        return importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + list(_lazy_imports)
+
 
 def get_version():
     """get current mlrun version"""
@@ -129,6 +148,12 @@ def set_environment(
         default project name
         actual artifact path/url, can be used to create subpaths per task or group of artifacts
     """
+    from . import (
+        ProjectMetadata,
+        _add_username_to_project_name_if_needed,
+        get_or_create_project,
+    )
+
     if user_project or project:
         warnings.warn(
             "'user_project' and 'project' are deprecated in 1.3.0, and will be removed in 1.5.0, use project "
@@ -188,6 +213,8 @@ def set_environment(
 
 
 def get_current_project(silent=False):
+    from . import pipeline_context
+
     if not pipeline_context.project and not silent:
         raise MLRunInvalidArgumentError(
             "current project is not initialized, use new, get or load project methods first"
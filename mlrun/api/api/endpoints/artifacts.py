@@ -24,7 +24,7 @@ import mlrun.api.utils.auth.verifier
 import mlrun.api.utils.singletons.project_member
 from mlrun.api import schemas
 from mlrun.api.api import deps
-from mlrun.api.api.utils import log_and_raise
+from mlrun.api.api.utils import log_and_raise, stream_ndjson_pages
 from mlrun.api.schemas.artifact import ArtifactsFormat
 from mlrun.config import config
 from mlrun.utils import is_legacy_artifact, logger
@@ -177,6 +177,7 @@ async def delete_artifact(
 @router.get("/artifacts")
 @router.get("/projects/{project}/artifacts")
 async def list_artifacts(
+    request: Request,
     project: str = None,
     name: str = None,
     tag: str = None,
@@ -186,6 +187,8 @@ async def list_artifacts(
     iter: int = Query(None, ge=0),
     best_iteration: bool = Query(False, alias="best-iteration"),
     format_: ArtifactsFormat = Query(ArtifactsFormat.full, alias="format"),
+    page_size: int = Query(None, alias="page-size", gt=0),
+    page_token: str = Query(None, alias="page-token"),
     auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -197,6 +200,50 @@ async def list_artifacts(
         auth_info,
     )
 
+    async def filter_artifacts(artifacts):
+        return await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
+            mlrun.api.schemas.AuthorizationResourceTypes.artifact,
+            artifacts,
+            _artifact_project_and_resource_name_extractor,
+            auth_info,
+        )
+
+    stream = request.headers.get("accept") == mlrun.api.schemas.MediaTypes.ndjson
+    if page_size or page_token or stream:
+        # keyset pagination, the artifacts are sorted by their update time
+        if best_iteration:
+            log_and_raise(
+                HTTPStatus.BAD_REQUEST.value,
+                reason="Pagination is not supported with best-iteration",
+            )
+
+        def list_artifacts_page(next_page_token, next_page_size):
+            return mlrun.api.crud.Artifacts().list_artifacts_page(
+                db_session,
+                next_page_size,
+                next_page_token,
+                project,
+                name,
+                tag,
+                labels,
+                kind=kind,
+                category=category,
+                iter=iter,
+                format_=format_,
+            )
+
+        if stream:
+            return stream_ndjson_pages(
+                list_artifacts_page, filter_artifacts, page_token, page_size
+            )
+        artifacts, next_page_token = await run_in_threadpool(
+            list_artifacts_page, page_token, page_size
+        )
+        return {
+            "artifacts": await filter_artifacts(artifacts),
+            "pagination": {"page-token": next_page_token},
+        }
+
     artifacts = await run_in_threadpool(
         mlrun.api.crud.Artifacts().list_artifacts,
         db_session,
@@ -210,15 +257,8 @@ async def list_artifacts(
         best_iteration=best_iteration,
         format_=format_,
     )
-
-    artifacts = await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
-        mlrun.api.schemas.AuthorizationResourceTypes.artifact,
-        artifacts,
-        _artifact_project_and_resource_name_extractor,
-        auth_info,
-    )
     return {
-        "artifacts": artifacts,
+        "artifacts": await filter_artifacts(artifacts),
     }
 
 
@@ -83,3 +83,35 @@ async def get_log(
         media_type="text/plain",
         headers=headers,
     )
+
+
+@router.get("/log/{project}/{uid}/follow")
+async def follow_log(
+    project: str,
+    uid: str,
+    offset: int = 0,
+    timeout: int = fastapi.Query(None, gt=0),
+    auth_info: mlrun.api.schemas.AuthInfo = fastapi.Depends(
+        mlrun.api.api.deps.authenticate_request
+    ),
+    db_session: sqlalchemy.orm.Session = fastapi.Depends(
+        mlrun.api.api.deps.get_db_session
+    ),
+):
+    """
+    Stream the run logs from the given offset as they are written (long poll), the response ends when the run reaches
+    a terminal state or when the timeout passes, then the client can follow again from the offset it reached
+    """
+    await mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+        mlrun.api.schemas.AuthorizationResourceTypes.log,
+        project,
+        uid,
+        mlrun.api.schemas.AuthorizationAction.read,
+        auth_info,
+    )
+    # fail (before the response starts streaming) if the run doesn't exist
+    await run_in_threadpool(mlrun.api.crud.Runs().get_run, db_session, uid, 0, project)
+    return fastapi.responses.StreamingResponse(
+        mlrun.api.crud.Logs().follow_logs(db_session, project, uid, offset, timeout),
+        media_type="text/plain",
+    )
@@ -25,7 +25,7 @@ import mlrun.api.schemas
 import mlrun.api.utils.auth.verifier
 import mlrun.api.utils.singletons.project_member
 from mlrun.api.api import deps
-from mlrun.api.api.utils import log_and_raise
+from mlrun.api.api.utils import log_and_raise, stream_ndjson_pages
 from mlrun.utils import logger
 from mlrun.utils.helpers import datetime_from_iso
 
@@ -155,6 +155,7 @@ async def delete_run(
 
 @router.get("/runs")
 async def list_runs(
+    request: Request,
     project: str = None,
     name: str = None,
     uid: List[str] = Query([]),
@@ -179,6 +180,11 @@ async def list_runs(
     ),
     max_partitions: int = Query(0, alias="max-partitions", ge=0),
     with_notifications: bool = Query(False, alias="with-notifications"),
+    page_size: int = Query(None, alias="page-size", gt=0),
+    page_token: str = Query(None, alias="page-token"),
+    format_: mlrun.api.schemas.RunsFormat = Query(
+        mlrun.api.schemas.RunsFormat.full, alias="format"
+    ),
     auth_info: mlrun.api.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -188,6 +194,58 @@ async def list_runs(
             mlrun.api.schemas.AuthorizationAction.read,
             auth_info,
         )
+
+    async def filter_runs(runs):
+        return await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
+            mlrun.api.schemas.AuthorizationResourceTypes.run,
+            runs,
+            lambda run: (
+                run.get("metadata", {}).get("project", mlrun.mlconf.default_project),
+                run.get("metadata", {}).get("uid"),
+            ),
+            auth_info,
+        )
+
+    stream = request.headers.get("accept") == mlrun.api.schemas.MediaTypes.ndjson
+    if page_size or page_token or stream:
+        # keyset pagination, the runs are sorted by their start time
+        if partition_by or last:
+            log_and_raise(
+                HTTPStatus.BAD_REQUEST.value,
+                reason="Pagination is not supported with partition-by or last",
+            )
+
+        def list_runs_page(next_page_token, next_page_size):
+            return mlrun.api.crud.Runs().list_runs_page(
+                db_session,
+                next_page_size,
+                next_page_token,
+                name,
+                uid,
+                project,
+                labels,
+                [state] if state is not None else None,
+                iter,
+                datetime_from_iso(start_time_from),
+                datetime_from_iso(start_time_to),
+                datetime_from_iso(last_update_time_from),
+                datetime_from_iso(last_update_time_to),
+                with_notifications=with_notifications,
+                format_=format_,
+            )
+
+        if stream:
+            return stream_ndjson_pages(
+                list_runs_page, filter_runs, page_token, page_size
+            )
+        runs, next_page_token = await run_in_threadpool(
+            list_runs_page, page_token, page_size
+        )
+        return {
+            "runs": await filter_runs(runs),
+            "pagination": {"page-token": next_page_token},
+        }
+
     runs = await run_in_threadpool(
         mlrun.api.crud.Runs().list_runs,
         db_session,
@@ -209,18 +267,10 @@ async def list_runs(
         partition_order,
         max_partitions,
         with_notifications=with_notifications,
-    )
-    filtered_runs = await mlrun.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
-        mlrun.api.schemas.AuthorizationResourceTypes.run,
-        runs,
-        lambda run: (
-            run.get("metadata", {}).get("project", mlrun.mlconf.default_project),
-            run.get("metadata", {}).get("uid"),
-        ),
-        auth_info,
+        format_=format_,
     )
     return {
-        "runs": filtered_runs,
+        "runs": await filter_runs(runs),
     }
 
 
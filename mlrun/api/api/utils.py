@@ -25,6 +25,8 @@ from pathlib import Path
 import kubernetes.client
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 import mlrun.api.crud
@@ -54,6 +56,40 @@ def log_and_raise(status=HTTPStatus.BAD_REQUEST.value, **kw):
     raise HTTPException(status_code=status, detail=kw)
 
 
+def stream_ndjson_pages(
+    list_page: typing.Callable[[typing.Optional[str], int], tuple],
+    filter_page: typing.Callable[[list], typing.Awaitable[list]],
+    page_token: str = None,
+    page_size: int = None,
+) -> StreamingResponse:
+    """
+    Stream a paginated list as newline delimited JSON, the pages are read (in a thread pool) and filtered one after
+    the other so the full list is never held in memory.
+
+    :param list_page:   A function receiving (page_token, page_size) and returning (items, next_page_token).
+    :param filter_page: An async function filtering the items of a page (e.g. by permissions).
+    :param page_token:  The token of the first page to stream.
+    :param page_size:   The number of items read per page.
+    """
+    page_size = page_size or int(config.httpdb.pagination.default_page_size)
+
+    async def generate_lines():
+        next_page_token = page_token
+        while True:
+            items, next_page_token = await run_in_threadpool(
+                list_page, next_page_token, page_size
+            )
+            items = await filter_page(items)
+            if items:
+                yield "".join(
+                    json.dumps(jsonable_encoder(item)) + "\n" for item in items
+                )
+            if not next_page_token:
+                break
+
+    return StreamingResponse(generate_lines(), media_type=schemas.MediaTypes.ndjson)
+
+
 def log_path(project, uid) -> Path:
     return project_logs_path(project) / uid
 
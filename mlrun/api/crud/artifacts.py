@@ -118,6 +118,43 @@ class Artifacts(
             for artifact in artifacts
         ]
 
+    def list_artifacts_page(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        page_size: int,
+        page_token: str = None,
+        project: str = mlrun.mlconf.default_project,
+        name: str = "",
+        tag: str = "",
+        labels: typing.List[str] = None,
+        kind: typing.Optional[str] = None,
+        category: typing.Optional[mlrun.api.schemas.ArtifactCategories] = None,
+        iter: typing.Optional[int] = None,
+        format_: ArtifactsFormat = ArtifactsFormat.full,
+    ) -> typing.Tuple[typing.List, typing.Optional[str]]:
+        project = project or mlrun.mlconf.default_project
+        (
+            artifacts,
+            next_page_token,
+        ) = mlrun.api.utils.singletons.db.get_db().list_artifacts_page(
+            db_session,
+            page_size,
+            page_token,
+            name,
+            project,
+            tag,
+            labels or [],
+            kind=kind,
+            category=category,
+            iter=iter,
+        )
+        if format_ == ArtifactsFormat.legacy:
+            artifacts = [
+                _transform_artifact_struct_to_legacy_format(artifact)
+                for artifact in artifacts
+            ]
+        return artifacts, next_page_token
+
     def list_artifact_tags(
         self,
         db_session: sqlalchemy.orm.Session,
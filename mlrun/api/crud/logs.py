@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
 import pathlib
 import shutil
+import time
 import typing
 from http import HTTPStatus
 
@@ -28,7 +30,7 @@ from mlrun.api.api.utils import log_and_raise, log_path, project_logs_path
 from mlrun.api.constants import LogSources
 from mlrun.api.utils.singletons.db import get_db
 from mlrun.api.utils.singletons.k8s import get_k8s
-from mlrun.runtimes.constants import PodPhases
+from mlrun.runtimes.constants import PodPhases, RunStates
 from mlrun.utils import logger
 
 
@@ -195,14 +197,80 @@ class Logs(
                         )
                     pod, pod_phase = list(pods.items())[0]
                     if pod_phase != PodPhases.pending:
-                        resp = get_k8s().logs(pod)
-                        if resp:
-                            if size == -1:
-                                log_contents = resp.encode()[offset:]
-                            else:
-                                log_contents = resp.encode()[offset : offset + size]
+                        log_contents = self._read_pod_log_range(pod, size, offset)
         return log_contents
 
+    @staticmethod
+    def _read_pod_log_range(pod: str, size: int = -1, offset: int = 0) -> bytes:
+        """
+        Read a byte range of the pod log. k8s has no offset parameter for pod logs, so the log is streamed from its
+        beginning up to the end of the range (limitBytes), and the bytes before the offset are skipped instead of
+        being kept in memory
+        """
+        if size == 0:
+            return b""
+        limit_bytes = offset + size if size > 0 else None
+        log_contents = bytearray()
+        position = 0
+        for chunk in get_k8s().logs_stream(pod, limit_bytes=limit_bytes):
+            chunk_start = max(offset - position, 0)
+            position += len(chunk)
+            if chunk_start < len(chunk):
+                log_contents += chunk[chunk_start:]
+            if size > 0 and len(log_contents) >= size:
+                break
+        if size > 0:
+            # limitBytes is not exact, k8s may return slightly more
+            del log_contents[size:]
+        return bytes(log_contents)
+
+    async def follow_logs(
+        self,
+        db_session: Session,
+        project: str,
+        uid: str,
+        offset: int = 0,
+        timeout: float = None,
+    ) -> typing.AsyncIterable[bytes]:
+        """
+        Follow the run logs from the given offset - new logs are yielded as they are written, until the run reaches a
+        terminal state (and its logs were fully read) or until the timeout passes.
+        The caller tracks the offset by the number of yielded bytes, and re-issues the call from it if the run
+        didn't end
+        :param db_session: db session
+        :param project: project name
+        :param uid: run uid
+        :param offset: number of bytes to skip (default 0)
+        :param timeout: max time to follow the logs, in seconds (default mlconf.httpdb.logs.follow.timeout)
+        """
+        follow_config = mlrun.mlconf.httpdb.logs.follow
+        timeout = float(timeout or follow_config.timeout)
+        interval = float(follow_config.interval)
+        chunk_size = int(follow_config.chunk_size)
+        deadline = time.monotonic() + timeout
+        while True:
+            # the state is resolved before reading the logs, so when it's terminal the logs read after it are complete
+            run_state, log_stream = await self.get_logs(
+                db_session, project, uid, chunk_size, offset
+            )
+            read_size = 0
+            async for log in log_stream:
+                if log:
+                    read_size += len(log)
+                    yield log
+            offset += read_size
+            if time.monotonic() >= deadline:
+                # the caller continues from the offset if the run didn't end
+                return
+            if read_size >= chunk_size:
+                # there may be more logs already
+                continue
+            if run_state not in RunStates.non_terminal_states():
+                return
+            await asyncio.sleep(interval)
+            # end the session transaction, so the next read gets the current run state and not the same snapshot
+            await run_in_threadpool(db_session.rollback)
+
     async def _get_logs_legacy_method_generator_wrapper(
         self,
         db_session: Session,
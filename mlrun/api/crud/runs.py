@@ -128,6 +128,7 @@ class Runs(
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
         with_notifications: bool = False,
+        format_: mlrun.api.schemas.RunsFormat = mlrun.api.schemas.RunsFormat.full,
     ):
         project = project or mlrun.mlconf.default_project
         return mlrun.api.utils.singletons.db.get_db().list_runs(
@@ -152,6 +153,44 @@ class Runs(
             requested_logs,
             return_as_run_structs,
             with_notifications,
+            format_,
+        )
+
+    def list_runs_page(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        page_size: int,
+        page_token: str = None,
+        name=None,
+        uid=None,
+        project: str = mlrun.mlconf.default_project,
+        labels=None,
+        states: typing.Optional[typing.List[str]] = None,
+        iter=False,
+        start_time_from=None,
+        start_time_to=None,
+        last_update_time_from=None,
+        last_update_time_to=None,
+        with_notifications: bool = False,
+        format_: mlrun.api.schemas.RunsFormat = mlrun.api.schemas.RunsFormat.full,
+    ) -> typing.Tuple[typing.List[dict], typing.Optional[str]]:
+        project = project or mlrun.mlconf.default_project
+        return mlrun.api.utils.singletons.db.get_db().list_runs_page(
+            db_session,
+            page_size,
+            page_token,
+            name,
+            uid,
+            project,
+            labels,
+            states,
+            iter,
+            start_time_from,
+            start_time_to,
+            last_update_time_from,
+            last_update_time_to,
+            with_notifications=with_notifications,
+            format_=format_,
         )
 
     def delete_run(
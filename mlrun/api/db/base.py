@@ -106,9 +106,48 @@ class DBInterface(ABC):
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
         with_notifications: bool = False,
+        format_: schemas.RunsFormat = schemas.RunsFormat.full,
     ):
         pass
 
+    def list_runs_page(
+        self,
+        session,
+        page_size: int,
+        page_token: str = None,
+        name=None,
+        uid: Optional[Union[str, List[str]]] = None,
+        project="",
+        labels=None,
+        states=None,
+        iter=False,
+        start_time_from=None,
+        start_time_to=None,
+        last_update_time_from=None,
+        last_update_time_to=None,
+        requested_logs: bool = None,
+        with_notifications: bool = False,
+        format_: schemas.RunsFormat = schemas.RunsFormat.full,
+    ) -> Tuple[list, Optional[str]]:
+        # dbs without pagination support return all the runs in a single page (without a next page token)
+        runs = self.list_runs(
+            session,
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            states=states,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            requested_logs=requested_logs,
+            with_notifications=with_notifications,
+            format_=format_,
+        )
+        return runs, None
+
     @abstractmethod
     def del_run(self, session, uid, project="", iter=0):
         pass
@@ -180,6 +219,38 @@ class DBInterface(ABC):
     ):
         pass
 
+    def list_artifacts_page(
+        self,
+        session,
+        page_size: int,
+        page_token: str = None,
+        name="",
+        project="",
+        tag="",
+        labels=None,
+        since=None,
+        until=None,
+        kind=None,
+        category: schemas.ArtifactCategories = None,
+        iter: int = None,
+        use_tag_as_uid: bool = None,
+    ) -> Tuple[list, Optional[str]]:
+        # dbs without pagination support return all the artifacts in a single page (without a next page token)
+        artifacts = self.list_artifacts(
+            session,
+            name=name,
+            project=project,
+            tag=tag,
+            labels=labels,
+            since=since,
+            until=until,
+            kind=kind,
+            category=category,
+            iter=iter,
+            use_tag_as_uid=use_tag_as_uid,
+        )
+        return artifacts, None
+
     @abstractmethod
     def del_artifact(self, session, key, tag="", project=""):
         pass
@@ -102,7 +102,9 @@ class FileDB(DBInterface):
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
         with_notifications: bool = False,
+        format_: schemas.RunsFormat = schemas.RunsFormat.full,
     ):
+        # the file db has no runs table columns to summarize from, full runs are always returned
         return self._transform_run_db_error(
             self.db.list_runs,
             name,
@@ -122,9 +124,7 @@ class FileDB(DBInterface):
             partition_sort_by,
             partition_order,
             max_partitions,
-            requested_logs,
-            return_as_run_structs,
-            with_notifications,
+            with_notifications=with_notifications,
         )
 
     def del_run(self, session, uid, project="", iter=0):
@@ -13,8 +13,10 @@
 # limitations under the License.
 #
 import asyncio
+import base64
 import collections
 import functools
+import json
 import re
 import typing
 from copy import deepcopy
@@ -24,9 +26,10 @@ from typing import Any, Dict, List, Tuple
 import fastapi.concurrency
 import mergedeep
 import pytz
+import sqlalchemy
 from sqlalchemy import and_, distinct, func, or_
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm import Query, Session, aliased, defer, selectinload
 
 import mlrun
 import mlrun.api.db.session
@@ -329,21 +332,21 @@ class SQLDB(DBInterface):
         requested_logs: bool = None,
         return_as_run_structs: bool = True,
         with_notifications: bool = False,
+        format_: schemas.RunsFormat = schemas.RunsFormat.full,
     ):
         project = project or config.default_project
         query = self._find_runs(session, uid, project, labels)
-        if name is not None:
-            query = self._add_run_name_query(query, name)
-        if states is not None:
-            query = query.filter(Run.state.in_(states))
-        if start_time_from is not None:
-            query = query.filter(Run.start_time >= start_time_from)
-        if start_time_to is not None:
-            query = query.filter(Run.start_time <= start_time_to)
-        if last_update_time_from is not None:
-            query = query.filter(Run.updated >= last_update_time_from)
-        if last_update_time_to is not None:
-            query = query.filter(Run.updated <= last_update_time_to)
+        query = self._add_runs_filters(
+            query,
+            name,
+            states,
+            iter,
+            start_time_from,
+            start_time_to,
+            last_update_time_from,
+            last_update_time_to,
+            requested_logs,
+        )
         if sort:
             query = query.order_by(Run.start_time.desc())
         if last:
@@ -352,10 +355,6 @@ class SQLDB(DBInterface):
                     "Limiting the number of returned records without sorting will provide non-deterministic results"
                 )
             query = query.limit(last)
-        if not iter:
-            query = query.filter(Run.iteration == 0)
-        if requested_logs is not None:
-            query = query.filter(Run.requested_logs == requested_logs)
         if partition_by:
             self._assert_partition_by_parameters(
                 schemas.RunPartitionByField, partition_by, partition_sort_by
@@ -373,12 +372,105 @@ class SQLDB(DBInterface):
         if not return_as_run_structs:
             return query.all()
 
+        if format_ == schemas.RunsFormat.summary:
+            return self._run_records_to_summaries(session, query.options(defer("body")))
+
         # Purposefully not using outer join to avoid returning runs without notifications
         if with_notifications:
             query = query.join(Notification, Run.id == Notification.run)
 
+        return self._run_records_to_structs(query, with_notifications)
+
+    def list_runs_page(
+        self,
+        session,
+        page_size: int,
+        page_token: str = None,
+        name=None,
+        uid: typing.Optional[typing.Union[str, List[str]]] = None,
+        project=None,
+        labels=None,
+        states=None,
+        iter=False,
+        start_time_from=None,
+        start_time_to=None,
+        last_update_time_from=None,
+        last_update_time_to=None,
+        requested_logs: bool = None,
+        with_notifications: bool = False,
+        format_: schemas.RunsFormat = schemas.RunsFormat.full,
+    ) -> typing.Tuple[RunList, typing.Optional[str]]:
+        """list a page of runs (sorted by start time, newest first) using keyset pagination, the returned page
+        token is passed to get the next page (None when there are no more runs)"""
+        project = project or config.default_project
+        query = self._find_runs(session, uid, project, labels)
+        query = self._add_runs_filters(
+            query,
+            name,
+            states,
+            iter,
+            start_time_from,
+            start_time_to,
+            last_update_time_from,
+            last_update_time_to,
+            requested_logs,
+        )
+        if format_ == schemas.RunsFormat.summary:
+            run_records, next_page_token = self._get_keyset_page(
+                query.options(defer("body")), Run, Run.start_time, page_size, page_token
+            )
+            return (
+                self._run_records_to_summaries(session, run_records),
+                next_page_token,
+            )
+
+        if with_notifications:
+            # filtering (instead of joining) keeps a row per run, so the page limit counts runs and not
+            # notifications, the notifications of the page runs are then loaded in a single query
+            query = query.filter(
+                Run.id.in_(session.query(Notification.run).subquery())
+            ).options(selectinload(Run.notifications))
+        run_records, next_page_token = self._get_keyset_page(
+            query, Run, Run.start_time, page_size, page_token
+        )
+        return (
+            self._run_records_to_structs(run_records, with_notifications),
+            next_page_token,
+        )
+
+    def _add_runs_filters(
+        self,
+        query,
+        name=None,
+        states=None,
+        iter=False,
+        start_time_from=None,
+        start_time_to=None,
+        last_update_time_from=None,
+        last_update_time_to=None,
+        requested_logs: bool = None,
+    ):
+        if name is not None:
+            query = self._add_run_name_query(query, name)
+        if states is not None:
+            query = query.filter(Run.state.in_(states))
+        if start_time_from is not None:
+            query = query.filter(Run.start_time >= start_time_from)
+        if start_time_to is not None:
+            query = query.filter(Run.start_time <= start_time_to)
+        if last_update_time_from is not None:
+            query = query.filter(Run.updated >= last_update_time_from)
+        if last_update_time_to is not None:
+            query = query.filter(Run.updated <= last_update_time_to)
+        if not iter:
+            query = query.filter(Run.iteration == 0)
+        if requested_logs is not None:
+            query = query.filter(Run.requested_logs == requested_logs)
+        return query
+
+    def _run_records_to_structs(self, run_records, with_notifications: bool = False):
         runs = RunList()
-        for run in query:
+        for run in run_records:
             run_struct = run.struct
             if with_notifications:
                 run_struct.setdefault("spec", {}).setdefault("notifications", [])
@@ -398,6 +490,47 @@ class SQLDB(DBInterface):
 
         return runs
 
+    def _run_records_to_summaries(self, session, run_records) -> RunList:
+        """
+        Build the runs summaries from the runs table columns only, the run bodies are not loaded nor decoded
+        """
+        run_records = list(run_records)
+        runs_labels = self._get_runs_labels(session, [run.id for run in run_records])
+        runs = RunList()
+        for run in run_records:
+            start_time = self._add_utc_timezone(run.start_time)
+            updated = self._add_utc_timezone(run.updated)
+            runs.append(
+                {
+                    "metadata": {
+                        "name": run.name,
+                        "uid": run.uid,
+                        "iter": run.iteration,
+                        "project": run.project,
+                        "labels": runs_labels.get(run.id, {}),
+                    },
+                    "status": {
+                        "state": run.state,
+                        "start_time": start_time.isoformat() if start_time else None,
+                        "last_update": updated.isoformat() if updated else None,
+                    },
+                }
+            )
+        return runs
+
+    @staticmethod
+    def _get_runs_labels(
+        session, run_ids: List[int], chunk_size: int = 500
+    ) -> Dict[int, Dict[str, str]]:
+        runs_labels = collections.defaultdict(dict)
+        for index in range(0, len(run_ids), chunk_size):
+            labels = session.query(
+                Run.Label.parent, Run.Label.name, Run.Label.value
+            ).filter(Run.Label.parent.in_(run_ids[index : index + chunk_size]))
+            for run_id, name, value in labels:
+                runs_labels[run_id][name] = value
+        return runs_labels
+
     def del_run(self, session, uid, project=None, iter=0):
         project = project or config.default_project
         # We currently delete *all* iterations
@@ -650,23 +783,66 @@ class SQLDB(DBInterface):
         else:
             artifact["metadata"]["tag"] = tag
 
-    def _add_tags_to_artifact_struct(
-        self, session, artifact_struct, artifact_id, tag=None
-    ):
-        artifacts = []
+    def _add_tags_to_artifact_structs(
+        self,
+        session,
+        artifact_structs_and_ids: List[Tuple[dict, int]],
+        tag=None,
+    ) -> List[dict]:
+        """
+        Set the tags in the artifact structs, an artifact with multiple tags is returned once per tag.
+        The tags of all the artifacts are read together (a query per chunk of ids) instead of a query per artifact.
+        """
         if tag and tag != "*":
-            self._set_tag_in_artifact_struct(artifact_struct, tag)
+            for artifact_struct, _ in artifact_structs_and_ids:
+                self._set_tag_in_artifact_struct(artifact_struct, tag)
+            return [artifact_struct for artifact_struct, _ in artifact_structs_and_ids]
+
+        artifacts_tags = self._get_artifacts_tags(
+            session, [artifact_id for _, artifact_id in artifact_structs_and_ids]
+        )
+        artifacts = []
+        for artifact_struct, artifact_id in artifact_structs_and_ids:
+            tags = artifacts_tags.get(artifact_id)
+            if not tags:
+                artifacts.append(artifact_struct)
+                continue
+            for tag_name in tags[:-1]:
+                artifacts.append(
+                    self._copy_artifact_struct_with_tag(artifact_struct, tag_name)
+                )
+            # the struct itself can be used for the last tag
+            self._set_tag_in_artifact_struct(artifact_struct, tags[-1])
             artifacts.append(artifact_struct)
-        else:
-            tag_results = self._query(session, Artifact.Tag, obj_id=artifact_id).all()
-            if not tag_results:
-                return [artifact_struct]
-            for tag_object in tag_results:
-                artifact_with_tag = deepcopy(artifact_struct)
-                self._set_tag_in_artifact_struct(artifact_with_tag, tag_object.name)
-                artifacts.append(artifact_with_tag)
         return artifacts
 
+    def _get_artifacts_tags(
+        self, session, artifact_ids: List[int], chunk_size: int = 500
+    ) -> Dict[int, List[str]]:
+        # the ids are chunked to keep the IN clause within the database bound parameters limit
+        artifacts_tags = collections.defaultdict(list)
+        for index in range(0, len(artifact_ids), chunk_size):
+            tags = (
+                session.query(Artifact.Tag.obj_id, Artifact.Tag.name)
+                .filter(
+                    Artifact.Tag.obj_id.in_(artifact_ids[index : index + chunk_size])
+                )
+                .order_by(Artifact.Tag.id)
+            )
+            for artifact_id, tag_name in tags:
+                artifacts_tags[artifact_id].append(tag_name)
+        return artifacts_tags
+
+    @staticmethod
+    def _copy_artifact_struct_with_tag(artifact_struct: dict, tag: str) -> dict:
+        # only the dict holding the tag is copied, the (possibly large) rest of the struct is shared
+        if is_legacy_artifact(artifact_struct):
+            return {**artifact_struct, "tag": tag}
+        return {
+            **artifact_struct,
+            "metadata": {**artifact_struct["metadata"], "tag": tag},
+        }
+
     def read_artifact(self, session, key, tag="", iter=None, project=""):
         project = project or config.default_project
         ids = self._resolve_tag(session, Artifact, project, tag)
@@ -728,21 +904,7 @@ class SQLDB(DBInterface):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "best-iteration cannot be used when iter is specified"
             )
-        # TODO: Refactor this area
-        ids = "*"
-        if tag:
-            # use_tag_as_uid is used to catch old artifacts which were created when logging artifacts using the project
-            # producer and not by context, this because when were logging artifacts using the project producer we were
-            # setting the artifact uid to be the same as the producer tag which at the time was "latest", this becomes a
-            # problem with uid="latest" because there are also "latest" tags in the system, which means we will get ids
-            # response from the `_resolve_tag` above and then we will iterate over the wrong artifact
-            # use_tag_as_uid==None is keeping the old behavior
-            # use_tag_as_uid==False also keeps the old behavior for now, but left that option to be able to change later
-            # use_tag_as_uid==True saying to the list artifacts that the tag is actually the uid
-            if tag == "*" or use_tag_as_uid:
-                ids = tag
-            else:
-                ids = self._resolve_tag(session, Artifact, project, tag)
+        ids = self._resolve_artifact_tag_ids(session, project, tag, use_tag_as_uid)
 
         artifacts = ArtifactList()
         artifact_records = self._find_artifacts(
@@ -789,6 +951,7 @@ class SQLDB(DBInterface):
         indexed_artifacts = {
             f"{artifact.key}-{artifact.uid}": artifact for artifact in artifact_records
         }
+        artifact_structs_and_ids = []
         for artifact in artifact_records:
             has_iteration = self._name_with_iter_regex.match(artifact.key)
 
@@ -798,11 +961,7 @@ class SQLDB(DBInterface):
             if best_iteration:
                 if has_iteration:
                     continue
-                if is_legacy_artifact(artifact.struct):
-                    link_iteration = artifact.struct.get("link_iteration")
-                else:
-                    link_iteration = artifact.struct["spec"].get("link_iteration")
-
+                link_iteration = artifact.link_iteration
                 if link_iteration:
                     # link artifact key is without the iteration so to pull the linked artifact we need to
                     # concatenate the <link-iteration>-<artifact.key>-<artifact.uid> together
@@ -819,16 +978,86 @@ class SQLDB(DBInterface):
             if iter == 0 and has_iteration:
                 continue
 
-            artifact_struct = artifact.struct
-
-            # set the tags in the artifact struct
-            artifacts_with_tag = self._add_tags_to_artifact_struct(
-                session, artifact_struct, artifact.id, tag
-            )
-            artifacts.extend(artifacts_with_tag)
+            artifact_structs_and_ids.append((artifact.struct, artifact.id))
 
+        # set the tags in the artifact structs
+        artifacts.extend(
+            self._add_tags_to_artifact_structs(session, artifact_structs_and_ids, tag)
+        )
         return artifacts
 
+    def list_artifacts_page(
+        self,
+        session,
+        page_size: int,
+        page_token: str = None,
+        name=None,
+        project=None,
+        tag=None,
+        labels=None,
+        since=None,
+        until=None,
+        kind=None,
+        category: schemas.ArtifactCategories = None,
+        iter: int = None,
+        use_tag_as_uid: bool = None,
+    ) -> typing.Tuple[ArtifactList, typing.Optional[str]]:
+        """
+        List a page of artifacts (sorted by update time, newest first) using keyset pagination, the returned page token
+        is passed to get the next page (None when there are no more artifacts).
+        The kind/category filters are applied in the query, only artifacts stored before the kind column was added
+        (and not migrated yet) are filtered on the page records, so a page may contain less than page_size artifacts.
+        """
+        project = project or config.default_project
+        if category and kind:
+            message = "Category and Kind filters can't be given together"
+            logger.warning(message, kind=kind, category=category)
+            raise ValueError(message)
+
+        ids = self._resolve_artifact_tag_ids(session, project, tag, use_tag_as_uid)
+        query = self._find_artifacts_query(
+            session, project, ids, labels, since, until, name, iter, use_tag_as_uid
+        )
+        kinds, exclude = None, False
+        if kind:
+            kinds = [kind]
+        elif category:
+            kinds, exclude = category.to_kinds_filter()
+        if kinds:
+            query = self._add_artifacts_kinds_filter(query, kinds, exclude)
+            if category and not exclude:
+                query = self._add_artifacts_link_target_filter(session, query, kinds)
+        artifact_records, next_page_token = self._get_keyset_page(
+            query, Artifact, Artifact.updated, page_size, page_token
+        )
+        artifact_structs_and_ids = [
+            (artifact.struct, artifact.id)
+            for artifact in artifact_records
+            if not (iter == 0 and self._name_with_iter_regex.match(artifact.key))
+        ]
+        artifacts = ArtifactList(
+            self._add_tags_to_artifact_structs(session, artifact_structs_and_ids, tag)
+        )
+        return artifacts, next_page_token
+
+    def _resolve_artifact_tag_ids(self, session, project, tag, use_tag_as_uid):
+        # TODO: Refactor this area
+        ids = "*"
+        if tag:
+            # use_tag_as_uid is used to catch old artifacts which were created when logging artifacts using the project
+            # producer and not by context, this because when were logging artifacts using the project producer we were
+            # setting the artifact uid to be the same as the producer tag which at the time was "latest", this becomes a
+            # problem with uid="latest" because there are also "latest" tags in the system, which means we will get ids
+            # response from the `_resolve_tag` above and then we will iterate over the wrong artifact
+            # use_tag_as_uid==None is keeping the old behavior
+            # use_tag_as_uid==False also keeps the old behavior for now, but left that option to be able to change later
+            # use_tag_as_uid==True saying to the list artifacts that the tag is actually the uid
+            if tag == "*" or use_tag_as_uid:
+                ids = tag
+            else:
+                ids = self._resolve_tag(session, Artifact, project, tag)
+        return ids
+
     def _get_link_artifacts_by_keys_and_uids(self, session, project, identifiers):
         # identifiers are tuples of (key, uid)
         if not identifiers:
@@ -2026,6 +2255,65 @@ class SQLDB(DBInterface):
                 f"Invalid partition_by given: '{partition_by.value}'. Must be one of {valid_enum_values}"
             )
 
+    def _get_keyset_page(
+        self, query, cls, sort_column, page_size: int, page_token: str = None
+    ) -> typing.Tuple[list, typing.Optional[str]]:
+        """
+        Return a page of the query records, sorted by the sort column and the id (descending), and the token of the
+        next page (None for the last page).
+        Keyset pagination filters the records after the last (sort value, id) of the previous page instead of using
+        an offset, so fetching a page doesn't scan the preceding pages and concurrent inserts don't shift the pages.
+        """
+        if page_size <= 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Page size must be positive, got {page_size}"
+            )
+        if page_token:
+            sort_value, last_id = self._decode_page_token(page_token)
+            if sort_value is None:
+                # null sort values are ordered last (in descending order)
+                query = query.filter(and_(sort_column.is_(None), cls.id < last_id))
+            else:
+                query = query.filter(
+                    or_(
+                        sort_column < sort_value,
+                        and_(sort_column == sort_value, cls.id < last_id),
+                        sort_column.is_(None),
+                    )
+                )
+        records = (
+            query.order_by(sort_column.desc(), cls.id.desc()).limit(page_size + 1).all()
+        )
+        if len(records) <= page_size:
+            return records, None
+        records = records[:page_size]
+        last_record = records[-1]
+        sort_value = getattr(last_record, sort_column.key)
+        return records, self._encode_page_token(sort_value, last_record.id)
+
+    @staticmethod
+    def _encode_page_token(sort_value: typing.Optional[datetime], last_id: int) -> str:
+        token = {
+            "sort_value": sort_value.isoformat() if sort_value else None,
+            "id": last_id,
+        }
+        return base64.urlsafe_b64encode(json.dumps(token).encode()).decode()
+
+    @staticmethod
+    def _decode_page_token(
+        page_token: str,
+    ) -> typing.Tuple[typing.Optional[datetime], int]:
+        try:
+            token = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+            sort_value = token["sort_value"]
+            if sort_value is not None:
+                sort_value = datetime.fromisoformat(sort_value)
+            return sort_value, int(token["id"])
+        except Exception as exc:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Invalid page token: {page_token}"
+            ) from exc
+
     @staticmethod
     def _create_partitioned_query(
         session,
@@ -2961,6 +3249,33 @@ class SQLDB(DBInterface):
             message = "Category and Kind filters can't be given together"
             logger.warning(message, kind=kind, category=category)
             raise ValueError(message)
+        query = self._find_artifacts_query(
+            session, project, ids, labels, since, until, name, iter, use_tag_as_uid
+        )
+
+        if kind:
+            return self._filter_artifacts_by_kinds(query, [kind])
+
+        elif category:
+            filtered_artifacts = self._filter_artifacts_by_category(query, category)
+            # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
+            #        the wrong category. Remove this when we refactor this area.
+            return self._filter_out_extra_link_artifacts(filtered_artifacts)
+        else:
+            return query.all()
+
+    def _find_artifacts_query(
+        self,
+        session,
+        project,
+        ids,
+        labels=None,
+        since=None,
+        until=None,
+        name=None,
+        iter=None,
+        use_tag_as_uid: bool = None,
+    ):
         labels = label_set(labels)
         query = self._query(session, Artifact, project=project)
         if ids != "*":
@@ -2979,18 +3294,7 @@ class SQLDB(DBInterface):
                 and_(Artifact.updated >= since, Artifact.updated <= until)
             )
 
-        query = self._add_artifact_name_and_iter_query(query, name, iter)
-
-        if kind:
-            return self._filter_artifacts_by_kinds(query, [kind])
-
-        elif category:
-            filtered_artifacts = self._filter_artifacts_by_category(query, category)
-            # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
-            #        the wrong category. Remove this when we refactor this area.
-            return self._filter_out_extra_link_artifacts(filtered_artifacts)
-        else:
-            return query.all()
+        return self._add_artifact_name_and_iter_query(query, name, iter)
 
     def _filter_artifacts_by_category(
         self, artifacts, category: schemas.ArtifactCategories
@@ -2998,6 +3302,44 @@ class SQLDB(DBInterface):
         kinds, exclude = category.to_kinds_filter()
         return self._filter_artifacts_by_kinds(artifacts, kinds, exclude)
 
+    @staticmethod
+    def _add_artifacts_kinds_filter(query, kinds: List[str], exclude: bool = False):
+        if exclude:
+            # artifacts without a kind aren't of any of the given kinds
+            return query.filter(
+                or_(Artifact.kind.notin_(kinds), Artifact.kind.is_(None))
+            )
+        return query.filter(Artifact.kind.in_(kinds))
+
+    @staticmethod
+    def _add_artifacts_link_target_filter(session, query, kinds: List[str]):
+        """
+        Keep only the link artifacts which point at an existing artifact of the given kinds (the query equivalent of
+        _filter_out_extra_link_artifacts)
+        """
+        import mlrun.artifacts
+
+        link_kind = mlrun.artifacts.base.LinkArtifact.kind
+        target = aliased(Artifact)
+        target_exists = (
+            session.query(target.id)
+            .filter(
+                target.project == Artifact.project,
+                target.key
+                == sqlalchemy.cast(Artifact.link_iteration, sqlalchemy.String)
+                + "-"
+                + Artifact.key,
+                target.kind.in_([kind for kind in kinds if kind != link_kind]),
+            )
+            .exists()
+        )
+        return query.filter(
+            or_(
+                Artifact.kind != link_kind,
+                and_(Artifact.link_iteration.isnot(None), target_exists),
+            )
+        )
+
     def _filter_artifacts_by_kinds(
         self, artifacts, kinds: List[str], exclude: bool = False
     ):
@@ -3006,26 +3348,11 @@ class SQLDB(DBInterface):
         :param exclude - if true then the filter will be "all except" - get all artifacts excluding the ones who have
          any of the given kinds
         """
-        # see docstring of _post_query_runs_filter for why we're filtering it manually
-        filtered_artifacts = []
-        for artifact in artifacts:
-            artifact_json = artifact.struct
-            if (
-                artifact_json
-                and isinstance(artifact_json, dict)
-                and (
-                    (
-                        not exclude
-                        and any([kind == artifact_json.get("kind") for kind in kinds])
-                    )
-                    or (
-                        exclude
-                        and all([kind != artifact_json.get("kind") for kind in kinds])
-                    )
-                )
-            ):
-                filtered_artifacts.append(artifact)
-        return filtered_artifacts
+        if isinstance(artifacts, Query):
+            return self._add_artifacts_kinds_filter(artifacts, kinds, exclude).all()
+        return [
+            artifact for artifact in artifacts if (artifact.kind in kinds) != exclude
+        ]
 
     # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
     #        the wrong category. Remove this when we refactor this area.
@@ -3036,17 +3363,14 @@ class SQLDB(DBInterface):
         link_artifacts = []
         filtered_artifacts = []
         for artifact in artifacts:
-            if artifact.struct.get("kind") != "link":
+            if artifact.kind != "link":
                 existing_keys.add(artifact.key)
                 filtered_artifacts.append(artifact)
             else:
                 link_artifacts.append(artifact)
 
         for link_artifact in link_artifacts:
-            if "spec" in link_artifact.struct:
-                link_iteration = link_artifact.struct["spec"].get("link_iteration")
-            else:
-                link_iteration = link_artifact.struct.get("link_iteration")
+            link_iteration = link_artifact.link_iteration
             if not link_iteration:
                 continue
             linked_key = f"{link_iteration}-{link_artifact.key}"
@@ -34,6 +34,8 @@ from sqlalchemy.orm import class_mapper, relationship
 
 from mlrun.api import schemas
 from mlrun.api.utils.db.sql_collation import SQLCollationUtil
+from mlrun.api.utils.db.struct_body import StructBodyUtil
+from mlrun.utils import is_legacy_artifact
 
 Base = declarative_base()
 NULL = None  # Avoid flake8 issuing warnings when comparing in filter
@@ -57,13 +59,23 @@ class BaseModel:
 
 
 class HasStruct(BaseModel):
+    # the format new bodies are encoded with, see StructBodyUtil
+    body_format = StructBodyUtil.Formats.pickle
+
     @property
     def struct(self):
-        return pickle.loads(self.body)
+        return StructBodyUtil.decode(self.body)
 
     @struct.setter
     def struct(self, value):
-        self.body = pickle.dumps(value)
+        self.body = StructBodyUtil.encode(value, self.body_format)
+        self.update_summary_columns(value)
+
+    def update_summary_columns(self, struct):
+        """
+        Set the columns promoted from the struct, so they can be filtered/listed without decoding the body
+        """
+        pass
 
     def to_dict(self, exclude=None):
         """
@@ -140,15 +152,26 @@ with warnings.catch_warnings():
         project = Column(String(255, collation=SQLCollationUtil.collation()))
         uid = Column(String(255, collation=SQLCollationUtil.collation()))
         updated = Column(sqlalchemy.dialects.mysql.TIMESTAMP(fsp=3))
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
         body = Column(sqlalchemy.dialects.mysql.MEDIUMBLOB)
+        # promoted from the body
+        kind = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
+        link_iteration = Column(Integer)
 
         labels = relationship(Label, cascade="all, delete-orphan")
         tags = relationship(Tag, cascade="all, delete-orphan")
 
+        body_format = StructBodyUtil.Formats.json
+
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.key}/{self.uid}"
 
+        def update_summary_columns(self, struct):
+            self.kind = struct.get("kind")
+            if is_legacy_artifact(struct):
+                self.link_iteration = struct.get("link_iteration")
+            else:
+                self.link_iteration = (struct.get("spec") or {}).get("link_iteration")
+
     class Function(Base, HasStruct):
         __tablename__ = "functions"
         __table_args__ = (
@@ -240,8 +263,7 @@ with warnings.catch_warnings():
             String(255, collation=SQLCollationUtil.collation()), default="no-name"
         )
         iteration = Column(Integer)
-        state = Column(String(255, collation=SQLCollationUtil.collation()))
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
+        state = Column(String(255, collation=SQLCollationUtil.collation()), index=True)
         body = Column(sqlalchemy.dialects.mysql.MEDIUMBLOB)
         start_time = Column(sqlalchemy.dialects.mysql.TIMESTAMP(fsp=3))
         updated = Column(
@@ -257,6 +279,8 @@ with warnings.catch_warnings():
         tags = relationship(Tag, cascade="all, delete-orphan")
         notifications = relationship(Notification, cascade="all, delete-orphan")
 
+        body_format = StructBodyUtil.Formats.json
+
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.uid}/{self.iteration}"
 
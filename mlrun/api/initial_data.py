@@ -107,7 +107,7 @@ def init_data(
 # This is because data version 1 points to to a data migration which was added back in 0.6.0, and
 # upgrading from a version earlier than 0.6.0 to v>=0.8.0 is not supported.
 data_version_prior_to_table_addition = 1
-latest_data_version = 2
+latest_data_version = 3
 
 
 def _resolve_needed_operations(
@@ -212,6 +212,8 @@ def _perform_data_migrations(db_session: sqlalchemy.orm.Session):
                 _perform_version_1_data_migrations(db, db_session)
             if current_data_version < 2:
                 _perform_version_2_data_migrations(db, db_session)
+            if current_data_version < 3:
+                _perform_version_3_data_migrations(db, db_session)
             db.create_data_version(db_session, str(latest_data_version))
 
 
@@ -418,6 +420,44 @@ def _find_last_updated_artifact(
     return last_updated_artifact
 
 
+def _perform_version_3_data_migrations(
+    db: mlrun.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    _encode_bodies_and_fill_summary_columns(
+        db, db_session, mlrun.api.db.sqldb.models.Run
+    )
+    _encode_bodies_and_fill_summary_columns(
+        db, db_session, mlrun.api.db.sqldb.models.Artifact
+    )
+
+
+def _encode_bodies_and_fill_summary_columns(
+    db: mlrun.api.db.sqldb.db.SQLDB,
+    db_session: sqlalchemy.orm.Session,
+    cls,
+    batch_size: int = 1000,
+):
+    logger.info("Encoding bodies and filling summary columns", table=cls.__tablename__)
+    last_id = 0
+    while True:
+        records = (
+            db_session.query(cls)
+            .filter(cls.id > last_id)
+            .order_by(cls.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not records:
+            break
+        for record in records:
+            # setting the struct re-encodes the body with the table's body format and fills the summary columns
+            record.struct = record.struct
+        db._upsert(db_session, records, ignore=True)
+        last_id = records[-1].id
+        # the records were committed, no need to keep them in the session
+        db_session.expunge_all()
+
+
 def _perform_version_2_data_migrations(
     db: mlrun.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
 ):
@@ -42,9 +42,11 @@ from .constants import (
     FeatureStorePartitionByField,
     HeaderNames,
     LogsCollectorMode,
+    MediaTypes,
     OrderType,
     PatchMode,
     RunPartitionByField,
+    RunsFormat,
     SortField,
 )
 from .feature_store import (
@@ -97,6 +97,10 @@ class HeaderNames:
     ui_clear_cache = f"{headers_prefix}ui-clear-cache"
 
 
+class MediaTypes:
+    ndjson = "application/x-ndjson"
+
+
 class FeatureStorePartitionByField(mlrun.api.utils.helpers.StrEnum):
     name = "name"  # Supported for feature-store objects
 
@@ -121,6 +125,12 @@ class RunPartitionByField(mlrun.api.utils.helpers.StrEnum):
             )
 
 
+class RunsFormat(mlrun.api.utils.helpers.StrEnum):
+    full = "full"
+    # only the fields stored in the runs table columns (without decoding the run body)
+    summary = "summary"
+
+
 class SortField(mlrun.api.utils.helpers.StrEnum):
     created = "created"
     updated = "updated"
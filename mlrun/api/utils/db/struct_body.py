@@ -0,0 +1,73 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pickle
+
+import orjson
+
+from mlrun.utils import logger
+
+
+class StructBodyUtil(object):
+    """
+    Encoding of the struct (body) column of the DB objects.
+    JSON bodies start with json_body_prefix, which holds the JSON format version. The prefix starts with a null byte,
+    which isn't a pickle opcode, so both formats can be decoded from the same column, e.g. while the bodies are being
+    migrated.
+    """
+
+    class Formats(object):
+        pickle = "pickle"
+        json = "json"
+
+    json_format_version = 1
+    json_body_prefix = f"\x00json:{json_format_version}\x00".encode()
+
+    # datetimes and dataclasses are handed to the default hook (which rejects them) instead of being converted to
+    # strings and dicts, tuples and NaN/inf are stored as lists and nulls, as the API responds with them anyway
+    _json_options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    @staticmethod
+    def encode(struct, body_format: str = Formats.pickle) -> bytes:
+        if body_format == StructBodyUtil.Formats.json:
+            try:
+                return StructBodyUtil.json_body_prefix + orjson.dumps(
+                    struct,
+                    default=_reject_json_value,
+                    option=StructBodyUtil._json_options,
+                )
+            except TypeError as exc:
+                # structs which can't be stored as JSON without changing (e.g. non-str keys, datetimes, sets)
+                # are kept pickled
+                logger.debug(
+                    "Failed encoding struct as JSON, falling back to pickle",
+                    exc=str(exc),
+                )
+        return pickle.dumps(struct)
+
+    @staticmethod
+    def decode(body: bytes):
+        if StructBodyUtil.is_json(body):
+            return orjson.loads(
+                memoryview(body)[len(StructBodyUtil.json_body_prefix) :]
+            )
+        return pickle.loads(body)
+
+    @staticmethod
+    def is_json(body: bytes) -> bool:
+        return bool(body) and body.startswith(StructBodyUtil.json_body_prefix)
+
+
+def _reject_json_value(value):
+    raise TypeError(f"Type is not stored as JSON: {type(value).__name__}")
@@ -16,7 +16,6 @@ import pathlib
 from io import StringIO
 from typing import Optional, Tuple
 
-import numpy as np
 import pandas as pd
 from deprecated import deprecated
 from pandas.io.json import build_table_schema
@@ -24,6 +23,8 @@ from pandas.io.json import build_table_schema
 import mlrun
 import mlrun.utils.helpers
 
+from ..data_types import InferOptions
+from ..data_types.stats import DFStatsAccumulator
 from ..datastore import is_store_uri, store_manager
 from .base import Artifact, ArtifactSpec, LegacyArtifact
 
@@ -503,28 +504,14 @@ class LegacyDatasetArtifact(LegacyArtifact):
 
 def get_df_stats(df):
     if hasattr(df, "dask"):
-        df = df.sample(frac=ddf_sample_pct).compute()
-    d = {}
-    for col, values in df.describe(include="all").items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
-
-        if pd.api.types.is_numeric_dtype(df[col]):
-            # store histogram
-            try:
-                hist, bins = np.histogram(df[col], bins=20)
-                stats_dict["hist"] = [hist.tolist(), bins.tolist()]
-            except Exception:
-                pass
-
-        d[col] = stats_dict
-    return d
+        # accumulate the stats partition by partition, the dataset may not fit in memory
+        stats = DFStatsAccumulator(InferOptions.Histogram)
+        for partition in df.partitions:
+            stats.update(partition.compute())
+    else:
+        stats = DFStatsAccumulator(InferOptions.Histogram, sketch_size=None)
+        stats.update(df)
+    return stats.to_dict()
 
 
 def update_dataset_meta(
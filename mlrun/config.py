@@ -44,6 +44,8 @@ env_prefix = "MLRUN_"
 env_file_key = f"{env_prefix}CONFIG_FILE"
 _load_lock = Lock()
 _none_type = type(None)
+# incremented on every config change, used to invalidate the config snapshots
+_config_generation = 0
 default_env_file = os.getenv("MLRUN_DEFAULT_ENV_FILE", "~/.mlrun.env")
 
 default_config = {
@@ -119,9 +121,28 @@ default_config = {
     },
     "sql": {
         "url": "",
+        # number of rows per insert batch when writing dataframes to a SQL target
+        "write_batch_size": 10000,
     },
     "v3io_framesd": "http://framesd:8080",
-    "datastore": {"async_source_mode": "disabled"},
+    "datastore": {
+        "async_source_mode": "disabled",
+        # parallel transfer of large objects (ranged downloads and multipart uploads), used by stores
+        # which support it (e.g. s3), objects larger than part_size are transferred in parts
+        "transfer": {
+            "part_size": 8 * 1024 * 1024,
+            "max_concurrency": 10,
+            # default chunk size (in bytes) for DataItem.iter_chunks()
+            "chunk_size": 1024 * 1024,
+        },
+        # on-disk LRU cache of remote objects read with DataItem.local()/as_df(), keyed by url + stat
+        # enabled / disabled, path defaults to a directory under the system temp dir
+        "local_cache": {
+            "mode": "disabled",
+            "path": "",
+            "max_size": 10 * 1024 * 1024 * 1024,
+        },
+    },
     # default node selector to be applied to all functions - json string base64 encoded format
     "default_function_node_selector": "e30=",
     # default priority class to be applied to functions running on k8s cluster
@@ -223,6 +244,10 @@ default_config = {
         "state": "online",
         "retry_api_call_on_exception": "enabled",
         "http_connection_timeout_keep_alive": 11,
+        "pagination": {
+            # page size used by the client list iterators and by the streaming (NDJSON) list responses
+            "default_page_size": 1000,
+        },
         "db": {
             "commit_retry_timeout": 30,
             "commit_retry_interval": 3,
@@ -302,6 +327,15 @@ default_config = {
             # this is the default interval period for pulling logs, if not specified different timeout interval
             "pull_logs_default_interval": 3,  # seconds
             "pull_logs_backoff_no_logs_default_interval": 10,  # seconds
+            "follow": {
+                # a follow (long poll) request streams the new logs until the run ends or the timeout passes, the
+                # client then re-issues it from the offset it reached
+                "timeout": 300,  # seconds
+                # interval for checking for new logs when there are none
+                "interval": 1,  # seconds
+                # max bytes read at once when following the logs
+                "chunk_size": 1024 * 1024,
+            },
         },
         "authorization": {
             "mode": "none",  # one of none, opa
@@ -422,6 +456,8 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": 300,
+        # in-process cache of online feature vector results, keyed by the entity row (0 to disable)
+        "online_cache": {"max_size": 0, "ttl": 60},
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
@@ -523,6 +559,34 @@ def is_running_as_api():
     return _is_running_as_api
 
 
+def invalidate_snapshots():
+    """invalidate the config snapshots, required after changing the config dict directly"""
+    global _config_generation
+    _config_generation += 1
+
+
+class FrozenConfig:
+    """read only snapshot of the configuration (see Config.snapshot())
+
+    the nested sections are precompiled into attributes, so reads are plain attribute lookups
+    """
+
+    def __init__(self, cfg: Mapping):
+        for key, value in cfg.items():
+            if isinstance(value, Mapping):
+                value = FrozenConfig(value)
+            object.__setattr__(self, str(key), value)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"config snapshot is read only, cannot set {attr}")
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"config snapshot is read only, cannot delete {attr}")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__!r})"
+
+
 class Config:
     _missing = object()
 
@@ -531,6 +595,7 @@ class Config:
 
         # Can't use self._cfg = cfg → infinite recursion
         object.__setattr__(self, "_cfg", cfg)
+        object.__setattr__(self, "_snapshot", None)
 
     def __getattr__(self, attr):
         val = self._cfg.get(attr, self._missing)
@@ -547,6 +612,7 @@ class Config:
             super().__setattr__(attr, value)
         else:
             self._cfg[attr] = value
+        invalidate_snapshots()
 
     def __dir__(self):
         return list(self._cfg) + dir(self.__class__)
@@ -557,7 +623,8 @@ class Config:
 
     def update(self, cfg, skip_errors=False):
         for key, value in cfg.items():
-            if hasattr(self, key):
+            # not hasattr(), it would evaluate the properties (e.g. version, which imports the mlrun utils)
+            if key in self._cfg or key in self.__dict__ or hasattr(type(self), key):
                 if isinstance(value, dict):
                     getattr(self, key).update(value)
                 else:
@@ -570,6 +637,21 @@ class Config:
                             f"Warning, failed to set config key {key}={value}, {err_to_str(exc)}"
                         )
 
+    def snapshot(self) -> FrozenConfig:
+        """return a read only snapshot of the configuration, for hot path (e.g. per event) reads
+
+        unlike the config object, which wraps every nested section in a new object on each access,
+        the snapshot nested sections are precompiled, e.g. `config.snapshot().datastore.async_source_mode`
+        doesn't allocate. the snapshot is cached and rebuilt after the config changes (set/update/reload),
+        it only holds the config dict values (not the computed properties, e.g. dbpath or iguazio_api_url).
+        """
+        generation = _config_generation
+        snapshot = self.__dict__.get("_snapshot")
+        if snapshot is None or snapshot[0] != generation:
+            snapshot = (generation, FrozenConfig(self._cfg))
+            object.__setattr__(self, "_snapshot", snapshot)
+        return snapshot[1]
+
     def dump_yaml(self, stream=None):
         return yaml.dump(self._cfg, stream, default_flow_style=False)
 
@@ -978,20 +1060,23 @@ def _do_populate(env=None, skip_errors=False):
     # underscore
     config._cfg["_iguazio_api_url"] = config._cfg["iguazio_api_url"]
     del config._cfg["iguazio_api_url"]
+    invalidate_snapshots()
 
     _validate_config(config)
 
 
 def _validate_config(config):
-    import mlrun.k8s_utils
-
     try:
         limits_gpu = config.default_function_pod_resources.limits.gpu
         requests_gpu = config.default_function_pod_resources.requests.gpu
-        mlrun.k8s_utils.verify_gpu_requests_and_limits(
-            requests_gpu=requests_gpu,
-            limits_gpu=limits_gpu,
-        )
+        if requests_gpu or limits_gpu:
+            # imported only when needed, k8s_utils imports kubernetes and the mlrun utils (on "import mlrun")
+            import mlrun.k8s_utils
+
+            mlrun.k8s_utils.verify_gpu_requests_and_limits(
+                requests_gpu=requests_gpu,
+                limits_gpu=limits_gpu,
+            )
     except AttributeError:
         pass
 
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import numpy as np
 import pandas as pd
 import pyarrow
 from pandas.io.json._table_schema import convert_pandas_type_to_json_field
@@ -20,8 +19,7 @@ from pandas.io.json._table_schema import convert_pandas_type_to_json_field
 from mlrun.utils import logger
 
 from .data_types import InferOptions, pa_type_to_value_type, pd_schema_to_value_type
-
-default_num_bins = 20
+from .stats import DFStatsAccumulator
 
 
 def infer_schema_from_df(
@@ -101,43 +99,25 @@ def infer_schema_from_df(
 
 
 def get_df_stats(df, options, num_bins=None, sample_size=None):
-    """get per column data stats from dataframe"""
+    """get per column data stats from dataframe (or from an iterator of dataframe chunks)
+
+    the stats are calculated in a single pass per chunk, a single dataframe stats are exact,
+    the quantiles/histograms of chunked data are estimated from a bounded sample of the values
+    (see :py:class:`~mlrun.data_types.stats.DFStatsAccumulator`).
+    """
+    if not isinstance(df, pd.DataFrame):
+        stats = DFStatsAccumulator(options, num_bins=num_bins)
+        for chunk in df:
+            stats.update(chunk)
+        return stats.to_dict()
 
-    results_dict = {}
     if df.empty:
-        return results_dict
+        return {}
     if sample_size and df.shape[0] > sample_size:
         df = df.sample(sample_size)
 
-    num_bins = num_bins or default_num_bins
-    if InferOptions.get_common_options(options, InferOptions.Index) and df.index.names:
-        df = df.reset_index()
-    for col, values in df.describe(include="all", datetime_is_numeric=True).items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                # boolean values are considered subclass of int
-                if isinstance(val, bool):
-                    stats_dict[stat] = bool(val)
-                else:
-                    stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
-
-        if InferOptions.get_common_options(
-            options, InferOptions.Histogram
-        ) and pd.api.types.is_numeric_dtype(df[col]):
-            # store histogram
-            try:
-                hist, bins = np.histogram(df[col], bins=num_bins)
-                stats_dict["hist"] = [hist.tolist(), bins.tolist()]
-            except Exception:
-                pass
-
-        results_dict[col] = stats_dict
-    return results_dict
+    stats = DFStatsAccumulator(options, num_bins=num_bins, sketch_size=None)
+    return stats.update(df).to_dict()
 
 
 def get_df_preview(df, preview_lines=20):
@@ -0,0 +1,354 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .data_types import InferOptions
+
+default_num_bins = 20
+# max number of values kept per column for the quantiles/histogram when stats are accumulated over chunks
+default_sketch_size = 20000
+quantiles = [0.25, 0.5, 0.75]
+
+
+def to_stat_value(value):
+    """convert a numpy/pandas stat value to a (json serializable) python value"""
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return str(value)
+
+
+class _ValuesSketch:
+    """uniform sample of up to `size` values, which can be updated and merged (size None means keep all)"""
+
+    def __init__(self, size: int = None, dtype=np.float64):
+        self.size = size
+        self.seen = 0
+        self.values = np.empty(0, dtype=dtype)
+
+    @property
+    def is_exact(self):
+        return self.seen == len(self.values)
+
+    def update(self, values: np.ndarray):
+        other = _ValuesSketch(self.size, self.values.dtype)
+        other.seen = len(values)
+        if self.size and len(values) > self.size:
+            values = np.random.choice(values, self.size, replace=False)
+        other.values = values
+        self.merge(other)
+
+    def merge(self, other: "_ValuesSketch"):
+        seen = self.seen + other.seen
+        if not self.size or len(self.values) + len(other.values) <= self.size:
+            values = np.concatenate([self.values, other.values])
+        else:
+            # take from each sample in proportion to the number of values it represents
+            from_self = np.random.binomial(self.size, self.seen / seen)
+            from_self = min(
+                max(from_self, self.size - len(other.values)), len(self.values)
+            )
+            values = np.concatenate(
+                [
+                    np.random.choice(self.values, from_self, replace=False),
+                    np.random.choice(
+                        other.values, self.size - from_self, replace=False
+                    ),
+                ]
+            )
+        self.seen = seen
+        self.values = values
+
+
+class ColumnStats:
+    """single pass, mergeable statistics of a dataframe column
+
+    numeric and datetime columns keep the count, mean, variance (numeric only), min and max and a values
+    sketch used for the quantiles and histogram, other columns keep the values counts (count, unique, top,
+    freq). the results match `DataFrame.describe()` as long as the column has no more than sketch_size values.
+
+    :param kind:        column kind, "numeric", "datetime" or "category"
+    :param num_bins:    number of histogram bins, the histogram is over the [min, max] range of the values
+    :param bins:        fixed histogram bin edges (overrides num_bins), fixed bins histograms are always exact
+    :param sketch_size: max number of values to keep for quantiles/histogram (None for all the values)
+    :param tz:          timezone of a datetime column
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        num_bins: int = None,
+        bins: List[float] = None,
+        sketch_size: int = None,
+        tz=None,
+    ):
+        self.kind = kind
+        self.num_bins = num_bins or default_num_bins
+        self.bins = None if bins is None else np.asarray(bins, dtype=np.float64)
+        self.tz = tz
+        self.count = 0
+        # datetime moments are relative to the first value (to keep the ns precision)
+        self.offset = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.value_counts = {}
+        self.finite_count = 0
+        self.hist_counts = None
+        self.sketch = _ValuesSketch(
+            sketch_size, np.int64 if kind == "datetime" else np.float64
+        )
+
+    @classmethod
+    def from_series(cls, series: pd.Series, **kwargs):
+        """create an empty accumulator matching the series type"""
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            kind = "category"
+        elif pd.api.types.is_numeric_dtype(dtype):
+            kind = "numeric"
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            kind = "datetime"
+            kwargs["tz"] = getattr(dtype, "tz", None)
+        else:
+            kind = "category"
+        return cls(kind, **kwargs)
+
+    def update(self, series: pd.Series):
+        """add the values of a (chunk) series"""
+        series = series.dropna()
+        if self.kind == "category":
+            try:
+                counts = series.value_counts(sort=False)
+            except TypeError:
+                # unhashable values (lists, dicts, ..), only count them
+                self.count += len(series)
+                return
+            self.count += len(series)
+            for value, count in counts.items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + count
+            return
+
+        if self.kind == "datetime":
+            values = series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        else:
+            values = series.to_numpy(dtype=np.float64)
+        if not len(values):
+            return
+
+        other = ColumnStats(self.kind, self.num_bins, self.bins, tz=self.tz)
+        other.count = len(values)
+        if self.kind == "datetime":
+            other.offset = int(self.offset if self.count else values[0])
+            float_values = (values - other.offset).astype(np.float64)
+        else:
+            float_values = values
+        other.mean = float_values.mean()
+        if self.kind == "numeric":
+            other.m2 = float(((float_values - other.mean) ** 2).sum())
+            other.finite_count = int(np.isfinite(values).sum())
+            if self.bins is not None:
+                other.hist_counts = np.histogram(values, bins=self.bins)[0]
+        other.min = values.min()
+        other.max = values.max()
+        other.sketch = None
+        self._merge_moments(other)
+        self.sketch.update(values)
+
+    def merge(self, other: "ColumnStats"):
+        """merge the statistics of another (chunk/partition) accumulator of the same column"""
+        if self.kind == "category" or other.kind == "category":
+            self.count += other.count
+            for value, count in other.value_counts.items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + count
+            return
+        self._merge_moments(other)
+        self.sketch.merge(other.sketch)
+
+    def _merge_moments(self, other: "ColumnStats"):
+        if not other.count:
+            return
+        if not self.count:
+            self.offset = other.offset
+        count = self.count + other.count
+        delta = other.mean + (other.offset - self.offset) - self.mean
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.finite_count += other.finite_count
+        if other.hist_counts is not None:
+            self.hist_counts = (
+                other.hist_counts
+                if self.hist_counts is None
+                else self.hist_counts + other.hist_counts
+            )
+        self.count = count
+
+    def to_dict(self, histogram: bool = True) -> dict:
+        """return the column stats in the `DataFrame.describe()` format (+ hist)"""
+        if self.kind == "category":
+            stats = {"count": self.count}
+            if self.value_counts:
+                top, freq = max(self.value_counts.items(), key=lambda item: item[1])
+                stats.update(unique=len(self.value_counts), top=top, freq=freq)
+            return {key: to_stat_value(value) for key, value in stats.items()}
+
+        if self.kind == "datetime":
+            return self._datetime_stats()
+
+        stats = {"count": float(self.count)}
+        if self.count:
+            stats["mean"] = self.mean
+            if self.count > 1:
+                stats["std"] = np.sqrt(self.m2 / (self.count - 1))
+            stats["min"] = self.min
+            for quantile, value in zip(quantiles, self._quantiles()):
+                stats[f"{quantile:.0%}"] = value
+            stats["max"] = self.max
+        stats = {
+            key: to_stat_value(value)
+            for key, value in stats.items()
+            if not pd.isna(value)
+        }
+        if histogram:
+            hist = self._histogram()
+            if hist:
+                stats["hist"] = hist
+        return stats
+
+    def _quantiles(self):
+        if self.kind == "datetime":
+            values = self.sketch.values - self.offset
+            return np.quantile(values, quantiles) + self.offset
+        return np.quantile(self.sketch.values, quantiles)
+
+    def _datetime_stats(self):
+        def to_timestamp(value):
+            timestamp = pd.Timestamp(int(round(value)))
+            return (
+                timestamp.tz_localize("UTC").tz_convert(self.tz)
+                if self.tz
+                else timestamp
+            )
+
+        stats = {"count": self.count}
+        if self.count:
+            stats["mean"] = to_timestamp(self.mean + self.offset)
+            stats["min"] = to_timestamp(self.min)
+            for quantile, value in zip(quantiles, self._quantiles()):
+                stats[f"{quantile:.0%}"] = to_timestamp(value)
+            stats["max"] = to_timestamp(self.max)
+        return {key: to_stat_value(value) for key, value in stats.items()}
+
+    def _histogram(self):
+        if self.bins is not None:
+            if self.hist_counts is None:
+                self.hist_counts = np.zeros(len(self.bins) - 1, dtype=np.int64)
+            return [self.hist_counts.tolist(), self.bins.tolist()]
+
+        values = self.sketch.values
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return None
+        if self.sketch.is_exact:
+            hist, bins = np.histogram(values, bins=self.num_bins)
+        else:
+            # scale the sample histogram to the number of values in the column
+            value_range = (
+                (self.min, self.max)
+                if np.isfinite(self.min) and np.isfinite(self.max)
+                else None
+            )
+            hist, bins = np.histogram(values, bins=self.num_bins, range=value_range)
+            hist = np.rint(hist * self.finite_count / len(values)).astype(np.int64)
+        return [hist.tolist(), bins.tolist()]
+
+
+class DFStatsAccumulator:
+    """single pass, mergeable per column statistics of a dataframe
+
+    accumulate statistics over dataframe chunks (e.g. of a dataset larger than memory) with `update()`,
+    and/or over partitions/columns processed in parallel with `merge()`, the result (`to_dict()`) is in the
+    same format as `get_df_stats()`.
+
+    example::
+
+        stats = DFStatsAccumulator()
+        for chunk in pd.read_csv(path, chunksize=100000):
+            stats.update(chunk)
+        print(stats.to_dict())
+
+    :param options:     InferOptions, Histogram for histograms, Index to include the index columns
+    :param num_bins:    number of histogram bins
+    :param bins:        dict of column name -> fixed histogram bin edges
+    :param sketch_size: max number of values kept per column for quantiles/histograms (None for all)
+    """
+
+    def __init__(
+        self,
+        options: InferOptions = InferOptions.Histogram,
+        num_bins: int = None,
+        bins: Dict[str, List[float]] = None,
+        sketch_size: int = default_sketch_size,
+    ):
+        self.options = options
+        self.num_bins = num_bins or default_num_bins
+        self.bins = bins or {}
+        self.sketch_size = sketch_size
+        self.columns: Dict[str, ColumnStats] = {}
+
+    def update(self, df: pd.DataFrame):
+        """add the rows of a dataframe (chunk)"""
+        if InferOptions.get_common_options(self.options, InferOptions.Index) and (
+            df.index.names
+        ):
+            df = df.reset_index()
+        for name, series in df.items():
+            if name not in self.columns:
+                self.columns[name] = ColumnStats.from_series(
+                    series,
+                    num_bins=self.num_bins,
+                    bins=self.bins.get(name),
+                    sketch_size=self.sketch_size,
+                )
+            self.columns[name].update(series)
+        return self
+
+    def merge(self, other: "DFStatsAccumulator"):
+        """merge the stats accumulated over another partition (or other columns) of the data"""
+        for name, column in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(column)
+            else:
+                self.columns[name] = column
+        return self
+
+    def to_dict(self) -> dict:
+        """return the per column stats dict"""
+        histogram = bool(
+            InferOptions.get_common_options(self.options, InferOptions.Histogram)
+        )
+        return {
+            name: column.to_dict(histogram=histogram)
+            for name, column in self.columns.items()
+        }
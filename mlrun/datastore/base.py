@@ -11,9 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import concurrent.futures
+import operator
 import sys
 import tempfile
 from base64 import b64encode
+from contextlib import contextmanager
 from os import path, remove
 
 import dask.dataframe as dd
@@ -22,11 +26,14 @@ import orjson
 import pandas as pd
 import requests
 import urllib3
+from pandas.api.types import is_datetime64_any_dtype
 
 import mlrun.errors
 from mlrun.errors import err_to_str
 from mlrun.utils import is_ipython, logger
 
+from .local_cache import get_local_cache
+
 verify_ssl = False
 if not verify_ssl:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -135,6 +142,16 @@ class DataStore:
     def upload(self, key, src_path):
         pass
 
+    def iter_chunks(self, key, chunk_size=None):
+        """iterate over the object content in chunks of bytes, stores which support streaming
+        reads override it to avoid reading the whole object into memory"""
+        chunk_size = chunk_size or int(mlrun.mlconf.datastore.transfer.chunk_size)
+        data = self.get(key)
+        if isinstance(data, str):
+            data = data.encode()
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset : offset + chunk_size]
+
     def as_df(
         self,
         url,
@@ -157,24 +174,17 @@ class DataStore:
                 if filesystem.isdir(url):
 
                     def reader(*args, **kwargs):
+                        # read the files in parallel, the projection (usecols) and dtype
+                        # kwargs are shared by all the files
                         base_path = args[0]
-                        file_entries = filesystem.listdir(base_path)
-                        filenames = []
-                        for file_entry in file_entries:
-                            if (
-                                file_entry["name"].endswith(".csv")
-                                and file_entry["size"] > 0
-                                and file_entry["type"] == "file"
-                            ):
-                                filename = file_entry["name"]
-                                filename = filename.split("/")[-1]
-                                filenames.append(filename)
-                        dfs = []
-                        for filename in filenames:
-                            updated_args = [f"{base_path}/{filename}"]
-                            updated_args.extend(args[1:])
-                            dfs.append(df_module.read_csv(*updated_args, **kwargs))
-                        return pd.concat(dfs)
+                        file_paths = _list_data_files(filesystem, base_path, [".csv"])
+                        dfs = _iter_parallel(
+                            lambda file_path: df_module.read_csv(
+                                file_path, *args[1:], **kwargs
+                            ),
+                            file_paths,
+                        )
+                        return pd.concat(list(dfs))
 
         elif url.endswith(".parquet") or url.endswith(".pq") or format == "parquet":
             if columns:
@@ -182,29 +192,9 @@ class DataStore:
 
             def reader(*args, **kwargs):
                 if start_time or end_time:
-                    if sys.version_info < (3, 7):
-                        raise ValueError(
-                            f"feature not supported for python version {sys.version_info}"
-                        )
-
-                    if time_column is None:
-                        raise mlrun.errors.MLRunInvalidArgumentError(
-                            "When providing start_time or end_time, must provide time_column"
-                        )
-
-                    from storey.utils import find_filters, find_partitions
-
-                    filters = []
-                    partitions_time_attributes = find_partitions(url, file_system)
-
-                    find_filters(
-                        partitions_time_attributes,
-                        start_time,
-                        end_time,
-                        filters,
-                        time_column,
+                    kwargs["filters"] = _get_time_filters(
+                        url, file_system, start_time, end_time, time_column
                     )
-                    kwargs["filters"] = filters
 
                 return df_module.read_parquet(*args, **kwargs)
 
@@ -232,12 +222,167 @@ class DataStore:
 
                 return reader(file, **kwargs)
 
+        local_cache = get_local_cache()
+        if local_cache:
+            cached_path = local_cache.get_local_path(self, self._join(subpath), url)
+            if cached_path:
+                return reader(cached_path, **kwargs)
+
         temp_file = tempfile.NamedTemporaryFile(delete=False)
         self.download(self._join(subpath), temp_file.name)
         df = reader(temp_file.name, **kwargs)
         remove(temp_file.name)
         return df
 
+    def as_df_iter(
+        self,
+        url,
+        subpath,
+        columns=None,
+        df_module=None,
+        format="",
+        chunksize=None,
+        filters=None,
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        **kwargs,
+    ):
+        """iterate over dataframes read from the url without materializing the whole table
+
+        without chunksize, a dataframe is yielded per data file (the files of a directory are read
+        in parallel with a bounded read ahead). with chunksize, CSV and JSON lines files are read in
+        chunks of up to chunksize rows and parquet files are read in record batches (per row group).
+        filters use the pyarrow DNF format (e.g. [("age", ">", 30)]), they are pushed down to the
+        parquet reader (skipping row groups/partitions) and applied on the chunks of other formats.
+        start_time/end_time select the rows with start_time < time_column <= end_time.
+        """
+        format = _get_data_format(url, format)
+        filters = _normalize_filters(filters)
+        if format == "parquet":
+            if start_time or end_time:
+                time_filters = _get_time_filters(
+                    url, self.get_filesystem(), start_time, end_time, time_column
+                )
+                filters = [
+                    user_filter + time_filter
+                    for user_filter in filters or [[]]
+                    for time_filter in time_filters
+                ]
+            yield from self._iter_parquet(url, subpath, columns, chunksize, filters)
+            return
+
+        if start_time or end_time:
+            if time_column is None:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "When providing start_time or end_time, must provide time_column"
+                )
+            time_filter = []
+            if start_time:
+                time_filter.append((time_column, ">", pd.Timestamp(start_time)))
+            if end_time:
+                time_filter.append((time_column, "<=", pd.Timestamp(end_time)))
+            filters = [user_filter + time_filter for user_filter in filters or [[]]]
+
+        df_module = df_module or pd
+        if columns and format == "csv":
+            # the filtered columns are read as well, and dropped after filtering
+            filter_columns = [
+                column
+                for conjunction in filters or []
+                for column, _, _ in conjunction
+                if column not in columns
+            ]
+            kwargs["usecols"] = list(columns) + list(dict.fromkeys(filter_columns))
+        if chunksize:
+            kwargs["chunksize"] = chunksize
+            if format == "json":
+                # pandas reads json in chunks only for json lines
+                kwargs["lines"] = True
+        reader = df_module.read_csv if format == "csv" else df_module.read_json
+
+        def read_file(file_url):
+            with self._open_for_read(file_url, subpath) as file:
+                return _filter_df(reader(file, **kwargs), filters, columns)
+
+        file_system = self.get_filesystem()
+        if file_system and self.supports_isdir() and file_system.isdir(url):
+            suffixes = [".csv"] if format == "csv" else [".json"]
+            file_urls = _list_data_files(file_system, url.rstrip("/"), suffixes)
+        else:
+            file_urls = [url]
+
+        if chunksize:
+            for file_url in file_urls:
+                with self._open_for_read(file_url, subpath) as file:
+                    for chunk in reader(file, **kwargs):
+                        chunk = _filter_df(chunk, filters, columns)
+                        if not chunk.empty:
+                            yield chunk
+        else:
+            yield from _iter_parallel(read_file, file_urls)
+
+    def _iter_parquet(self, url, subpath, columns, chunksize, filters):
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        expression = pq.filters_to_expression(filters) if filters else None
+        file_system = self.get_filesystem()
+        temp_file = None
+        if file_system:
+            dataset = ds.dataset(
+                file_system._strip_protocol(url),
+                format="parquet",
+                filesystem=file_system,
+                partitioning="hive",
+            )
+        else:
+            temp_file = tempfile.NamedTemporaryFile(suffix=".parquet", delete=False)
+            self.download(self._join(subpath), temp_file.name)
+            dataset = ds.dataset(temp_file.name, format="parquet")
+
+        try:
+            if chunksize:
+                for batch in dataset.to_batches(
+                    columns=columns, filter=expression, batch_size=chunksize
+                ):
+                    yield batch.to_pandas()
+            else:
+                for fragment in dataset.get_fragments(filter=expression):
+                    yield fragment.to_table(
+                        columns=columns, filter=expression, schema=dataset.schema
+                    ).to_pandas()
+        finally:
+            if temp_file:
+                remove(temp_file.name)
+
+    @contextmanager
+    def _open_for_read(self, url, subpath):
+        file_system = self.get_filesystem()
+        if file_system:
+            with file_system.open(url, "rb") as file:
+                yield file
+            return
+
+        local_cache = get_local_cache()
+        cached_path = (
+            local_cache.get_local_path(self, self._join(subpath), url)
+            if local_cache
+            else None
+        )
+        if cached_path:
+            with open(cached_path, "rb") as file:
+                yield file
+            return
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            self.download(self._join(subpath), temp_file.name)
+            with open(temp_file.name, "rb") as file:
+                yield file
+        finally:
+            remove(temp_file.name)
+
     def to_dict(self):
         return {
             "name": self.name,
@@ -250,6 +395,144 @@ class DataStore:
         self.get_filesystem().rm(path=path, recursive=recursive, maxdepth=maxdepth)
 
 
+def _get_data_format(url, format=""):
+    if url.endswith(".csv") or format == "csv":
+        return "csv"
+    if url.endswith(".parquet") or url.endswith(".pq") or format == "parquet":
+        return "parquet"
+    if url.endswith(".json") or format == "json":
+        return "json"
+    raise mlrun.errors.MLRunInvalidArgumentError(f"file type unhandled {url}")
+
+
+def _get_time_filters(url, file_system, start_time, end_time, time_column):
+    """build (DNF) parquet filters selecting the partitions and rows in the time range"""
+    if sys.version_info < (3, 7):
+        raise ValueError(f"feature not supported for python version {sys.version_info}")
+
+    if time_column is None:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            "When providing start_time or end_time, must provide time_column"
+        )
+
+    from storey.utils import find_filters, find_partitions
+
+    filters = []
+    partitions_time_attributes = find_partitions(url, file_system)
+
+    find_filters(
+        partitions_time_attributes,
+        start_time,
+        end_time,
+        filters,
+        time_column,
+    )
+    return filters
+
+
+def _normalize_filters(filters):
+    """return the filters as a list of AND-ed lists of (column, op, value) tuples (DNF), a single
+    list of predicates is a single conjunction, predicates can be tuples or lists"""
+    if not filters:
+        return filters
+
+    def is_predicate(item):
+        return (
+            isinstance(item, (tuple, list))
+            and len(item) == 3
+            and isinstance(item[0], str)
+            and isinstance(item[1], str)
+        )
+
+    if is_predicate(filters[0]):
+        filters = [filters]
+    normalized = []
+    for conjunction in filters:
+        if not isinstance(conjunction, (tuple, list)) or not all(
+            is_predicate(predicate) for predicate in conjunction
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"filters must be a list of (column, op, value) predicates, or a list of such lists,"
+                f" got {filters}"
+            )
+        normalized.append([tuple(predicate) for predicate in conjunction])
+    return normalized
+
+
+_filter_operators = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, value: series.isin(value),
+    "not in": lambda series, value: ~series.isin(value),
+}
+
+
+def _filter_df(df, filters, columns=None):
+    """apply (DNF) filters, a list of AND-ed (column, op, value) lists which are OR-ed, on a dataframe"""
+    if filters:
+        mask = None
+        for conjunction in filters:
+            conjunction_mask = pd.Series(True, index=df.index)
+            for column, op, value in conjunction:
+                if op not in _filter_operators:
+                    raise mlrun.errors.MLRunInvalidArgumentError(
+                        f"unsupported filter operator {op}"
+                    )
+                series = df[column]
+                if isinstance(value, pd.Timestamp) and not is_datetime64_any_dtype(
+                    series
+                ):
+                    # time columns are read as strings from CSV/JSON
+                    series = pd.to_datetime(series)
+                conjunction_mask &= _filter_operators[op](series, value)
+            mask = conjunction_mask if mask is None else mask | conjunction_mask
+        df = df[mask]
+    if columns:
+        # filters may use columns which are not selected
+        df = df[[column for column in columns if column in df.columns]]
+    return df
+
+
+def _list_data_files(filesystem, base_path, suffixes):
+    """list the (non empty) data files with the given suffixes in a directory"""
+    file_paths = []
+    for file_entry in sorted(filesystem.listdir(base_path), key=lambda e: e["name"]):
+        if (
+            any(file_entry["name"].endswith(suffix) for suffix in suffixes)
+            and file_entry["size"] > 0
+            and file_entry["type"] == "file"
+        ):
+            filename = file_entry["name"].split("/")[-1]
+            file_paths.append(f"{base_path}/{filename}")
+    return file_paths
+
+
+def _iter_parallel(func, items, max_workers=None):
+    """yield func(item) for each item (in order), running up to max_workers calls in parallel threads"""
+    max_workers = min(
+        len(items), max_workers or int(mlrun.mlconf.datastore.transfer.max_concurrency)
+    )
+    if max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = collections.deque()
+        for item in items:
+            # bound the read ahead so only max_workers results are held in memory
+            if len(futures) >= max_workers:
+                yield futures.popleft().result()
+            futures.append(executor.submit(func, item))
+        while futures:
+            yield futures.popleft().result()
+
+
 class DataItem:
     """Data input/output class abstracting access to various local/remote data sources
 
@@ -366,6 +649,19 @@ class DataItem:
         """
         self._store.upload(self._path, src_path)
 
+    def iter_chunks(self, chunk_size=None):
+        """iterate over the content in chunks of bytes (streaming), without loading it all into memory
+
+        example::
+
+            with open("model.pkl", "wb") as fp:
+                for chunk in data_item.iter_chunks(chunk_size=4 * 1024 * 1024):
+                    fp.write(chunk)
+
+        :param chunk_size: chunk size in bytes (default to mlrun.mlconf.datastore.transfer.chunk_size)
+        """
+        return self._store.iter_chunks(self._path, chunk_size=chunk_size)
+
     def stat(self):
         """return FileStats class (size, modified, content_type)"""
         return self._store.stat(self._path)
@@ -393,6 +689,13 @@ class DataItem:
         suffix = "" if dot == -1 else self._path[dot:]
         temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
         self._local_path = temp_file.name
+        local_cache = get_local_cache()
+        # the cached file is shared with other processes, the caller gets its own copy
+        if local_cache and local_cache.copy_to(
+            self._store, self._path, self.url, self._local_path, suffix
+        ):
+            return self._local_path
+
         logger.info(f"downloading {self.url} to local temp file")
         self.download(self._local_path)
         return self._local_path
@@ -419,6 +722,57 @@ class DataItem:
             **kwargs,
         )
 
+    def as_df_iter(
+        self,
+        columns=None,
+        df_module=None,
+        format="",
+        chunksize=None,
+        filters=None,
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        **kwargs,
+    ):
+        """iterate over dataframes generated from the dataitem, without loading the whole table
+        into memory
+
+        without chunksize a dataframe is returned per data file when the dataitem is a directory
+        (the files are read in parallel). with chunksize, CSV and JSON lines are read in chunks of
+        up to chunksize rows, and parquet in record batches (row groups)
+
+        example::
+
+            for df in mlrun.get_dataitem("s3://bucket/data.parquet").as_df_iter(
+                chunksize=100000, columns=["id", "amount"], filters=[("amount", ">", 100)]
+            ):
+                process(df)
+
+        :param columns:     optional, list of columns to select
+        :param df_module:   optional, py module used to read CSV/JSON (e.g. pd, cudf, ..)
+        :param format:      file format, if not specified it will be deducted from the suffix
+        :param chunksize:   optional, max number of rows per dataframe
+        :param filters:     optional, row filters in pyarrow DNF format, e.g. [("age", ">", 30)],
+                            pushed down to the reader for parquet (partitions/row groups are skipped)
+        :param start_time:  optional, select the rows with time_column > start_time
+        :param end_time:    optional, select the rows with time_column <= end_time
+        :param time_column: the time column used by start_time/end_time (required with them)
+        :param kwargs:      extra reader args
+        """
+        return self._store.as_df_iter(
+            self._url,
+            self._path,
+            columns=columns,
+            df_module=df_module,
+            format=format,
+            chunksize=chunksize,
+            filters=filters,
+            start_time=start_time,
+            end_time=end_time,
+            time_column=time_column,
+            **kwargs,
+        )
+
     def show(self, format=None):
         """show the data object content in Jupyter
 
@@ -61,6 +61,15 @@ class FileStore(DataStore):
                 size = -1
             return fp.read(size)
 
+    def iter_chunks(self, key, chunk_size=None):
+        chunk_size = chunk_size or int(mlrun.mlconf.datastore.transfer.chunk_size)
+        with open(self._join(key), "rb") as fp:
+            while True:
+                chunk = fp.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
     def put(self, key, data, append=False):
         dir_to_create = path.dirname(self._join(key))
         if dir_to_create:
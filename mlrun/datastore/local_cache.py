@@ -0,0 +1,165 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from os import path
+
+import mlrun
+from mlrun.errors import err_to_str
+from mlrun.utils import logger
+
+
+class LocalFileCache:
+    """on-disk, size bounded (LRU) cache of remote objects
+
+    objects are keyed by their url and their stat (size + modification time), so a modified object
+    is downloaded again. the cache directory can be shared by multiple processes (e.g. runs in the
+    same pod/node), files are written to a temp file and atomically renamed into the cache.
+    the least recently used files are evicted once the cache size exceeds max_size (in bytes).
+    """
+
+    def __init__(self, cache_path: str, max_size: int):
+        self.cache_path = cache_path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        """return the cache hit/miss statistics (of the current process)"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def get_local_path(self, store, key: str, url: str, suffix: str = ""):
+        """return a local (cached) path of the object, download it on cache miss
+
+        the returned file is shared by all the cache users (processes) and must only be read, use
+        copy_to() for a private copy. return None when the object cannot be cached (no stat information)
+        """
+        cache_key = self._cache_key(store, key, url)
+        if not cache_key:
+            return None
+        os.makedirs(self.cache_path, exist_ok=True)
+        cached_path = path.join(self.cache_path, cache_key + suffix)
+        if path.isfile(cached_path):
+            with self._lock:
+                self.hits += 1
+            # update the access time used for the LRU eviction
+            os.utime(cached_path)
+            logger.debug("Local cache hit", url=url, path=cached_path)
+            return cached_path
+
+        with self._lock:
+            self.misses += 1
+        logger.info(f"downloading {url} to local cache")
+        temp_path = path.join(self.cache_path, f".{cache_key}.{uuid.uuid4().hex}.tmp")
+        try:
+            store.download(key, temp_path)
+            os.replace(temp_path, cached_path)
+        finally:
+            if path.exists(temp_path):
+                os.remove(temp_path)
+        self._evict(keep=cached_path)
+        return cached_path
+
+    def copy_to(self, store, key: str, url: str, target_path: str, suffix: str = ""):
+        """copy the (cached) object to target_path, a private copy which the caller can change or delete
+
+        return False when the object cannot be cached (no stat information)
+        """
+        for _ in range(2):
+            cached_path = self.get_local_path(store, key, url, suffix)
+            if not cached_path:
+                return False
+            try:
+                shutil.copyfile(cached_path, target_path)
+                return True
+            except FileNotFoundError:
+                # evicted by another process right after it was returned, download it again
+                logger.debug("Cached file was evicted, retrying", url=url)
+        return False
+
+    @staticmethod
+    def _cache_key(store, key: str, url: str):
+        try:
+            stats = store.stat(key)
+        except Exception as exc:
+            logger.debug(
+                "Cannot stat object, skipping cache", url=url, exc=err_to_str(exc)
+            )
+            return None
+        if not stats or stats.modified is None:
+            return None
+        return hashlib.sha256(
+            f"{url}:{stats.size}:{stats.modified}".encode()
+        ).hexdigest()
+
+    def _evict(self, keep: str = None):
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_path):
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            try:
+                entry_stat = entry.stat()
+            except FileNotFoundError:
+                # evicted by another process
+                continue
+            entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+            total_size += entry_stat.st_size
+
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                continue
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+
+
+_local_cache = None
+
+
+def get_local_cache():
+    """return the local file cache, or None when disabled (mlconf.datastore.local_cache.mode)"""
+    global _local_cache
+    cache_config = mlrun.mlconf.datastore.local_cache
+    if cache_config.mode != "enabled":
+        return None
+    cache_path = cache_config.path or path.join(
+        tempfile.gettempdir(), "mlrun-datastore-cache"
+    )
+    max_size = int(cache_config.max_size)
+    if (
+        _local_cache is None
+        or _local_cache.cache_path != cache_path
+        or _local_cache.max_size != max_size
+    ):
+        _local_cache = LocalFileCache(cache_path, max_size)
+    return _local_cache
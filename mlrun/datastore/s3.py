@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import time
+from io import BytesIO
 
 import boto3
 import fsspec
+from boto3.s3.transfer import TransferConfig
 
 import mlrun.errors
 
@@ -137,16 +139,54 @@ class S3Store(DataStore):
 
         return storage_options
 
+    @staticmethod
+    def _transfer_config():
+        # objects larger than the part size are transferred using concurrent ranged gets / multipart uploads
+        transfer = mlrun.mlconf.datastore.transfer
+        part_size = int(transfer.part_size)
+        return TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=int(transfer.max_concurrency),
+        )
+
     def upload(self, key, src_path):
-        self.s3.Object(self.endpoint, self._join(key)[1:]).put(
-            Body=open(src_path, "rb")
+        self.s3.meta.client.upload_file(
+            src_path,
+            self.endpoint,
+            self._join(key)[1:],
+            Config=self._transfer_config(),
+        )
+
+    def download(self, key, target_path):
+        self.s3.meta.client.download_file(
+            self.endpoint,
+            self._join(key)[1:],
+            target_path,
+            Config=self._transfer_config(),
         )
 
     def get(self, key, size=None, offset=0):
-        obj = self.s3.Object(self.endpoint, self._join(key)[1:])
         if size or offset:
+            obj = self.s3.Object(self.endpoint, self._join(key)[1:])
             return obj.get(Range=get_range(size, offset))["Body"].read()
-        return obj.get()["Body"].read()
+        buffer = BytesIO()
+        self.s3.meta.client.download_fileobj(
+            self.endpoint,
+            self._join(key)[1:],
+            buffer,
+            Config=self._transfer_config(),
+        )
+        return buffer.getvalue()
+
+    def iter_chunks(self, key, chunk_size=None):
+        chunk_size = chunk_size or int(mlrun.mlconf.datastore.transfer.chunk_size)
+        obj = self.s3.Object(self.endpoint, self._join(key)[1:])
+        body = obj.get()["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
 
     def put(self, key, data, append=False):
         self.s3.Object(self.endpoint, self._join(key)[1:]).put(Body=data)
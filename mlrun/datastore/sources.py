@@ -32,7 +32,12 @@ from ..config import config
 from ..model import DataSource
 from ..platforms.iguazio import parse_path
 from ..utils import get_class
-from .utils import store_path_to_spark
+from .utils import (
+    get_sql_engine,
+    read_sql_chunks,
+    sql_select_query,
+    store_path_to_spark,
+)
 
 
 def get_source_from_dict(source):
@@ -928,27 +933,47 @@ class SQLSource(BaseSourceDriver):
             end_time=end_time,
         )
 
-    def to_dataframe(self):
+    def to_dataframe(self, columns=None):
+        """read the table as a dataframe (or an iterator of dataframes when chunksize is set)
+
+        the start_time/end_time range (start_time < time_field <= end_time) and the column selection
+        are pushed down to the database query, unless a custom query attribute is set.
+
+        :param columns: list of columns to select (default all the columns)
+        """
         import sqlalchemy as db
 
         query = self.attributes.get("query", None)
         db_path = self.attributes.get("db_path")
         table_name = self.attributes.get("table_name")
-        if not query:
-            query = f"SELECT * FROM {table_name}"
-        if table_name and db_path:
-            engine = db.create_engine(db_path)
-            with engine.connect() as con:
-                return pd.read_sql(
-                    query,
-                    con=con,
-                    chunksize=self.attributes.get("chunksize"),
-                    parse_dates=self.attributes.get("time_fields"),
-                )
-        else:
+        if not (table_name and db_path):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "table_name and db_name args must be specified"
             )
+        parse_dates = self.attributes.get("time_fields")
+        if query:
+            query = db.text(query)
+        else:
+            if parse_dates and columns:
+                parse_dates = [name for name in parse_dates if name in columns]
+            query = sql_select_query(
+                table_name,
+                columns=columns,
+                time_filter={
+                    "column": self.time_field,
+                    "start": self.start_time,
+                    "end": self.end_time,
+                    "include_start": False,
+                    "include_end": True,
+                },
+            )
+
+        engine = get_sql_engine(db_path)
+        chunksize = self.attributes.get("chunksize")
+        if chunksize:
+            return read_sql_chunks(engine, query, chunksize, parse_dates=parse_dates)
+        with engine.connect() as con:
+            return pd.read_sql(query, con=con, parse_dates=parse_dates)
 
     def to_step(self, key_field=None, time_field=None, context=None):
         import storey
@@ -34,7 +34,13 @@ from mlrun.utils.v3io_clients import get_frames_client
 from .. import errors
 from ..data_types import ValueType
 from ..platforms.iguazio import parse_path, split_path
-from .utils import parse_kafka_url, store_path_to_spark
+from .utils import (
+    get_sql_engine,
+    parse_kafka_url,
+    read_sql_chunks,
+    sql_select_query,
+    store_path_to_spark,
+)
 
 
 class TargetTypes:
@@ -1500,10 +1506,11 @@ class SQLTarget(BaseStoreTarget):
         :param schema:                      the schema of the table (must pass when
                                             create_table=True)
         :param primary_key_column:          the primary key of the table (must pass always)
-        :param if_exists:                   {'fail', 'replace', 'append'}, default 'append'
+        :param if_exists:                   {'fail', 'replace', 'append', 'upsert'}, default 'append'
                                             - fail: If table exists, do nothing.
                                             - replace: If table exists, drop it, recreate it, and insert data.
                                             - append: If table exists, insert data. Create if does not exist.
+                                            - upsert: Insert data, update the existing rows by the primary key.
         :param create_table:                pass True if you want to create new table named by
                                             table_name with schema on current database.
         :param create_according_to_data:    (not valid)
@@ -1608,23 +1615,70 @@ class SQLTarget(BaseStoreTarget):
         time_column=None,
         **kwargs,
     ):
-        db_path, table_name, _, _, _, _ = self._parse_url()
-        engine = sqlalchemy.create_engine(db_path)
-        with engine.connect() as conn:
-            df = pd.read_sql(
-                f"SELECT * FROM {self.attributes.get('table_name')}",
-                con=conn,
-                parse_dates=self.attributes.get("time_fields"),
-            )
-            if self._primary_key_column:
-                df.set_index(self._primary_key_column, inplace=True)
+        """return the target data as dataframe
+
+        only the requested columns (and the primary key) are read, and the start_time/end_time range
+        is filtered by the database (start_time <= time_column < end_time).
+        pass `chunksize` to stream the data as an iterator of dataframes.
+        """
+        db_path, table_name, _, _, primary_key, _ = self._parse_url()
+        primary_keys = self._get_primary_keys(primary_key)
+        select_columns = None
+        if columns:
+            select_columns = list(dict.fromkeys(primary_keys + list(columns)))
+        query = sql_select_query(
+            table_name,
+            columns=select_columns,
+            time_filter={
+                "column": time_column,
+                "start": start_time,
+                "end": end_time,
+            },
+        )
+        parse_dates = self.attributes.get("time_fields")
+        if parse_dates and select_columns:
+            parse_dates = [name for name in parse_dates if name in select_columns]
+
+        def _prepare_df(df):
+            if primary_keys:
+                df.set_index(primary_keys, inplace=True)
             if columns:
-                df = df[columns]
-        return df
+                df = df[[name for name in columns if name not in primary_keys]]
+            return df
+
+        engine = get_sql_engine(db_path)
+        chunksize = kwargs.get("chunksize")
+        if chunksize:
+            return (
+                _prepare_df(df)
+                for df in read_sql_chunks(
+                    engine, query, chunksize, parse_dates=parse_dates
+                )
+            )
+        with engine.connect() as conn:
+            df = pd.read_sql(query, con=conn, parse_dates=parse_dates)
+        return _prepare_df(df)
+
+    @staticmethod
+    def _get_primary_keys(primary_key) -> list:
+        if not primary_key:
+            return []
+        try:
+            primary_key = ast.literal_eval(primary_key)
+        except Exception:
+            pass
+        return list(primary_key) if isinstance(primary_key, list) else [primary_key]
 
     def write_dataframe(
         self, df, key_column=None, timestamp_key=None, chunk_id=0, **kwargs
     ):
+        """write the dataframe rows to the table
+
+        with if_exists="append" the rows are inserted in batches (executemany), with "upsert" rows are
+        inserted or updated by the primary key (using the dialect native upsert when available), other
+        modes are written by pandas `to_sql`. the batch size can be set with the `batch_size` kwarg
+        (default: mlconf.sql.write_batch_size).
+        """
         self._create_sql_table()
 
         if hasattr(df, "rdd"):
@@ -1639,14 +1693,95 @@ class SQLTarget(BaseStoreTarget):
                 _,
             ) = self._parse_url()
             create_according_to_data = bool(create_according_to_data)
-            engine = sqlalchemy.create_engine(
-                db_path,
+            batch_size = int(
+                kwargs.get("batch_size") or mlrun.mlconf.sql.write_batch_size
             )
-            connection = engine.connect()
+            engine = get_sql_engine(db_path)
             if create_according_to_data:
                 # todo : create according to first row.
                 pass
-            df.to_sql(table_name, connection, if_exists=if_exists)
+            if if_exists not in ["append", "upsert"]:
+                with engine.connect() as connection:
+                    df.to_sql(
+                        table_name,
+                        connection,
+                        if_exists=if_exists,
+                        chunksize=batch_size,
+                    )
+                return
+
+            if any(name is not None for name in df.index.names):
+                df = df.reset_index()
+            # convert to native python objects and NaN/NaT to NULL
+            df = df.astype(object).where(pd.notnull(df), None)
+            records = df.to_dict("records")
+            with engine.connect() as connection:
+                table = sqlalchemy.Table(
+                    table_name, sqlalchemy.MetaData(), autoload_with=connection
+                )
+                if if_exists == "upsert":
+                    primary_keys = self._get_primary_keys(primary_key) or [
+                        column.name for column in table.primary_key.columns
+                    ]
+                    if not primary_keys:
+                        raise mlrun.errors.MLRunInvalidArgumentError(
+                            f"upsert requires a primary key, table {table_name} has none"
+                        )
+                for start in range(0, len(records), batch_size):
+                    batch = records[start : start + batch_size]
+                    with connection.begin():
+                        if if_exists == "upsert":
+                            self._upsert_batch(connection, table, primary_keys, batch)
+                        else:
+                            connection.execute(table.insert(), batch)
+
+    @staticmethod
+    def _upsert_batch(connection, table, primary_keys, records):
+        dialect = connection.dialect.name
+        if dialect in ["postgresql", "sqlite"]:
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            statement = insert(table)
+            update_columns = {
+                name: statement.excluded[name]
+                for name in records[0].keys()
+                if name not in primary_keys
+            }
+            if update_columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=primary_keys, set_=update_columns
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(
+                    index_elements=primary_keys
+                )
+            connection.execute(statement, records)
+        elif dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(table)
+            update_columns = {
+                name: statement.inserted[name]
+                for name in records[0].keys()
+                if name not in primary_keys
+            } or {name: statement.inserted[name] for name in primary_keys}
+            connection.execute(
+                statement.on_duplicate_key_update(update_columns), records
+            )
+        else:
+            # no native upsert, replace the existing rows in the same transaction
+            keys = [tuple(record[name] for name in primary_keys) for record in records]
+            connection.execute(
+                table.delete().where(
+                    sqlalchemy.tuple_(*[table.c[name] for name in primary_keys]).in_(
+                        keys
+                    )
+                )
+            )
+            connection.execute(table.insert(), records)
 
     def _parse_url(self):
         path = self.path[len("mlrunSql:///") :]
@@ -1669,7 +1804,7 @@ class SQLTarget(BaseStoreTarget):
             primary_key_for_check = primary_key
         except Exception:
             primary_key_for_check = [primary_key]
-        engine = sqlalchemy.create_engine(db_path)
+        engine = get_sql_engine(db_path)
         with engine.connect() as conn:
             metadata = sqlalchemy.MetaData()
             table_exists = engine.dialect.has_table(conn, table_name)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
 from urllib.parse import urlparse
 
 
@@ -44,3 +45,91 @@ def parse_kafka_url(url, bootstrap_servers=None):
     topic = url.path
     topic = topic.lstrip("/")
     return topic, bootstrap_servers
+
+
+_sql_engines = {}
+_sql_engines_lock = threading.Lock()
+
+
+def get_sql_engine(db_path: str):
+    """return a pooled sqlalchemy engine for the db url, engines are created once per db url"""
+    engine = _sql_engines.get(db_path)
+    if engine is None:
+        import sqlalchemy
+
+        with _sql_engines_lock:
+            engine = _sql_engines.get(db_path)
+            if engine is None:
+                engine = sqlalchemy.create_engine(db_path, pool_pre_ping=True)
+                _sql_engines[db_path] = engine
+    return engine
+
+
+def sql_select_query(table_name: str, columns: list = None, time_filter: dict = None):
+    """build a SELECT statement over the table, projecting only the requested columns
+
+    :param table_name:   table name, can be prefixed with the schema (`schema.table`)
+    :param columns:      list of columns to select (default all the columns)
+    :param time_filter:  dict with the time `column`, and the optional `start`/`end` range values and
+                         `include_start`/`include_end` flags (default start <= column < end), the range
+                         is ignored (with a warning) when there is no time column
+    """
+    import sqlalchemy
+
+    schema = None
+    if "." in table_name:
+        schema, table_name = table_name.split(".", 1)
+    table = sqlalchemy.table(table_name, schema=schema)
+    if columns:
+        query = sqlalchemy.select(*[sqlalchemy.column(name) for name in columns])
+    else:
+        query = sqlalchemy.select(sqlalchemy.literal_column("*"))
+    query = query.select_from(table)
+
+    time_filter = time_filter or {}
+    time_column = time_filter.get("column")
+    start, end = time_filter.get("start"), time_filter.get("end")
+    if start is None and end is None:
+        return query
+    if not time_column:
+        from mlrun.utils import logger
+
+        logger.warning(
+            "start_time/end_time are ignored, no time column was provided",
+            start_time=start,
+            end_time=end,
+        )
+        return query
+
+    time_column = sqlalchemy.column(time_column, sqlalchemy.DateTime)
+    start, end = _to_datetime(start), _to_datetime(end)
+    if start is not None:
+        query = query.where(
+            time_column >= start
+            if time_filter.get("include_start", True)
+            else time_column > start
+        )
+    if end is not None:
+        query = query.where(
+            time_column <= end
+            if time_filter.get("include_end", False)
+            else time_column < end
+        )
+    return query
+
+
+def read_sql_chunks(engine, query, chunksize: int, **kwargs):
+    """read the query results as a stream of dataframes, keeping the connection open while iterating"""
+    import pandas as pd
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+        yield from pd.read_sql(query, con=conn, chunksize=chunksize, **kwargs)
+
+
+def _to_datetime(value):
+    if isinstance(value, str):
+        import pandas as pd
+
+        return pd.Timestamp(value).to_pydatetime()
+    return value
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import codecs
 import enum
 import http
 import tempfile
@@ -146,6 +147,7 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        stream=False,
     ):
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -163,6 +165,7 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param stream: Don't read the response content up front, for iterating over it as it arrives
 
         :return: Python HTTP response object
         """
@@ -215,7 +218,7 @@ class HTTPRunDB(RunDBInterface):
 
         try:
             response = self.session.request(
-                method, url, timeout=timeout, verify=False, **kw
+                method, url, timeout=timeout, verify=False, stream=stream, **kw
             )
         except requests.RequestException as exc:
             error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
@@ -447,8 +450,10 @@ class HTTPRunDB(RunDBInterface):
 
     def watch_log(self, uid, project="", watch=True, offset=0):
         """Retrieve logs of a running process, and watch the progress of the execution until it completes. This
-        method will print out the logs and continue to periodically poll for, and print, new logs as long as the
+        method will print out the logs and continue to follow, and print, new logs as long as the
         state of the runtime which generates this log is either ``pending`` or ``running``.
+        The new logs are streamed by the API as they are written, for API versions that don't support following
+        the logs they are periodically polled.
 
         :param uid: The uid of the log object to watch.
         :param project: Project that the log belongs to.
@@ -461,6 +466,12 @@ class HTTPRunDB(RunDBInterface):
         state, text = self.get_log(uid, project, offset=offset)
         if text:
             print(text.decode(errors=mlrun.mlconf.httpdb.logs.decode.errors))
+        if watch and state in ["pending", "running"]:
+            try:
+                return self._follow_log(uid, project, offset + len(text))
+            except mlrun.errors.MLRunNotFoundError:
+                # the API doesn't support following the logs, fall back to polling
+                logger.debug("Following logs is not supported, polling them instead")
         if watch:
             nil_resp = 0
             while state in ["pending", "running"]:
@@ -489,6 +500,41 @@ class HTTPRunDB(RunDBInterface):
 
         return state, offset
 
+    def _follow_log(self, uid, project, offset):
+        path = self._path_of("log", project, uid) + "/follow"
+        error = f"follow log {project}/{uid}"
+        # the read timeout is a bit longer than the time the API follows the logs in a single request
+        timeout = int(mlrun.mlconf.httpdb.logs.follow.timeout) + 30
+        decoder = codecs.getincrementaldecoder("utf-8")(
+            errors=mlrun.mlconf.httpdb.logs.decode.errors
+        )
+        while True:
+            resp = self.api_call(
+                "GET",
+                path,
+                error,
+                params={"offset": offset},
+                timeout=timeout,
+                stream=True,
+            )
+            try:
+                with resp:
+                    for chunk in resp.iter_content(chunk_size=None):
+                        offset += len(chunk)
+                        print(decoder.decode(chunk), end="", flush=True)
+            except requests.RequestException as exc:
+                # the offset was advanced by the chunks read so far, continue from it
+                logger.debug("Following logs was interrupted", exc=err_to_str(exc))
+
+            # the follow request ends when the run ended or when the API follow timeout passed
+            state, text = self.get_log(uid, project, offset=offset)
+            if text:
+                offset += len(text)
+                print(decoder.decode(text), end="", flush=True)
+            if state not in ["pending", "running"]:
+                print(decoder.decode(b"", final=True), end="")
+                return state, offset
+
     def store_run(self, struct, uid, project="", iter=0):
         """Store run details in the DB. This method is usually called from within other :py:mod:`mlrun` flows
         and not called directly by the user."""
@@ -633,6 +679,61 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", "runs", error, params=params)
         return RunList(resp.json()["runs"])
 
+    def iter_runs(
+        self,
+        name=None,
+        uid: Optional[Union[str, List[str]]] = None,
+        project=None,
+        labels=None,
+        state=None,
+        iter=False,
+        start_time_from: datetime = None,
+        start_time_to: datetime = None,
+        last_update_time_from: datetime = None,
+        last_update_time_to: datetime = None,
+        with_notifications: bool = False,
+        page_size: int = None,
+    ) -> typing.Iterator[dict]:
+        """Lazily iterate over runs (sorted by start time, newest first), the runs are fetched page by page so
+        listing a large number of runs doesn't require a single (huge) response.
+        Example::
+
+            for run in db.iter_runs(project='iris', state='error'):
+                print(run['metadata']['uid'])
+
+        :param page_size: Number of runs fetched per request, defaults to
+            ``mlconf.httpdb.pagination.default_page_size``.
+
+        See :py:func:`~list_runs` for the filter parameters.
+        """
+        project = project or config.default_project
+        params = {
+            "name": name,
+            "uid": uid,
+            "project": project,
+            "label": labels or [],
+            "state": state,
+            "iter": bool2str(iter),
+            "start_time_from": datetime_to_iso(start_time_from),
+            "start_time_to": datetime_to_iso(start_time_to),
+            "last_update_time_from": datetime_to_iso(last_update_time_from),
+            "last_update_time_to": datetime_to_iso(last_update_time_to),
+            "with-notifications": with_notifications,
+        }
+        yield from self._iter_pages("runs", "runs", "list runs", params, page_size)
+
+    def _iter_pages(self, path, key, error, params, page_size=None):
+        params["page-size"] = page_size or int(
+            config.httpdb.pagination.default_page_size
+        )
+        while True:
+            resp = self.api_call("GET", path, error, params=params).json()
+            yield from resp[key]
+            page_token = resp.get("pagination", {}).get("page-token")
+            if not page_token:
+                return
+            params["page-token"] = page_token
+
     def del_runs(self, name=None, project=None, labels=None, state=None, days_ago=0):
         """Delete a group of runs identified by the parameters of the function.
 
@@ -771,6 +872,47 @@ class HTTPRunDB(RunDBInterface):
         values.tag = tag
         return values
 
+    def iter_artifacts(
+        self,
+        name=None,
+        project=None,
+        tag=None,
+        labels: Optional[Union[Dict[str, str], List[str]]] = None,
+        iter: int = None,
+        kind: str = None,
+        category: Union[str, schemas.ArtifactCategories] = None,
+        page_size: int = None,
+    ) -> typing.Iterator[dict]:
+        """Lazily iterate over artifacts (sorted by update time, newest first), the artifacts are fetched page by
+        page so listing a large number of artifacts doesn't require a single (huge) response.
+
+        :param page_size: Number of artifacts fetched per request, defaults to
+            ``mlconf.httpdb.pagination.default_page_size``.
+
+        See :py:func:`~list_artifacts` for the filter parameters.
+        """
+        project = project or config.default_project
+        labels = labels or []
+        if isinstance(labels, dict):
+            labels = [f"{key}={value}" for key, value in labels.items()]
+
+        params = {
+            "name": name,
+            "tag": tag,
+            "label": labels,
+            "iter": iter,
+            "kind": kind,
+            "category": category,
+            "format": schemas.ArtifactsFormat.full.value,
+        }
+        yield from self._iter_pages(
+            f"projects/{project}/artifacts",
+            "artifacts",
+            "list artifacts",
+            params,
+            page_size,
+        )
+
     def del_artifacts(self, name=None, project=None, tag=None, labels=None, days_ago=0):
         """Delete artifacts referenced by the parameters.
 
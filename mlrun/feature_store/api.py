@@ -23,6 +23,7 @@ import mlrun
 import mlrun.errors
 
 from ..data_types import InferOptions, get_infer_interface
+from ..data_types.stats import DFStatsAccumulator
 from ..datastore.sources import BaseSourceDriver, StreamSource
 from ..datastore.store_resources import parse_store_uri
 from ..datastore.targets import (
@@ -227,6 +228,8 @@ def get_online_feature_service(
     fixed_window_type: FixedWindowType = FixedWindowType.LastClosedWindow,
     impute_policy: dict = None,
     update_stats: bool = False,
+    cache_size: int = None,
+    cache_ttl: float = None,
 ) -> OnlineVectorService:
     """initialize and return online feature vector service api,
     returns :py:class:`~mlrun.feature_store.OnlineVectorService`
@@ -282,6 +285,10 @@ def get_online_feature_service(
                             values. "*" is used to specify the default for all features, example: `{"*": "$mean"}`
     :param fixed_window_type: determines how to query the fixed window values which were previously inserted by ingest
     :param update_stats:      update features statistics from the requested feature sets on the vector. Default: False.
+    :param cache_size:        max number of entity results to keep in the in-process results cache, 0 disables the
+                            cache (default: mlconf.feature_store.online_cache.max_size), see `svc.cache_stats()`
+    :param cache_ttl:         results cache entries expiry time in seconds
+                            (default: mlconf.feature_store.online_cache.ttl)
     """
     if isinstance(feature_vector, FeatureVector):
         update_stats = True
@@ -297,7 +304,12 @@ def get_online_feature_service(
         feature_vector, fixed_window_type, update_stats=update_stats
     )
     service = OnlineVectorService(
-        feature_vector, graph, index_columns, impute_policy=impute_policy
+        feature_vector,
+        graph,
+        index_columns,
+        impute_policy=impute_policy,
+        cache_size=cache_size,
+        cache_ttl=cache_ttl,
     )
     service.initialize()
 
@@ -579,18 +591,32 @@ def ingest(
     calculate_df = return_df or infer_stats != InferOptions.Null
     featureset.save()
 
+    if not InferOptions.get_common_options(
+        infer_stats, InferOptions.Index
+    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
+        infer_stats += InferOptions.Index
+
+    # stats of chunked sources are accumulated over all the chunks (vs the returned first chunk)
+    stats_accumulator = None
+    if (
+        InferOptions.get_common_options(infer_stats, InferOptions.Stats)
+        and isinstance(source, BaseSourceDriver)
+        and source.is_iterator()
+    ):
+        stats_accumulator = DFStatsAccumulator(infer_stats)
+
     df = init_featureset_graph(
         source,
         featureset,
         namespace,
         targets=targets_to_ingest,
         return_df=calculate_df,
+        stats_accumulator=stats_accumulator,
     )
-    if not InferOptions.get_common_options(
-        infer_stats, InferOptions.Index
-    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
-        infer_stats += InferOptions.Index
 
+    if stats_accumulator is not None and stats_accumulator.columns:
+        featureset.status.stats = stats_accumulator.to_dict()
+        infer_stats &= ~InferOptions.Stats
     _infer_from_static_df(df, featureset, options=infer_stats)
 
     if isinstance(source, DataSource):
@@ -35,6 +35,7 @@ from ..model import DataSource, DataTarget, ModelObj, ObjectList, VersionedObjMe
 from ..runtimes.function_reference import FunctionReference
 from ..serving.states import RootFlowStep
 from ..utils import StorePrefix
+from ..utils.lru_cache import LRUCache
 
 
 class FeatureVectorSpec(ModelObj):
@@ -384,7 +385,15 @@ class FeatureVector(ModelObj):
 class OnlineVectorService:
     """get_online_feature_service response object"""
 
-    def __init__(self, vector, graph, index_columns, impute_policy: dict = None):
+    def __init__(
+        self,
+        vector,
+        graph,
+        index_columns,
+        impute_policy: dict = None,
+        cache_size: int = None,
+        cache_ttl: float = None,
+    ):
         self.vector = vector
         self.impute_policy = impute_policy or {}
 
@@ -392,6 +401,13 @@ class OnlineVectorService:
         self._index_columns = index_columns
         self._impute_values = {}
 
+        cache_config = mlconf.feature_store.online_cache
+        if cache_size is None:
+            cache_size = int(cache_config.max_size)
+        if cache_ttl is None:
+            cache_ttl = float(cache_config.ttl)
+        self._cache = LRUCache(cache_size, ttl=cache_ttl) if cache_size else None
+
     def __enter__(self):
         return self
 
@@ -458,11 +474,12 @@ class OnlineVectorService:
             svc = fstore.get_online_feature_service(vector, as_list=True)
             resp = svc.get([["joe"], ["mike"]])
 
+        identical entity rows are queried once per call, and when the results cache is enabled
+        (see `cache_size` in get_online_feature_service) recent results are served from memory.
+
         :param entity_rows:  list of list/dict with input entity data/rows
         :param as_list:      return a list of list (list input is required by many ML frameworks)
         """
-        results = []
-        futures = []
         if isinstance(entity_rows, dict):
             entity_rows = [entity_rows]
 
@@ -490,20 +507,40 @@ class OnlineVectorService:
                 for item in entity_rows
             ]
 
-        for row in entity_rows:
-            futures.append(self._controller.emit(row, return_awaitable_result=True))
-
         requested_columns = list(self.vector.status.features.keys())
         aliases = self.vector.get_feature_aliases()
         for i, column in enumerate(requested_columns):
             requested_columns[i] = aliases.get(column, column)
 
-        for future in futures:
-            result = future.await_result()
-            data = result.body
-            for key in self._index_columns:
-                if data and key in data:
-                    del data[key]
+        # serve cached rows and emit every distinct entity row once, the rows are emitted
+        # together so the graph queries them concurrently
+        results = [None] * len(entity_rows)
+        row_indexes = {}
+        futures = []
+        for i, row in enumerate(entity_rows):
+            key = self._get_row_key(row)
+            if key is not None:
+                if key in row_indexes:
+                    row_indexes[key].append(i)
+                    continue
+                if self._cache:
+                    found, data = self._cache.get(key)
+                    if found:
+                        results[i] = copy(data)
+                        continue
+                row_indexes[key] = [i]
+            futures.append(
+                (key, i, self._controller.emit(row, return_awaitable_result=True))
+            )
+
+        keys = []
+        indexes = []
+        responses = []
+        for key, i, future in futures:
+            data = future.await_result().body
+            for key_column in self._index_columns:
+                if data and key_column in data:
+                    del data[key_column]
             if not data:
                 data = None
             else:
@@ -514,25 +551,74 @@ class OnlineVectorService:
                         and column != self.vector.status.label_column
                     ):
                         data[column] = None
-
-            if self._impute_values and data:
-                for name in data.keys():
-                    v = data[name]
-                    if v is None or (type(v) == float and (np.isinf(v) or np.isnan(v))):
-                        data[name] = self._impute_values.get(name, v)
-            for name in list(self.vector.spec.entity_fields.keys()):
-                data.pop(name, None)
-
-            if as_list and data:
-                data = [
+                for name in self.vector.spec.entity_fields.keys():
+                    data.pop(name, None)
+            keys.append(key)
+            indexes.append(i)
+            responses.append(data)
+
+        if self._impute_values:
+            self._impute(responses)
+
+        for key, i, data in zip(keys, indexes, responses):
+            if key is None:
+                results[i] = data
+                continue
+            if self._cache:
+                self._cache.set(key, copy(data))
+            results[i] = data
+            for duplicate_index in row_indexes[key][1:]:
+                results[duplicate_index] = copy(data)
+
+        if as_list:
+            results = [
+                [
                     data.get(key, None)
                     for key in requested_columns
                     if key != self.vector.status.label_column
                 ]
-            results.append(data)
-
+                if data
+                else data
+                for data in results
+            ]
         return results
 
+    def _impute(self, responses: list):
+        """replace missing (None/NaN/inf) values with the impute values of their columns"""
+        rows = [data for data in responses if data]
+        if not rows:
+            return
+        batch = pd.DataFrame(rows, dtype=object)
+        columns = [name for name in self._impute_values if name in batch.columns]
+        if not columns:
+            return
+        imputed = (
+            batch[columns]
+            .replace([np.inf, -np.inf], np.nan)
+            .fillna({name: self._impute_values[name] for name in columns})
+        )
+        for data, values in zip(rows, imputed.to_dict("records")):
+            data.update(values)
+
+    @staticmethod
+    def _get_row_key(row: dict):
+        key = tuple(sorted(row.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable entity values, the row is not cached or deduplicated
+            return None
+        return key
+
+    def cache_stats(self) -> dict:
+        """return the online results cache statistics (empty when the cache is disabled)"""
+        return self._cache.stats() if self._cache else {}
+
+    def clear_cache(self):
+        """drop all the cached online results"""
+        if self._cache:
+            self._cache.clear()
+
     def close(self):
         """terminate the async loop"""
         self._controller.terminate()
@@ -42,8 +42,13 @@ def init_featureset_graph(
     return_df=True,
     verbose=False,
     rows_limit=None,
+    stats_accumulator=None,
 ):
-    """create storey ingestion graph/DAG from feature set object"""
+    """create storey ingestion graph/DAG from feature set object
+
+    when a stats_accumulator (DFStatsAccumulator) is passed, the stats of all the processed
+    (sync graph) chunks are accumulated into it.
+    """
 
     cache = ResourceCache()
     graph = featureset.spec.graph.copy()
@@ -112,6 +117,8 @@ def init_featureset_graph(
                 if size:
                     sizes[i] += size
         chunk_id += 1
+        if stats_accumulator is not None and data is not None:
+            stats_accumulator.update(data)
         if data_result is None:
             # in case of multiple chunks only return the first chunk (last may be too small)
             data_result = data
@@ -45,9 +45,14 @@ class PickleModelServer(V2ModelServer):
 
                         * As a dictionary: `{"inputs": [{"x": [1, 2], "y": [3, 5.5]}]}`
                         * As a list: `{"inputs": [[1, 2], [3, 5.5]]}`
+
+                        Binary (npy / arrow) requests hold an array / a DataFrame, which are passed to the model
+                        as is and the prediction is returned as an array.
         :return: The model's prediction on the given input.
         """
         inputs = request["inputs"]
+        if isinstance(inputs, (np.ndarray, pd.DataFrame)):
+            return np.asarray(self.model.predict(inputs))
         if inputs and isinstance(inputs[0], dict):
             x = pd.DataFrame(inputs[0])
         else:
@@ -220,6 +220,39 @@ class K8sHelper:
 
         return resp
 
+    def logs_stream(
+        self,
+        name,
+        namespace=None,
+        limit_bytes: int = None,
+        tail_lines: int = None,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        Stream the pod logs in chunks of bytes, without loading the whole log to memory
+        :param name: pod name
+        :param namespace: pod namespace
+        :param limit_bytes: read up to this number of bytes from the beginning of the log (None for all)
+        :param tail_lines: read only this number of lines from the end of the log (None for all)
+        :param chunk_size: max size of the yielded chunks
+        """
+        try:
+            resp = self.v1api.read_namespaced_pod_log(
+                name=name,
+                namespace=self.resolve_namespace(namespace),
+                limit_bytes=limit_bytes,
+                tail_lines=tail_lines,
+                _preload_content=False,
+            )
+        except ApiException as exc:
+            logger.error(f"failed to get pod logs: {err_to_str(exc)}")
+            raise exc
+
+        try:
+            yield from resp.stream(chunk_size)
+        finally:
+            resp.release_conn()
+
     def run_job(self, pod, timeout=600):
         pod_name, namespace = self.create_pod(pod)
         if not pod_name:
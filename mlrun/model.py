@@ -434,6 +434,7 @@ class HyperParamStrategies:
     grid = "grid"
     list = "list"
     random = "random"
+    halving = "halving"
     custom = "custom"
 
     @staticmethod
@@ -442,23 +443,44 @@ class HyperParamStrategies:
             HyperParamStrategies.grid,
             HyperParamStrategies.list,
             HyperParamStrategies.random,
+            HyperParamStrategies.halving,
             HyperParamStrategies.custom,
         ]
 
 
+class HyperParamParallelModes:
+    dask = "dask"
+    process = "process"
+
+    @staticmethod
+    def all():
+        return [
+            HyperParamParallelModes.dask,
+            HyperParamParallelModes.process,
+        ]
+
+
 class HyperParamOptions(ModelObj):
     """Hyper Parameter Options
 
     Parameters:
         param_file (str):       hyper params input file path/url, instead of inline
-        strategy (str):         hyper param strategy - grid, list or random
+        strategy (str):         hyper param strategy - grid, list, random or halving (successive halving)
         selector (str):         selection criteria for best result ([min|max.]<result>), e.g. max.accuracy
         stop_condition (str):   early stop condition e.g. "accuracy > 0.9"
-        parallel_runs (int):    number of param combinations to run in parallel (over Dask)
+        parallel_runs (int):    number of param combinations to run in parallel (over Dask or local processes)
+        parallel_mode (str):    how to run the param combinations in parallel (in local/handler runtimes) -
+                                dask (default) or process (a local process pool, parallel_runs defaults to the
+                                number of CPUs)
         dask_cluster_uri (str): db uri for a deployed dask cluster function, e.g. db://myproject/dask
         max_iterations (int):   max number of runs (in random strategy)
         max_errors (int):       max number of child runs errors for the overall job to fail
         teardown_dask (bool):   kill the dask cluster pods after the runs
+        resource_param (str):   (halving strategy) name of the budget param passed to the runs, e.g. epochs
+        min_resource (int):     (halving strategy) budget of the first rung runs (default 1)
+        max_resource (int):     (halving strategy) max budget of a run
+        reduction_factor (int): (halving strategy) only the best 1/reduction_factor of the runs of each rung are
+                                promoted to the next rung, which has a reduction_factor times larger budget (default 3)
     """
 
     def __init__(
@@ -472,6 +494,11 @@ class HyperParamOptions(ModelObj):
         max_iterations=None,
         max_errors=None,
         teardown_dask=None,
+        parallel_mode=None,
+        resource_param=None,
+        min_resource=None,
+        max_resource=None,
+        reduction_factor=None,
     ):
         self.param_file = param_file
         self.strategy = strategy
@@ -482,8 +509,14 @@ class HyperParamOptions(ModelObj):
         self.parallel_runs = parallel_runs
         self.dask_cluster_uri = dask_cluster_uri
         self.teardown_dask = teardown_dask
-
-    def validate(self):
+        self.parallel_mode = parallel_mode
+        self.resource_param = resource_param
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
+
+    def validate(self, hyperparams: dict = None):
+        """validate the options, and the hyperparams (grid) when given"""
         if self.strategy and self.strategy not in HyperParamStrategies.all():
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"illegal hyper param strategy, use {','.join(HyperParamStrategies.all())}"
@@ -492,6 +525,51 @@ class HyperParamOptions(ModelObj):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "max_iterations is only valid in random strategy"
             )
+        if self.strategy == HyperParamStrategies.halving:
+            self._validate_halving(hyperparams)
+        if (
+            self.parallel_mode
+            and self.parallel_mode not in HyperParamParallelModes.all()
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"illegal hyper param parallel mode, use {','.join(HyperParamParallelModes.all())}"
+            )
+        if (
+            self.parallel_mode == HyperParamParallelModes.process
+            and self.dask_cluster_uri
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "dask_cluster_uri is not valid with the process parallel mode"
+            )
+
+    def _validate_halving(self, hyperparams: dict = None):
+        if not self.resource_param or not self.max_resource:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "resource_param and max_resource must be set in halving strategy"
+            )
+        if hyperparams is not None:
+            if not hyperparams or not all(hyperparams.values()):
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "hyperparams must have at least one value per param in halving strategy"
+                )
+            if self.resource_param in hyperparams:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"resource_param {self.resource_param} can't be one of the hyperparams, "
+                    "its value is set by the halving strategy"
+                )
+        if (self.min_resource or 1) > self.max_resource:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "min_resource must not be larger than max_resource"
+            )
+        if self.reduction_factor is not None and self.reduction_factor < 2:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "reduction_factor must be at least 2"
+            )
+        if self.parallel_runs or self.dask_cluster_uri or self.parallel_mode:
+            # the runs of a rung are selected from the completed runs of the previous rung
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "parallel runs are not supported in halving strategy"
+            )
 
 
 class RunSpec(ModelObj):
@@ -910,7 +988,7 @@ class RunTemplate(ModelObj):
         self.spec.hyper_param_options = options
         self.spec.hyper_param_options.selector = selector
         self.spec.hyper_param_options.strategy = strategy
-        self.spec.hyper_param_options.validate()
+        self.spec.hyper_param_options.validate(hyperparams)
         return self
 
     def with_param_file(
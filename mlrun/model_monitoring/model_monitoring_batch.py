@@ -30,6 +30,7 @@ import v3io_frames
 import mlrun
 import mlrun.api.schemas
 import mlrun.data_types.infer
+import mlrun.data_types.stats
 import mlrun.feature_store as fstore
 import mlrun.run
 import mlrun.utils.helpers
@@ -60,6 +61,8 @@ class TotalVarianceDistance:
     Z - vector of random variables
     Pt - Probability distribution over time span t
 
+    The distributions can be 2D arrays of (bins x features), computing the distance of all the features at once.
+
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
     """
@@ -73,9 +76,9 @@ class TotalVarianceDistance:
         """
         Calculate Total Variance distance.
 
-        :returns:  Total Variance Distance.
+        :returns:  Total Variance Distance (an array of distances per feature for 2D distributions).
         """
-        return np.sum(np.abs(self.distrib_t - self.distrib_u)) / 2
+        return np.sum(np.abs(self.distrib_t - self.distrib_u), axis=0) / 2
 
 
 @dataclasses.dataclass
@@ -85,6 +88,7 @@ class HellingerDistance:
     It used to quantify the difference between two probability distributions.
     However, unlike KL Divergence the Hellinger divergence is symmetric and bounded over a probability space.
     The output range of Hellinger distance is [0,1]. The closer to 0, the more similar the two distributions.
+    The distributions can be 2D arrays of (bins x features), computing the distance of all the features at once.
 
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
@@ -99,9 +103,9 @@ class HellingerDistance:
         """
         Calculate Hellinger Distance
 
-        :returns: Hellinger Distance
+        :returns: Hellinger Distance (an array of distances per feature for 2D distributions).
         """
-        return np.sqrt(1 - np.sum(np.sqrt(self.distrib_u * self.distrib_t)))
+        return np.sqrt(1 - np.sum(np.sqrt(self.distrib_u * self.distrib_t), axis=0))
 
 
 @dataclasses.dataclass
@@ -110,6 +114,7 @@ class KullbackLeiblerDivergence:
     KL Divergence (or relative entropy) is a measure of how one probability distribution differs from another.
     It is an asymmetric measure (thus it's not a metric) and it doesn't satisfy the triangle inequality.
     KL Divergence of 0, indicates two identical distributions.
+    The distributions can be 2D arrays of (bins x features), computing the divergence of all the features at once.
 
     :args distrib_t: array of distribution t (usually the latest dataset distribution)
     :args distrib_u: array of distribution u (usually the sample dataset distribution)
@@ -126,32 +131,37 @@ class KullbackLeiblerDivergence:
                              the capping value which indicates a huge differences between the distributions.
         :param kld_scaling:  Will be used to replace 0 values for executing the logarithmic operation.
 
-        :returns: KL Divergence
+        :returns: KL Divergence (an array of divergences per feature for 2D distributions).
         """
+        distrib_t = np.asarray(self.distrib_t, dtype=float)
+        distrib_u = np.asarray(self.distrib_u, dtype=float)
+        t_nonzero = distrib_t != 0
+        u_nonzero = distrib_u != 0
+        # the log is computed only over the non zero entries, avoiding the log(0) warnings
         t_u = np.sum(
-            np.where(
-                self.distrib_t != 0,
-                (self.distrib_t)
-                * np.log(
-                    self.distrib_t
-                    / np.where(self.distrib_u != 0, self.distrib_u, kld_scaling)
-                ),
-                0,
-            )
+            distrib_t
+            * np.log(
+                np.where(t_nonzero, distrib_t, 1)
+                / np.where(u_nonzero, distrib_u, kld_scaling),
+                where=t_nonzero,
+                out=np.zeros_like(distrib_t),
+            ),
+            axis=0,
         )
         u_t = np.sum(
-            np.where(
-                self.distrib_u != 0,
-                (self.distrib_u)
-                * np.log(
-                    self.distrib_u
-                    / np.where(self.distrib_t != 0, self.distrib_t, kld_scaling)
-                ),
-                0,
-            )
+            distrib_u
+            * np.log(
+                np.where(u_nonzero, distrib_u, 1)
+                / np.where(t_nonzero, distrib_t, kld_scaling),
+                where=u_nonzero,
+                out=np.zeros_like(distrib_u),
+            ),
+            axis=0,
         )
         result = t_u + u_t
         if capping:
+            if np.ndim(result):
+                return np.where(np.isinf(result), capping, result)
             return capping if result == float("inf") else result
         return result
 
@@ -204,17 +214,49 @@ class VirtualDrift:
         :returns: Histogram dataframe
         """
 
-        # Create a dictionary with feature histograms as values
-        histograms = {}
-        for feature, stats in histogram_dict.items():
-            if "hist" in stats:
-                # Normalize to probability distribution of each feature
-                histograms[feature] = np.array(stats["hist"][0]) / stats["count"]
+        features = [
+            feature for feature, stats in histogram_dict.items() if "hist" in stats
+        ]
+        if not features:
+            return pd.DataFrame()
+
+        # Normalize to probability distribution of each feature, all the features at once
+        counts = np.array([histogram_dict[feature]["count"] for feature in features])
+        histograms = np.array(
+            [histogram_dict[feature]["hist"][0] for feature in features], dtype=float
+        )
+        histograms /= counts[:, np.newaxis]
+
+        # Convert the (bins x features) array to pandas DataFrame
+        return pd.DataFrame(histograms.T, columns=features)
+
+    def compute_metrics_over_arrays(
+        self,
+        base_histograms: np.ndarray,
+        latest_histograms: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate all the metrics values for all the features in one pass, over precomputed normalized histograms.
 
-        # Convert the dictionary to pandas DataFrame
-        histograms = pd.DataFrame(histograms)
+        :param base_histograms:   (bins x features) array of the normalized histograms of the features from the
+                                  original training set.
+        :param latest_histograms: (bins x features) array of the normalized histograms of the features from the latest
+                                  input batch.
 
-        return histograms
+        :returns: A dictionary in which for each metric (key) we assign an array of the values per feature.
+        """
+        base_histograms = np.asarray(base_histograms, dtype=float)
+        latest_histograms = np.asarray(latest_histograms, dtype=float)
+        if base_histograms.shape != latest_histograms.shape:
+            raise ValueError(
+                f"Histograms shape mismatch: {base_histograms.shape} <> {latest_histograms.shape}"
+            )
+        return {
+            metric_name: np.atleast_1d(
+                metric(base_histograms, latest_histograms).compute()
+            )
+            for metric_name, metric in self.metrics.items()
+        }
 
     def compute_metrics_over_df(
         self,
@@ -235,17 +277,15 @@ class VirtualDrift:
         :returns: A dictionary in which for each metric (key) we assign the values for each feature.
         """
 
-        # compute the different metrics for each feature distribution and store the results in dictionary
-        drift_measures = {}
-        for metric_name, metric in self.metrics.items():
-            drift_measures[metric_name] = {
-                feature: metric(
-                    base_histogram.loc[:, feature], latest_histogram.loc[:, feature]
-                ).compute()
-                for feature in base_histogram
-            }
-
-        return drift_measures
+        # compute the different metrics for all the feature distributions at once and store the results in dictionary
+        metrics_values = self.compute_metrics_over_arrays(
+            base_histogram.to_numpy(dtype=float),
+            latest_histogram.loc[:, base_histogram.columns].to_numpy(dtype=float),
+        )
+        return {
+            metric_name: dict(zip(base_histogram.columns, values.tolist()))
+            for metric_name, values in metrics_values.items()
+        }
 
     def compute_drift_from_histograms(
         self,
@@ -290,52 +330,35 @@ class VirtualDrift:
             latest_histogram.loc[:, features_common],
         )
 
+        # define drift result dictionary with values as a dictionary
+        drift_result = collections.defaultdict(dict)
+
+        # fill drift result dictionary with the statistical metrics results per feature
+        for metric, values in features_drift_measures.items():
+            for feature, value in values.items():
+                drift_result[feature][metric] = value
+
         # compute total value for each metric
-        for metric_name in self.metrics.keys():
-            feature_values = list(features_drift_measures[metric_name].values())
-            features_drift_measures[metric_name]["total_sum"] = np.sum(feature_values)
-            features_drift_measures[metric_name]["total_mean"] = np.mean(feature_values)
+        for metric, values in features_drift_measures.items():
+            feature_values = np.fromiter(values.values(), dtype=float)
+            drift_result[f"{metric}_sum"] = np.sum(feature_values)
+            drift_result[f"{metric}_mean"] = np.mean(feature_values)
 
             # add weighted mean by given feature weights if provided
             if self.feature_weights:
-                features_drift_measures[metric_name]["total_weighted_mean"] = np.dot(
+                drift_result[f"{metric}_weighted_mean"] = np.dot(
                     feature_values, self.feature_weights
                 )
 
-        # define drift result dictionary with values as a dictionary
-        drift_result = collections.defaultdict(dict)
-
-        # fill drift result dictionary with the statistical metrics results per feature
-        # and the total sum and mean of each metric
-        for feature in features_common:
-            for metric, values in features_drift_measures.items():
-                drift_result[feature][metric] = values[feature]
-                sum = features_drift_measures[metric]["total_sum"]
-                mean = features_drift_measures[metric]["total_mean"]
-                drift_result[f"{metric}_sum"] = sum
-                drift_result[f"{metric}_mean"] = mean
-                if self.feature_weights:
-                    metric_measure = features_drift_measures[metric]
-                    weighted_mean = metric_measure["total_weighted_mean"]
-                    drift_result[f"{metric}_weighted_mean"] = weighted_mean
-
-        # compute the drift metric over the labels
-        if self.label_col:
-            label_drift_measures = self.compute_metrics_over_df(
-                base_histogram.loc[:, self.label_col],
-                latest_histogram.loc[:, self.label_col],
-            )
-            for metric, values in label_drift_measures.items():
-                drift_result[self.label_col][metric] = values[metric]
-
-        # compute the drift metric over the predictions
-        if self.prediction_col:
-            prediction_drift_measures = self.compute_metrics_over_df(
-                base_histogram.loc[:, self.prediction_col],
-                latest_histogram.loc[:, self.prediction_col],
-            )
-            for metric, values in prediction_drift_measures.items():
-                drift_result[self.prediction_col][metric] = values[metric]
+        # compute the drift metric over the labels and the predictions
+        for column in [self.label_col, self.prediction_col]:
+            if column:
+                column_drift_measures = self.compute_metrics_over_df(
+                    base_histogram.loc[:, [column]],
+                    latest_histogram.loc[:, [column]],
+                )
+                for metric, values in column_drift_measures.items():
+                    drift_result[column][metric] = values[column]
 
         return drift_result
 
@@ -461,24 +484,22 @@ def calculate_inputs_statistics(
 
     :returns: The calculated statistics of the inputs data.
     """
-    # Use `DFDataInfer` to calculate the statistics over the inputs:
-    inputs_statistics = mlrun.data_types.infer.DFDataInfer.get_stats(
-        df=inputs,
-        options=mlrun.data_types.infer.InferOptions.Histogram,
+    # Calculate the statistics over the inputs in a single pass, the histograms of the features are calculated over
+    # the bins that are set in the sample-set of the end point:
+    inputs_statistics = (
+        mlrun.data_types.stats.DFStatsAccumulator(
+            options=mlrun.data_types.infer.InferOptions.Histogram,
+            bins={
+                feature: sample_set_statistics[feature]["hist"][1]
+                for feature in inputs.columns
+                if "hist" in sample_set_statistics.get(feature, {})
+            },
+            sketch_size=None,
+        )
+        .update(inputs)
+        .to_dict()
     )
 
-    # Recalculate the histograms over the bins that are set in the sample-set of the end point:
-    for feature in inputs_statistics.keys():
-        if feature in sample_set_statistics:
-            counts, bins = np.histogram(
-                inputs[feature].to_numpy(),
-                bins=sample_set_statistics[feature]["hist"][1],
-            )
-            inputs_statistics[feature]["hist"] = [
-                counts.tolist(),
-                bins.tolist(),
-            ]
-
     return inputs_statistics
 
 
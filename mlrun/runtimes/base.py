@@ -492,7 +492,7 @@ class BaseRuntime(ModelObj):
 
         # create task generator (for child runs) from spec
         task_generator = get_generator(
-            run.spec, execution, param_file_secrets=param_file_secrets
+            run.spec, execution, param_file_secrets=param_file_secrets, run_db=db
         )
         if task_generator:
             # verify valid task parameters
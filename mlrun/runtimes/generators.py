@@ -18,15 +18,20 @@ from copy import deepcopy
 
 import pandas as pd
 
+import mlrun.errors
+
 from ..model import HyperParamOptions, RunObject, RunSpec
 from ..utils import get_in
 
-hyper_types = ["list", "grid", "random"]
+hyper_types = ["list", "grid", "random", "halving"]
 default_max_iterations = 10
 default_max_errors = 3
+default_reduction_factor = 3
 
 
-def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
+def get_generator(
+    spec: RunSpec, execution, param_file_secrets: dict = None, run_db=None
+):
     options = spec.hyper_param_options
     strategy = spec.strategy or options.strategy
     if not spec.is_hyper_job() or strategy == "custom":
@@ -49,12 +54,18 @@ def get_generator(spec: RunSpec, execution, param_file_secrets: dict = None):
         obj = execution.get_dataitem(param_file, secrets=param_file_secrets)
         if not strategy and obj.suffix == ".csv":
             strategy = "list"
-        if not strategy or strategy in ["grid", "random"]:
+        if not strategy or strategy in ["grid", "random", "halving"]:
             hyperparams = json.loads(obj.get())
 
     if not strategy or strategy == "grid":
         return GridGenerator(hyperparams, options)
 
+    if strategy == "halving":
+        if not options.selector:
+            raise ValueError("selector must be set in halving strategy")
+        options._validate_halving(hyperparams)
+        return HalvingGenerator(hyperparams, options, run_db)
+
     if strategy == "random":
         return RandomGenerator(hyperparams, options)
 
@@ -70,7 +81,11 @@ class TaskGenerator:
         self.options = options
 
     def use_parallel(self):
-        return self.options.parallel_runs or self.options.dask_cluster_uri
+        return (
+            self.options.parallel_runs
+            or self.options.dask_cluster_uri
+            or self.options.parallel_mode
+        )
 
     @property
     def max_errors(self):
@@ -124,6 +139,76 @@ class GridGenerator(TaskGenerator):
         return arr
 
 
+class HalvingGenerator(GridGenerator):
+    """
+    Successive halving - all the param combinations (grid) first run with a small budget (min_resource of the
+    resource_param), then only the best 1/reduction_factor of them (by the selector) are promoted to the next rung,
+    which runs them with a reduction_factor times larger budget, and so on up to max_resource.
+    The runs results are read from the run db (of the runtime) once all the runs of a rung were completed
+    """
+
+    def __init__(self, hyperparams, options=None, run_db=None):
+        super().__init__(hyperparams, options)
+        self.run_db = run_db
+
+    def generate(self, run: RunObject):
+        params = self.grid_to_list()
+        combinations = len(next(iter(params.values())))
+        candidates = [
+            {key: values[i] for key, values in params.items()}
+            for i in range(combinations)
+        ]
+        op, field = parse_selector(self.options.selector)
+        reduction_factor = self.options.reduction_factor or default_reduction_factor
+        resource = self.options.min_resource or 1
+        iteration = 0
+
+        while True:
+            rung = []
+            for candidate in candidates:
+                newrun = get_run_copy(run)
+                param_dict = newrun.spec.parameters or {}
+                param_dict.update(candidate)
+                param_dict[self.options.resource_param] = resource
+                newrun.spec.parameters = param_dict
+                iteration += 1
+                newrun.metadata.iteration = iteration
+                rung.append((candidate, newrun))
+                yield newrun
+
+            if resource >= self.options.max_resource or len(candidates) <= 1:
+                return
+
+            # the runs are executed by the time the next one is requested, so the whole rung was completed
+            scored_candidates = []
+            for candidate, task in rung:
+                value = self._read_result(task, field)
+                if value is not None:
+                    scored_candidates.append((value, candidate))
+            if not scored_candidates:
+                return
+            scored_candidates.sort(key=lambda item: item[0], reverse=op == "max")
+            promoted = max(len(candidates) // reduction_factor, 1)
+            candidates = [candidate for _, candidate in scored_candidates[:promoted]]
+            resource = min(resource * reduction_factor, self.options.max_resource)
+
+    def _read_result(self, task: RunObject, field):
+        if not self.run_db:
+            return None
+        try:
+            run = self.run_db.read_run(
+                task.metadata.uid, task.metadata.project, task.metadata.iteration
+            )
+        except mlrun.errors.MLRunNotFoundError:
+            return None
+        if get_in(run, ["status", "state"]) == "error":
+            return None
+        try:
+            return float(get_in(run, ["status", "results", field]))
+        except (TypeError, ValueError):
+            return None
+
+
 class RandomGenerator(TaskGenerator):
     def __init__(self, hyperparams: dict, options=None):
         super().__init__(options)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import importlib.util as imputil
 import inspect
 import json
@@ -36,7 +37,7 @@ from mlrun.lists import RunList
 
 from ..errors import err_to_str
 from ..execution import MLClientCtx
-from ..model import RunObject
+from ..model import HyperParamParallelModes, RunObject
 from ..utils import get_handler_extended, get_in, logger, set_paths
 from ..utils.clones import extract_source
 from .base import BaseRuntime, FunctionSpec, spec_fields
@@ -49,6 +50,10 @@ class ParallelRunner:
     def _get_handler(self, handler, context):
         return handler
 
+    def _get_process_pool_handler(self, handler, context):
+        """return the handler and the code file to load it from in the process pool workers"""
+        return self._get_handler(handler, context), None
+
     def _get_dask_client(self, options):
         if options.dask_cluster_uri:
             function = mlrun.import_function(options.dask_cluster_uri)
@@ -58,6 +63,8 @@ class ParallelRunner:
     def _parallel_run_many(
         self, generator, execution: MLClientCtx, runobj: RunObject
     ) -> RunList:
+        if generator.options.parallel_mode == HyperParamParallelModes.process:
+            return self._process_pool_run_many(generator, execution, runobj)
         if self.spec.build.source and generator.options.dask_cluster_uri:
             # the attached dask cluster will not have the source code when we clone the git on run
             raise mlrun.errors.MLRunRuntimeError(
@@ -131,6 +138,110 @@ class ParallelRunner:
 
         return results
 
+    def _process_pool_run_many(
+        self, generator, execution: MLClientCtx, runobj: RunObject
+    ) -> RunList:
+        results = RunList()
+        tasks = generator.generate(runobj)
+        handler = runobj.spec.handler
+        self._force_handler(handler)
+        set_paths(self.spec.pythonpath)
+        handler, command = self._get_process_pool_handler(handler, execution)
+
+        parallel_runs = generator.options.parallel_runs or os.cpu_count()
+        num_errors = 0
+        running = {}
+
+        def process_result(future, task):
+            nonlocal num_errors
+            try:
+                resp, sout, serr = future.result()
+            except Exception as exc:
+                # a failure outside of the handler (e.g. a crashed worker process) fails only its iteration
+                task.status.state = "error"
+                error_string = err_to_str(exc)
+                task.status.error = error_string
+                resp = self._update_run_state(task=task, err=error_string)
+                num_errors += 1
+            else:
+                runobj = RunObject.from_dict(resp)
+                try:
+                    log_std(self._db_conn, runobj, sout, serr, skip=self.is_child)
+                    resp = self._update_run_state(resp)
+                except RunError as err:
+                    resp = self._update_run_state(resp, err=err_to_str(err))
+                    num_errors += 1
+            results.append(resp)
+            if num_errors > generator.max_errors:
+                logger.error("max errors reached, stopping iterations!")
+                return True
+            run_results = resp["status"].get("results", {})
+            stop = generator.eval_stop_condition(run_results)
+            if stop:
+                logger.info(
+                    f"reached early stop condition ({generator.options.stop_condition}), stopping iterations!"
+                )
+            return stop
+
+        # the handler code is loaded once per worker process, and reused for all the iterations it runs
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=parallel_runs,
+            initializer=_init_process_pool_worker,
+            initargs=(handler, command, self.spec.pythonpath),
+        ) as executor:
+            early_stop = False
+            for task in tasks:
+                self.store_run(task)
+                future = executor.submit(
+                    _process_pool_handler_wrapper, task.to_json(), self.spec.workdir
+                )
+                running[future] = task
+                if len(running) < parallel_runs:
+                    continue
+                # the next iteration is submitted only when a worker is free, so on early stop the remaining
+                # iterations are never started
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    early_stop = (
+                        process_result(future, running.pop(future)) or early_stop
+                    )
+                if early_stop:
+                    break
+
+            # the in flight iterations were already stored as running, wait for them to complete
+            for future in concurrent.futures.as_completed(list(running)):
+                process_result(future, running.pop(future))
+
+        return results
+
+
+# the handler (or the code module to resolve it from) of a process pool worker, loaded once per worker process
+_process_pool_worker = {}
+
+
+def _init_process_pool_worker(handler, command=None, pythonpath=None):
+    set_paths(pythonpath)
+    _process_pool_worker["handler"] = handler
+    _process_pool_worker["module"] = _load_module_from_file(command)
+
+
+def _process_pool_handler_wrapper(task, workdir=None):
+    task = json.loads(task)
+    context = MLClientCtx.from_dict(
+        task,
+        autocommit=False,
+        host=socket.gethostname(),
+    )
+    runobj = RunObject.from_dict(task)
+    handler = _process_pool_worker["handler"]
+    if not callable(handler):
+        handler = _get_module_handler(_process_pool_worker["module"], handler, context)
+
+    sout, serr = exec_from_params(handler, runobj, context, workdir)
+    return context.to_dict(), sout, serr
+
 
 def remote_handler_wrapper(task, handler, workdir=None):
     if task and not isinstance(task, dict):
@@ -242,11 +353,19 @@ class LocalRuntime(BaseRuntime, ParallelRunner):
         return True
 
     def _get_handler(self, handler, context):
+        command = self._get_handler_command()
+        return load_module(command, handler, context)
+
+    def _get_process_pool_handler(self, handler, context):
+        # the code file is loaded by the workers (the handler may be resolved per task, e.g. a class with init args)
+        return handler, self._get_handler_command()
+
+    def _get_handler_command(self):
         command = self.spec.command
         if not command and self.spec.build.functionSourceCode:
             # if the code is embedded in the function object extract or find it
             command, _ = mlrun.run.load_func_code(self)
-        return load_module(command, handler, context)
+        return command
 
     def _pre_run(self, runobj: RunObject, execution: MLClientCtx):
         workdir = self.spec.workdir
@@ -374,6 +493,11 @@ class LocalRuntime(BaseRuntime, ParallelRunner):
 
 def load_module(file_name, handler, context):
     """Load module from file name"""
+    module = _load_module_from_file(file_name)
+    return _get_module_handler(module, handler, context)
+
+
+def _load_module_from_file(file_name):
     module = None
     if file_name:
         path = Path(file_name)
@@ -385,7 +509,10 @@ def load_module(file_name, handler, context):
             raise RunError(f"cannot import from {file_name!r}")
         module = imputil.module_from_spec(spec)
         spec.loader.exec_module(module)
+    return module
+
 
+def _get_module_handler(module, handler, context):
     class_args = {}
     if context:
         class_args = copy(context._parameters.get("_init_args", {}))
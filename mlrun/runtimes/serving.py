@@ -91,6 +91,7 @@ class ServingSpec(NuclioSpec):
         "secret_sources",
         "track_models",
         "tracking_policy",
+        "profile",
     ]
 
     def __init__(
@@ -129,6 +130,7 @@ class ServingSpec(NuclioSpec):
         tracking_policy=None,
         secret_sources=None,
         default_content_type=None,
+        profile=None,
         node_name=None,
         node_selector=None,
         affinity=None,
@@ -198,6 +200,7 @@ class ServingSpec(NuclioSpec):
         self.tracking_policy = tracking_policy
         self.secret_sources = secret_sources or []
         self.default_content_type = default_content_type
+        self.profile = profile
 
     @property
     def graph(self) -> Union[RouterStep, RootFlowStep]:
@@ -301,6 +304,7 @@ class ServingRuntime(RemoteRuntime):
         sample: int = None,
         stream_args: dict = None,
         tracking_policy: Union[model_monitoring.TrackingPolicy, dict] = None,
+        flush_interval: float = None,
     ):
         """set tracking parameters:
 
@@ -322,6 +326,8 @@ class ServingRuntime(RemoteRuntime):
                                     tracking_policy = {'default_batch_intervals':"0 */3 * * *"}
                                     serving_fn.set_tracking(tracking_policy=tracking_policy)
 
+        :param flush_interval:  Push the tracking records from a background thread every N seconds (or once a
+                                micro batch is full), instead of pushing them in the request path.
         """
 
         # Applying model monitoring configurations
@@ -345,6 +351,8 @@ class ServingRuntime(RemoteRuntime):
             self.spec.parameters["log_stream_sample"] = sample
         if stream_args:
             self.spec.parameters["stream_args"] = stream_args
+        if flush_interval:
+            self.spec.parameters["log_stream_flush_interval"] = flush_interval
 
     def add_model(
         self,
@@ -652,6 +660,7 @@ class ServingRuntime(RemoteRuntime):
             if self.spec.tracking_policy
             else None,
             "default_content_type": self.spec.default_content_type,
+            "profile": self.spec.profile,
         }
 
         if self.spec.secret_sources:
@@ -704,6 +713,7 @@ class ServingRuntime(RemoteRuntime):
             function_uri=self._function_uri(),
             secret_sources=self.spec.secret_sources,
             default_content_type=self.spec.default_content_type,
+            profile=kwargs.pop("profile", self.spec.profile),
             **kwargs,
         )
         server.init_states(
@@ -0,0 +1,157 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""binary request/response encodings of the serving graph
+
+a request body sent with one of the binary content types is decoded straight into arrays/dataframes:
+
+* ``application/x-npy`` - a NumPy ``.npy`` array, decoded to ``{"inputs": <ndarray>}``
+* ``application/vnd.apache.arrow.stream`` - Arrow IPC stream (record batches), decoded to
+  ``{"inputs": <DataFrame>}``
+* ``application/msgpack`` - a msgpack encoded body (e.g. ``{"inputs": [[1, 2], [3, 4]]}``)
+
+the response is encoded with the type in the request ``Accept`` header, or with the request binary type
+when no (supported) type is accepted, JSON remains the default. npy and arrow responses hold the response
+"outputs" (or the whole body when it has no outputs), bodies which are not arrays (e.g. the model metadata)
+are returned as JSON.
+"""
+import io
+import json
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+npy_content_type = "application/x-npy"
+arrow_content_type = "application/vnd.apache.arrow.stream"
+msgpack_content_type = "application/msgpack"
+json_content_types = ["json", "application/json"]
+binary_content_types = [npy_content_type, arrow_content_type, msgpack_content_type]
+
+
+def get_mime_type(content_type: str) -> str:
+    """return the mime type without parameters (e.g. charset)"""
+    return (content_type or "").split(";")[0].strip().lower()
+
+
+def get_response_content_type(event) -> str:
+    """negotiate the response encoding, return a binary content type or None (for JSON)"""
+    headers = event.headers or {}
+    accept = headers.get("Accept") or headers.get("accept") or ""
+    for accepted in accept.split(","):
+        accepted = get_mime_type(accepted)
+        if accepted in binary_content_types:
+            return accepted
+        if accepted in json_content_types:
+            return None
+    content_type = get_mime_type(event.content_type)
+    return content_type if content_type in binary_content_types else None
+
+
+def decode_body(body: bytes, content_type: str):
+    """decode a binary request body (content_type should be one of the binary_content_types)"""
+    if content_type == npy_content_type:
+        return {"inputs": np.load(io.BytesIO(body), allow_pickle=False)}
+    if content_type == arrow_content_type:
+        import pyarrow
+
+        table = pyarrow.ipc.open_stream(body).read_all()
+        return {"inputs": table.to_pandas()}
+    return _msgpack().unpackb(body)
+
+
+def encode_body(body, content_type: str) -> Tuple[bytes, str]:
+    """encode a response body (content_type should be one of the binary_content_types)
+
+    return the encoded body and its content type, JSON when the body can't be encoded as npy/arrow
+    """
+    if content_type == msgpack_content_type:
+        return _msgpack().packb(body, default=json_default), content_type
+
+    outputs = body
+    if isinstance(body, dict) and "outputs" in body and "inputs" not in body:
+        # a model response, the model metadata (with inputs and outputs) is not an array
+        outputs = body["outputs"]
+    if not isinstance(outputs, pd.DataFrame) or content_type == npy_content_type:
+        try:
+            outputs = np.asarray(outputs)
+        except ValueError:
+            # ragged lists
+            outputs = None
+        if (
+            outputs is None
+            or outputs.dtype.hasobject
+            or (content_type == arrow_content_type and outputs.ndim == 0)
+        ):
+            return json.dumps(body, default=json_default).encode(), "application/json"
+
+    if content_type == npy_content_type:
+        buffer = io.BytesIO()
+        np.save(buffer, outputs, allow_pickle=False)
+        return buffer.getvalue(), content_type
+
+    import pyarrow
+
+    if not isinstance(outputs, pd.DataFrame):
+        outputs = pd.DataFrame(outputs if outputs.ndim > 1 else {"outputs": outputs})
+        outputs.columns = [str(column) for column in outputs.columns]
+    table = pyarrow.Table.from_pandas(outputs, preserve_index=False)
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), content_type
+
+
+def has_array_values(body) -> bool:
+    """return True if the request/response body inputs or outputs are arrays or dataframes"""
+    return isinstance(body, dict) and any(
+        isinstance(body.get(key), _array_types) for key in ["inputs", "outputs"]
+    )
+
+
+def to_json_compatible(value):
+    """convert arrays/dataframes (and numpy scalars) to lists/python values, e.g. before json encoding"""
+    if isinstance(value, dict):
+        return {key: to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_compatible(item) for item in value]
+    return _to_python(value)
+
+
+def json_default(value):
+    """json.dumps default hook for numpy/pandas values"""
+    converted = _to_python(value)
+    if converted is value:
+        raise TypeError(
+            f"Object of type {value.__class__.__name__} is not JSON serializable"
+        )
+    return converted
+
+
+_array_types = (np.ndarray, pd.DataFrame, pd.Series)
+
+
+def _to_python(value):
+    if isinstance(value, pd.DataFrame):
+        return value.values.tolist()
+    if isinstance(value, (np.ndarray, np.generic, pd.Series)):
+        return value.tolist()
+    return value
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError('msgpack is not installed, run "pip install msgpack" first!')
+    return msgpack
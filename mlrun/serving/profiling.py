@@ -0,0 +1,175 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import time
+from copy import copy
+
+from .utils import _extract_input_data, _update_result_body
+
+# latency histogram bucket upper bounds (in ms), the last bucket holds the larger values
+default_buckets = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+# debug endpoint which returns (GET) or resets (DELETE) the graph profiling metrics
+profile_path = "/_profile"
+# storey event attribute holding the time the event left the last profiled step
+_step_end_attribute = "_mlrun_step_end"
+
+
+class _LatencyHistogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value_ms: float):
+        index = 0
+        for index, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                break
+        else:
+            index = len(self.buckets)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "buckets_ms": self.buckets + ["inf"],
+            "counts": list(self.counts),
+        }
+
+
+class GraphProfiler:
+    """per step latency metrics of the serving graph
+
+    records the wall and cpu (thread) time of every step run (router routes are steps too, so each
+    route is measured separately), and in async flows the time the event waited in the flow queue
+    before each step. the metrics are available through `context.profiler.get_metrics()` and the
+    server `/_profile` debug endpoint, enable with `fn.spec.profile = True` (or
+    `create_graph_server(profile=True)`), the profiler is None (no overhead) when disabled.
+
+    :param buckets: latency histogram bucket upper bounds in ms
+    """
+
+    def __init__(self, buckets=None):
+        self.buckets = buckets or default_buckets
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, wall_time: float, cpu_time: float = None):
+        """record a step run, times in seconds"""
+        with self._lock:
+            metrics = self._get_step_metrics(name)
+            metrics["wall"].add(wall_time * 1000)
+            if cpu_time is not None:
+                metrics["cpu"].add(cpu_time * 1000)
+
+    def record_wait(self, name: str, wait_time: float):
+        """record the time (in seconds) an event waited in the (async) flow queue before the step"""
+        with self._lock:
+            self._get_step_metrics(name)["queue_wait"].add(max(wait_time, 0) * 1000)
+
+    def get_metrics(self) -> dict:
+        """return the per step latency histograms, {step: {"wall": .., "cpu": .., "queue_wait": ..}}"""
+        with self._lock:
+            return {
+                name: {
+                    kind: histogram.to_dict()
+                    for kind, histogram in metrics.items()
+                    if histogram.count
+                }
+                for name, metrics in self._metrics.items()
+            }
+
+    def reset(self):
+        """clear the recorded metrics"""
+        with self._lock:
+            self._metrics = {}
+
+    def _get_step_metrics(self, name):
+        if name not in self._metrics:
+            self._metrics[name] = {
+                kind: _LatencyHistogram(self.buckets)
+                for kind in ["wall", "cpu", "queue_wait"]
+            }
+        return self._metrics[name]
+
+
+def mark_step_end(event):
+    """mark the time the event left a step (the queue wait start time of the next step)"""
+    try:
+        setattr(event, _step_end_attribute, time.time())
+    except AttributeError:
+        pass
+
+
+def profile_async_handler(step, handler, profiler: GraphProfiler):
+    """wrap a step handler of an async (storey) flow with latency and queue wait tracking
+
+    the returned handler accepts the full storey event (the step input/result paths are applied here).
+    """
+    full_event = step.full_event or step._call_with_event
+    name = step.fullname
+
+    def before(event):
+        last_end = getattr(event, _step_end_attribute, None)
+        if last_end is not None:
+            profiler.record_wait(name, time.time() - last_end)
+        if full_event:
+            return event
+        return _extract_input_data(step.input_path, event.body)
+
+    def after(event, result):
+        if not full_event:
+            event = copy(event)
+            event.body = _update_result_body(step.result_path, event.body, result)
+            result = event
+        mark_step_end(result)
+        return result
+
+    if asyncio.iscoroutinefunction(handler):
+
+        async def profiled_handler(event):
+            element = before(event)
+            start = time.perf_counter()
+            try:
+                result = await handler(element)
+            finally:
+                # cpu time is not measured, other events are processed while awaiting
+                profiler.record(name, time.perf_counter() - start)
+            return after(event, result)
+
+    else:
+
+        def profiled_handler(event):
+            element = before(event)
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            try:
+                result = handler(element)
+            finally:
+                profiler.record(
+                    name,
+                    time.perf_counter() - start,
+                    time.thread_time() - cpu_start,
+                )
+            return after(event, result)
+
+    return profiled_handler
@@ -112,6 +112,7 @@ class RemoteStep(storey.SendToHttp):
         self._append_event_path = False
         self._endpoint = ""
         self._session = None
+        self._async_session = None
         self._url_function_handler = None
         self._body_function_handler = None
 
@@ -203,6 +204,42 @@ class RemoteStep(storey.SendToHttp):
         event.body = _update_result_body(self._result_path, event.body, result)
         return event
 
+    async def async_do_event(self, event):
+        # async implementation for callers which await the step directly (e.g. ParallelRun asyncio mode)
+        if not self._async_session:
+            self._async_session = mlrun.utils.AsyncClientWithRetry(
+                max_retries=self.retries,
+                retry_backoff_factor=self.backoff_factor
+                or mlrun.mlconf.http_retry_defaults.backoff_factor,
+                retry_on_exception=False,
+                raise_for_status=False,
+                blacklisted_methods=[],
+            )
+
+        body = _extract_input_data(self._input_path, event.body)
+        method, url, headers, body = self._generate_request(event, body)
+        kwargs = {}
+        if self.timeout:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
+        try:
+            async with self._async_session.request(
+                method, url, headers=headers, data=body, ssl=False, **kwargs
+            ) as resp:
+                content = await resp.read()
+                if resp.status >= 400:
+                    raise RuntimeError(
+                        f"bad http response {resp.status}: {content.decode(errors='replace')}"
+                    )
+                result = self._get_data(content, resp.headers)
+        except asyncio.TimeoutError as exc:
+            logger.error(f"http request to {url} timed out in RemoteStep {self.name}")
+            raise exc
+        except aiohttp.ClientConnectionError as err:
+            raise OSError(f"cannot invoke url: {url}, {err_to_str(err)}")
+
+        event.body = _update_result_body(self._result_path, event.body, result)
+        return event
+
     def _generate_request(self, event, body):
         method = self.method or event.method or "POST"
         headers = self.headers or {}
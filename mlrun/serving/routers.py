@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import concurrent
+import concurrent.futures
 import copy
 import json
+import threading
 import traceback
 from enum import Enum
 from io import BytesIO
@@ -22,6 +25,8 @@ from typing import Dict, List, Union
 
 import numpy
 import numpy as np
+import pandas as pd
+from pandas.api.types import is_extension_array_dtype, is_numeric_dtype
 
 import mlrun
 import mlrun.utils.model_monitoring
@@ -40,8 +45,18 @@ from .server import GraphServer
 from .utils import RouterToDict, _extract_input_data, _update_result_body
 from .v2_serving import _ModelLogPusher
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
 # Used by `ParallelRun` in process mode, so it can be accessed from different processes.
 local_routes = {}
+# Shared memory buffers attached by the `ParallelRun` process pool workers
+attached_buffers = []
+
+# Arrays smaller than this are pickled with the event instead of passed through shared memory
+shared_memory_min_bytes = 64 * 1024
 
 
 class BaseModelRouter(RouterToDict):
@@ -231,6 +246,7 @@ class ParallelRunnerModes(str, Enum):
     array = "array"  # running one by one
     process = "process"  # running in separated processes
     thread = "thread"  # running in separated threads
+    asyncio = "asyncio"  # running concurrently on an asyncio event loop
 
     @staticmethod
     def all():
@@ -238,6 +254,7 @@ class ParallelRunnerModes(str, Enum):
             ParallelRunnerModes.thread,
             ParallelRunnerModes.process,
             ParallelRunnerModes.array,
+            ParallelRunnerModes.asyncio,
         ]
 
 
@@ -270,6 +287,8 @@ class ParallelRun(BaseModelRouter):
         health_prefix: str = None,
         extend_event=None,
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
+        route_timeout: float = None,
+        max_concurrency: int = None,
         **kwargs,
     ):
         """Process multiple steps (child routes) in parallel and merge the results
@@ -300,12 +319,21 @@ class ParallelRun(BaseModelRouter):
         :param protocol:      serving API protocol (default "v2")
         :param url_prefix:    url prefix for the router (default /v2/models)
         :param health_prefix: health api url prefix (default /v2/health)
-        :param executor_type: Parallelism mechanism,  Have 3 option :
+        :param executor_type: Parallelism mechanism,  Have 4 option :
                               * array - running one by one
-                              * process - running in separated process
+                              * process - running in separated process (a long-lived pool of warm workers,
+                                numpy/pandas request bodies are passed to the workers through shared memory)
                               * thread - running in separated threads
+                              * asyncio - running concurrently on an asyncio event loop, children with an
+                                `async_do_event()` method or an async handler are awaited, other children run
+                                in the loop's default executor. in async (storey) flows the children run on the
+                                flow event loop, otherwise on a private event loop
                               by default `threads`
         :param extend_event:  True will add the event body to the result
+        :param route_timeout: max time (in seconds) to wait for the child routes (in thread/process/asyncio modes),
+                              results of routes which did not complete in time are dropped, default None (no limit)
+        :param max_concurrency: max number of child routes running concurrently (in asyncio mode),
+                              default None (no limit)
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -327,6 +355,10 @@ class ParallelRun(BaseModelRouter):
                 FutureWarning,
             )
         self.executor_type = ParallelRunnerModes(executor_type)
+        self.route_timeout = route_timeout
+        self.max_concurrency = max_concurrency
+        self._loop: asyncio.AbstractEventLoop = None
+        self._caller_loop: threading.local = None
         self._pool: Union[
             concurrent.futures.ProcessPoolExecutor,
             concurrent.futures.ThreadPoolExecutor,
@@ -355,30 +387,64 @@ class ParallelRun(BaseModelRouter):
         return body
 
     def do_event(self, event, *args, **kwargs):
-        # Handle and verify the request
-        original_body = event.body
-        event.body = _extract_input_data(self._input_path, event.body)
-        event = self.preprocess(event)
-        event = self._pre_handle_event(event)
-
+        original_body, event = self._prepare_event(event)
         # Should we terminate the event?
         if hasattr(event, "terminated") and event.terminated:
-            event.body = _update_result_body(
-                self._result_path, original_body, event.body
-            )
-            self._shutdown_pool()
-            return event
+            return self._complete_event(event, original_body, event)
 
         response = copy.copy(event)
         results = self._parallel_run(event)
-        self._apply_logic(results, response)
-        response = self.postprocess(response)
+        return self._complete_event(event, original_body, response, results)
+
+    async def async_do_event(self, event, *args, **kwargs):
+        """async event handler (used in async flows), in asyncio mode the child routes
+        are gathered on the calling event loop
+        """
+        if self.executor_type != ParallelRunnerModes.asyncio:
+            return self.do_event(event, *args, **kwargs)
+
+        if type(self).do_event is not ParallelRun.do_event:
+            # a subclass do_event() calls the blocking _parallel_run(), run it outside the event loop
+            return await self._run_in_executor(event, *args, **kwargs)
+
+        original_body, event = self._prepare_event(event)
+        if hasattr(event, "terminated") and event.terminated:
+            return self._complete_event(event, original_body, event)
+
+        response = copy.copy(event)
+        results = await self._async_parallel_run(event)
+        return self._complete_event(event, original_body, response, results)
+
+    def _prepare_event(self, event):
+        # Handle and verify the request
+        original_body = event.body
+        event.body = _extract_input_data(self._input_path, event.body)
+        event = self.preprocess(event)
+        return original_body, self._pre_handle_event(event)
 
+    def _complete_event(self, event, original_body, response, results=None):
+        if results is not None:
+            self._apply_logic(results, response)
+            response = self.postprocess(response)
         event.body = _update_result_body(
             self._result_path, original_body, response.body if response else None
         )
         return event
 
+    async def _run_in_executor(self, event, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self._caller_loop is None:
+            self._caller_loop = threading.local()
+
+        def handle_event():
+            self._caller_loop.loop = loop
+            try:
+                return self.do_event(event, *args, **kwargs)
+            finally:
+                self._caller_loop.loop = None
+
+        return await loop.run_in_executor(None, handle_event)
+
     def _init_pool(
         self,
     ) -> Union[
@@ -422,10 +488,18 @@ class ParallelRun(BaseModelRouter):
         if self._pool is not None:
             if self.executor_type == ParallelRunnerModes.process:
                 global local_routes
-                local_routes.pop(id(self))
+                local_routes.pop(id(self), None)
             self._pool.shutdown()
             self._pool = None
 
+    def terminate(self):
+        """shutdown the pool and stop the private event loop (called when the graph completes)"""
+        self._shutdown_pool()
+        if self._loop is not None:
+            loop, self._loop = self._loop, None
+            loop.call_soon_threadsafe(loop.stop)
+            # the loop thread closes the loop once it stopped running
+
     def _parallel_run(self, event: dict):
         """
         Execute parallel run
@@ -441,25 +515,53 @@ class ParallelRun(BaseModelRouter):
                 for model_name, model in self.routes.items()
             }
             return results
-        futures = []
+        if self.executor_type == ParallelRunnerModes.asyncio:
+            loop = getattr(self._caller_loop, "loop", None) or self._get_event_loop()
+            results = asyncio.run_coroutine_threadsafe(
+                self._async_parallel_run(event), loop
+            ).result()
+            self.context.logger.debug(f"Collected results from children: {results}")
+            return results
+        futures = {}
+        shared_buffers = []
         executor = self._init_pool()
-        for route in self.routes.keys():
-            if self.executor_type == ParallelRunnerModes.process:
-                future = executor.submit(
-                    ParallelRun._wrap_step, route, id(self), copy.copy(event)
-                )
-            elif self.executor_type == ParallelRunnerModes.thread:
-                step = self.routes[route]
+        if self.executor_type == ParallelRunnerModes.process:
+            # the event is pickled per route, large arrays are passed through shared memory
+            shared_event = copy.copy(event)
+            shared_event.body = _share_body(event.body, shared_buffers)
+            try:
+                for route in self.routes.keys():
+                    future = executor.submit(
+                        ParallelRun._wrap_step, route, id(self), shared_event
+                    )
+                    futures[future] = route
+            finally:
+                # routes which time out (or are still queued) attach to the buffers later, so they are
+                # released only when all the routes completed (or were cancelled)
+                _release_buffers_when_done(list(futures), shared_buffers)
+        elif self.executor_type == ParallelRunnerModes.thread:
+            for route, step in self.routes.items():
                 future = executor.submit(
                     ParallelRun._wrap_method,
                     route,
                     step.run,
                     copy.copy(event),
                 )
+                futures[future] = route
 
-            futures.append(future)
+        done, not_done = concurrent.futures.wait(futures, timeout=self.route_timeout)
 
-        for future in concurrent.futures.as_completed(futures):
+        for future in not_done:
+            if future.cancel():
+                message = "was cancelled"
+            else:
+                # a running route cannot be interrupted, its worker stays busy until it completes
+                message = "is still running, its result will be dropped"
+            logger.error(
+                f"child route {futures[future]} did not complete within {self.route_timeout} seconds "
+                f"and {message}"
+            )
+        for future in done:
             try:
                 key, result = future.result()
                 results[key] = result.body
@@ -469,6 +571,56 @@ class ParallelRun(BaseModelRouter):
         self.context.logger.debug(f"Collected results from children: {results}")
         return results
 
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the private event loop of this runner (used in asyncio mode outside of async flows),
+        the loop runs in a daemon thread and is created on first use
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_run_event_loop,
+                args=(self._loop,),
+                name=f"{self.name}-event-loop",
+                daemon=True,
+            ).start()
+        return self._loop
+
+    async def _async_parallel_run(self, event):
+        """
+        Gather all the child routes on the running event loop (asyncio mode)
+
+        :param event: event to run in parallel
+
+        :return: All the results of the runs
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(self.routes))
+
+        async def run_route(route, step):
+            # routes run concurrently, each route gets its own copy of the body
+            route_event = copy.copy(event)
+            route_event.body = copy.deepcopy(event.body)
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        _async_run_step(step, route_event), self.route_timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(
+                        f"child route {route} did not complete within {self.route_timeout} seconds"
+                    )
+                    return route, None
+                except Exception as exc:
+                    logger.error(traceback.format_exc())
+                    print(f"child route generated an exception: {exc}")
+                    return route, None
+            return route, result
+
+        responses = await asyncio.gather(
+            *[run_route(route, step) for route, step in self.routes.items()]
+        )
+        return {route: result.body for route, result in responses if result is not None}
+
     @staticmethod
     def init_pool(server_spec, routes, object_id):
         server = mlrun.serving.GraphServer.from_dict(server_spec)
@@ -485,9 +637,11 @@ class ParallelRun(BaseModelRouter):
     @staticmethod
     def _wrap_step(route, object_id, event):
         global local_routes
-        routes = local_routes.get(object_id, None).copy()
+        routes = local_routes.get(object_id, None)
         if routes is None:
             return None, None
+        _release_attached_buffers()
+        event.body = _attach_body(event.body, attached_buffers)
         return route, routes[route].run(event)
 
     @staticmethod
@@ -495,6 +649,159 @@ class ParallelRun(BaseModelRouter):
         return route, handler(event)
 
 
+def _run_event_loop(loop: asyncio.AbstractEventLoop):
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+async def _async_run_step(step, event):
+    """run a child step (route) on the running event loop
+
+    child objects with an `async_do_event()` method or async handlers are awaited,
+    other steps are run in the loop default executor
+    """
+    step_object = getattr(step, "_object", None)
+    if step_object is not None and hasattr(step_object, "async_do_event"):
+        return await step_object.async_do_event(event)
+
+    handler = getattr(step, "_handler", None)
+    if not asyncio.iscoroutinefunction(handler):
+        return await asyncio.get_running_loop().run_in_executor(None, step.run, event)
+
+    kwargs = {"context": step.context} if step._inject_context else {}
+    if step.full_event or step._call_with_event:
+        return await handler(event, **kwargs)
+    result = await handler(_extract_input_data(step.input_path, event.body), **kwargs)
+    event.body = _update_result_body(step.result_path, event.body, result)
+    return event
+
+
+class _SharedArray:
+    """reference to a numpy array placed in shared memory (passed to the process pool)"""
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+class _SharedDataFrame:
+    """pandas dataframe with its (numeric) columns placed in shared memory"""
+
+    def __init__(self, columns: dict, index):
+        self.columns = columns
+        self.index = index
+
+
+def _share_array(array: np.ndarray, shared_buffers: list):
+    if array.dtype.hasobject or array.nbytes < shared_memory_min_bytes:
+        return array
+    buffer = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    shared_buffers.append(buffer)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=buffer.buf)[...] = array
+    return _SharedArray(buffer.name, array.shape, array.dtype.str)
+
+
+def _share_value(value, shared_buffers: list):
+    if isinstance(value, np.ndarray):
+        return _share_array(value, shared_buffers)
+    if isinstance(value, pd.DataFrame) and value.columns.is_unique:
+        return _SharedDataFrame(
+            {
+                column: _share_array(series.to_numpy(), shared_buffers)
+                if _is_plain_numeric(series.dtype)
+                # categorical, nullable and tz aware columns keep their (pickled) pandas arrays and dtypes
+                else series.array
+                for column, series in value.items()
+            },
+            value.index,
+        )
+    return value
+
+
+def _is_plain_numeric(dtype) -> bool:
+    return is_numeric_dtype(dtype) and not is_extension_array_dtype(dtype)
+
+
+def _share_body(body, shared_buffers: list):
+    """replace large numpy/pandas values in the event body with shared memory references"""
+    if shared_memory is None:
+        return body
+    if isinstance(body, dict):
+        return {key: _share_value(value, shared_buffers) for key, value in body.items()}
+    return _share_value(body, shared_buffers)
+
+
+def _attach_value(value, shared_buffers: list):
+    if isinstance(value, _SharedArray):
+        buffer = shared_memory.SharedMemory(name=value.name)
+        shared_buffers.append(buffer)
+        dtype = np.dtype(value.dtype)
+        return np.frombuffer(
+            buffer.buf, dtype=dtype, count=int(np.prod(value.shape))
+        ).reshape(value.shape)
+    if isinstance(value, _SharedDataFrame):
+        return pd.DataFrame(
+            {
+                column: _attach_value(array, shared_buffers)
+                for column, array in value.columns.items()
+            },
+            index=value.index,
+            copy=False,
+        )
+    return value
+
+
+def _release_buffers_when_done(futures: list, shared_buffers: list):
+    """close and unlink the shared memory buffers once all the futures are done"""
+    if not shared_buffers:
+        return
+
+    def release():
+        for buffer in shared_buffers:
+            buffer.close()
+            buffer.unlink()
+
+    if not futures:
+        release()
+        return
+
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        release()
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+def _release_attached_buffers():
+    """close the shared memory buffers attached by previous events (once no longer referenced)"""
+    for buffer in list(attached_buffers):
+        try:
+            buffer.close()
+        except BufferError:
+            # a view of the buffer is still referenced
+            continue
+        attached_buffers.remove(buffer)
+
+
+def _attach_body(body, shared_buffers: list):
+    """restore the shared memory references in the event body (zero-copy views)"""
+    if isinstance(body, dict):
+        return {
+            key: _attach_value(value, shared_buffers) for key, value in body.items()
+        }
+    return _attach_value(body, shared_buffers)
+
+
 class VotingEnsemble(ParallelRun):
     def __init__(
         self,
@@ -509,6 +816,8 @@ class VotingEnsemble(ParallelRun):
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
         format_response_with_col_name_flag: bool = False,
         prediction_col_name: str = "prediction",
+        route_timeout: float = None,
+        max_concurrency: int = None,
         **kwargs,
     ):
         """Voting Ensemble
@@ -598,6 +907,10 @@ class VotingEnsemble(ParallelRun):
                               `{id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}`
                               the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param route_timeout: max time (in seconds) to wait for the models (in thread/process/asyncio modes),
+                              default None (no limit)
+        :param max_concurrency: max number of models running concurrently (in asyncio mode),
+                              default None (no limit)
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -608,12 +921,15 @@ class VotingEnsemble(ParallelRun):
             url_prefix=url_prefix,
             health_prefix=health_prefix,
             executor_type=executor_type,
+            route_timeout=route_timeout,
+            max_concurrency=max_concurrency,
             **kwargs,
         )
         self.name = name or "VotingEnsemble"
         self.vote_type = vote_type
         self.vote_flag = True if self.vote_type is not None else False
         self.weights = weights
+        self._weights_vector = None
         self._model_logger = (
             _ModelLogPusher(self, context)
             if context and context.stream.enabled
@@ -638,6 +954,11 @@ class VotingEnsemble(ParallelRun):
 
         self._update_weights(self.weights)
 
+    def terminate(self):
+        super().terminate()
+        if self._model_logger:
+            self._model_logger.flush()
+
     def _resolve_route(self, body, urlpath):
         """Resolves the appropriate model to send the event to.
         Supports:
@@ -732,19 +1053,21 @@ class VotingEnsemble(ParallelRun):
 
         :return: A list with the most predicted class by all models, per event
         """
-        all_predictions = np.array(all_predictions)
-        # Create 3d matrix (n,c,m) - m the number of models,
-        # c the number of classes and n the number of samples
-        one_hot_representation = np.transpose(
-            (np.arange(all_predictions.max() + 1) == all_predictions[..., None]).astype(
-                int
-            ),
-            (0, 2, 1),
-        )
-        # Each 2d matrix multiply by the weights, and
-        # we get matrix (n,c) such that each row
-        # represent the prediction to each sample.
-        weighted_res = one_hot_representation @ weights
+        all_predictions = np.asarray(all_predictions, dtype=np.int64)
+        num_samples, num_models = all_predictions.shape
+        num_classes = int(all_predictions.max()) + 1 if all_predictions.size else 1
+        # Accumulate the weighted votes directly into a (n,c) matrix - n the number of
+        # samples and c the number of classes, without materializing a one-hot (n,c,m) tensor
+        flat_index = (
+            np.arange(num_samples)[:, None] * num_classes + all_predictions
+        ).ravel()
+        weighted_res = np.bincount(
+            flat_index,
+            weights=np.broadcast_to(
+                np.asarray(weights, dtype=float), (num_samples, num_models)
+            ).ravel(),
+            minlength=num_samples * num_classes,
+        ).reshape(num_samples, num_classes)
         return np.argmax(weighted_res, axis=1).tolist()
 
     def _mean_vote(self, all_predictions: List[List[float]], weights: List[float]):
@@ -756,7 +1079,7 @@ class VotingEnsemble(ParallelRun):
 
         :return: A list of the mean of predictions from all models, per event
         """
-        return (np.array(all_predictions) @ weights).tolist()
+        return (np.asarray(all_predictions) @ weights).tolist()
 
     def _is_int(self, value):
         return float(value).is_integer()
@@ -770,19 +1093,12 @@ class VotingEnsemble(ParallelRun):
 
         :return: List of the resulting voted predictions
         """
+        predictions = np.asarray(predictions)
         # Infer voting type if not given (Classification or recommendation) (once)
         if not self.vote_flag:
             # Are we dealing with an All-Int predictions
             # e.g. Classification
-            if all(
-                [
-                    all(response)
-                    for response in [
-                        list(map(self._is_int, prediction_array))
-                        for prediction_array in predictions
-                    ]
-                ]
-            ):
+            if np.all(np.mod(predictions, 1) == 0):
                 self.vote_type = VotingTypes.classification
             # Do we have `float` predictions
             # e.g. Regression
@@ -793,17 +1109,28 @@ class VotingEnsemble(ParallelRun):
             self.vote_flag = True
         # Apply voting logic
         if self.vote_type == VotingTypes.classification:
-            int_predictions = [
-                list(map(int, sample_predictions)) for sample_predictions in predictions
-            ]
             self.context.logger.debug(f"Applying max logic vote on {predictions}")
-            votes = self._majority_vote(int_predictions, weights)
+            votes = self._majority_vote(predictions.astype(np.int64), weights)
         else:
             self.context.logger.debug(f"Applying majority logic vote on {predictions}")
             votes = self._mean_vote(predictions, weights)
 
         return votes
 
+    def _get_weights_vector(self, model_names: tuple):
+        """
+        Returns the models weights as a numpy vector in the given models order,
+        the vector is cached per models set and order
+
+        :param model_names: The model names, in the predictions order
+        """
+        if self._weights_vector is None or self._weights_vector[0] != model_names:
+            self._weights_vector = (
+                model_names,
+                np.array([self._weights[model_name] for model_name in model_names]),
+            )
+        return self._weights_vector[1]
+
     def _apply_logic(self, results: dict, event=None):
         """
         Reduces a list of k predictions from n models to k predictions according to voting logic
@@ -812,20 +1139,22 @@ class VotingEnsemble(ParallelRun):
         :param event: Response event
         :return: List of the resulting voted predictions
         """
-        flattened_predictions = np.array(
-            list(
-                map(
-                    lambda dictionary: (
-                        dictionary["outputs"][self.prediction_col_name]
-                        if self.format_response_with_col_name_flag
-                        else dictionary["outputs"]
-                    ),
-                    results.values(),
-                )
+        flattened_predictions = None
+        for index, response in enumerate(results.values()):
+            model_predictions = np.asarray(
+                response["outputs"][self.prediction_col_name]
+                if self.format_response_with_col_name_flag
+                else response["outputs"]
             )
-        ).T
-        weights = [self._weights[model_name] for model_name in results.keys()]
-        return self.logic(flattened_predictions, np.array(weights))
+            if flattened_predictions is None:
+                # preallocate the (# samples, # models) predictions matrix
+                flattened_predictions = np.empty(
+                    model_predictions.shape + (len(results),),
+                    dtype=np.result_type(model_predictions, np.float64),
+                )
+            flattened_predictions[..., index] = model_predictions
+        weights = self._get_weights_vector(tuple(results.keys()))
+        return self.logic(flattened_predictions, weights)
 
     def do_event(self, event, *args, **kwargs):
         """Handles incoming requests.
@@ -853,8 +1182,6 @@ class VotingEnsemble(ParallelRun):
             event.body = _update_result_body(
                 self._result_path, original_body, event.body
             )
-
-            self._shutdown_pool()
             return event
 
         # Extract route information
@@ -1004,6 +1331,7 @@ class VotingEnsemble(ParallelRun):
         :param weights_dict: weights dictionary {<model_name>: <wight>}
         """
         self._weights = self._normalize_weights(weights_dict)
+        self._weights_vector = None
         for model in self.routes.keys():
             if model not in self._weights.keys():
                 self._weights[model] = 0
@@ -1299,6 +1627,10 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
                                        {id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}
                                        the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param route_timeout: max time (in seconds) to wait for the models (in thread/process/asyncio modes),
+                              default None (no limit)
+        :param max_concurrency: max number of models running concurrently (in asyncio mode),
+                              default None (no limit)
         :param kwargs:        extra arguments
         """
         super().__init__(
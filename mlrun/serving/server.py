@@ -33,6 +33,15 @@ from ..datastore.store_resources import ResourceCache
 from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
 from ..utils import create_logger, get_caller_globals, parse_versioned_object_uri
+from .encoding import (
+    binary_content_types,
+    decode_body,
+    encode_body,
+    get_mime_type,
+    get_response_content_type,
+    json_default,
+)
+from .profiling import GraphProfiler, profile_path
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
 from .utils import event_id_key, event_path_key
 
@@ -85,6 +94,7 @@ class GraphServer(ModelObj):
         tracking_policy=None,
         secret_sources=None,
         default_content_type=None,
+        profile=None,
     ):
         self._graph = None
         self.graph: Union[RouterStep, RootFlowStep] = graph
@@ -106,6 +116,7 @@ class GraphServer(ModelObj):
         self._db_conn = None
         self.resource_cache = None
         self.default_content_type = default_content_type
+        self.profile = profile
         self.http_trigger = True
 
     def set_current_function(self, function):
@@ -161,6 +172,8 @@ class GraphServer(ModelObj):
         )
         context.get_table = self.resource_cache.get_table
         context.verbose = self.verbose
+        if self.profile:
+            context.profiler = GraphProfiler()
         self.context = context
 
         if self.graph_initializer:
@@ -246,7 +259,25 @@ class GraphServer(ModelObj):
             if event_path_key in event.headers:
                 event.path = event.headers.get(event_path_key)
 
-        if isinstance(event.body, (str, bytes)) and (
+        if server_context.profiler is not None and event.path == profile_path:
+            return self._profile_response(context, event, get_body)
+
+        response_content_type = get_response_content_type(event)
+        if isinstance(event.body, bytes) and (
+            get_mime_type(event.content_type) in binary_content_types
+        ):
+            try:
+                event.body = decode_body(event.body, get_mime_type(event.content_type))
+            except Exception as exc:
+                message = (
+                    f"failed to decode {event.content_type} event, {err_to_str(exc)}"
+                )
+                context.logger.error(message)
+                server_context.push_error(event, message, source="_handler")
+                return context.Response(
+                    body=message, content_type="text/plain", status_code=400
+                )
+        elif isinstance(event.body, (str, bytes)) and (
             not event.content_type or event.content_type in ["json", "application/json"]
         ):
             # assume it is json and try to load
@@ -275,28 +306,56 @@ class GraphServer(ModelObj):
             )
 
         if asyncio.iscoroutine(response):
-            return self._process_async_response(context, response, get_body)
+            return self._process_async_response(
+                context, response, get_body, response_content_type
+            )
         else:
-            return self._process_response(context, response, get_body)
+            return self._process_response(
+                context, response, get_body, response_content_type
+            )
 
-    async def _process_async_response(self, context, response, get_body):
-        return self._process_response(context, await response, get_body)
+    async def _process_async_response(
+        self, context, response, get_body, content_type=None
+    ):
+        return self._process_response(context, await response, get_body, content_type)
 
-    def _process_response(self, context, response, get_body):
+    def _process_response(self, context, response, get_body, content_type=None):
         body = response.body
         if isinstance(body, context.Response) or get_body:
             return body
 
-        if body and not isinstance(body, (str, bytes)):
-            body = json.dumps(body)
+        if body is not None and not isinstance(body, (str, bytes)):
+            if content_type:
+                body, content_type = encode_body(body, content_type)
+            elif hasattr(body, "__array__") or body:
+                body = json.dumps(body, default=json_default)
+                content_type = "application/json"
+            else:
+                return body
             return context.Response(
-                body=body, content_type="application/json", status_code=200
+                body=body, content_type=content_type, status_code=200
             )
         return body
 
+    def _profile_response(self, context, event, get_body):
+        profiler = self.context.profiler
+        if event.method == "DELETE":
+            profiler.reset()
+            body = {}
+        else:
+            body = profiler.get_metrics()
+        if get_body:
+            return body
+        return context.Response(
+            body=json.dumps(body), content_type="application/json", status_code=200
+        )
+
     def wait_for_completion(self):
-        """wait for async operation to complete"""
-        self.graph.wait_for_completion()
+        """wait for async operation to complete and release the graph steps resources"""
+        if hasattr(self.graph, "wait_for_completion"):
+            self.graph.wait_for_completion()
+        else:
+            self.graph._terminate()
 
 
 def v2_serving_init(context, namespace=None):
@@ -452,6 +511,8 @@ class GraphContext:
         self.get_store_resource = None
         self.get_table = None
         self.is_mock = False
+        # GraphProfiler object when the graph profiling is enabled
+        self.profiler = None
 
     @property
     def server(self):
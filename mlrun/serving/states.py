@@ -16,6 +16,7 @@ __all__ = ["TaskStep", "RouterStep", "RootFlowStep"]
 
 import os
 import pathlib
+import time
 import traceback
 from copy import copy, deepcopy
 from inspect import getfullargspec, signature
@@ -28,6 +29,7 @@ from ..errors import MLRunInvalidArgumentError, err_to_str
 from ..model import ModelObj, ObjectDict
 from ..platforms.iguazio import parse_path
 from ..utils import get_class, get_function
+from .profiling import mark_step_end, profile_async_handler
 from .utils import _extract_input_data, _update_result_body
 
 callable_prefix = "_"
@@ -166,6 +168,11 @@ class BaseStep(ModelObj):
     def _post_init(self, mode="sync"):
         pass
 
+    def _terminate(self):
+        """release the step (and child steps) resources when the graph completes"""
+        for child in self.get_children():
+            child._terminate()
+
     def _set_error_handler(self):
         """init/link the error handler for this step"""
         if self.on_error:
@@ -427,6 +434,11 @@ class TaskStep(BaseStep):
             if hasattr(self._object, "model_endpoint_uid"):
                 self.endpoint_uid = self._object.model_endpoint_uid
 
+    def _terminate(self):
+        super()._terminate()
+        if self._object and hasattr(self._object, "terminate"):
+            self._object.terminate()
+
     def respond(self):
         """mark this step as the responder.
 
@@ -441,6 +453,20 @@ class TaskStep(BaseStep):
             # todo invoke remote via REST call
             return event
 
+        profiler = getattr(self.context, "profiler", None)
+        if profiler is None:
+            return self._run(event, *args, **kwargs)
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            return self._run(event, *args, **kwargs)
+        finally:
+            profiler.record(
+                self.fullname,
+                time.perf_counter() - start,
+                time.thread_time() - cpu_start,
+            )
+
+    def _run(self, event, *args, **kwargs):
         if self.context.verbose:
             self.context.logger.info(f"step {self.name} got event {event.body}")
 
@@ -1035,7 +1061,10 @@ class FlowStep(BaseStep):
         if self._controller:
             # async flow (using storey)
             event._awaitable_result = None
-            if config.datastore.async_source_mode == "enabled":
+            if getattr(self.context, "profiler", None) is not None:
+                # the start time of the queue wait (before the first step)
+                mark_step_end(event)
+            if config.snapshot().datastore.async_source_mode == "enabled":
                 resp_awaitable = self._controller.emit(
                     event, await_result=self._wait_for_result
                 )
@@ -1077,11 +1106,14 @@ class FlowStep(BaseStep):
         return event
 
     def wait_for_completion(self):
-        """wait for completion of run in async flows"""
+        """wait for completion of run in async flows and release the steps resources"""
         if self._controller:
             if hasattr(self._controller, "terminate"):
                 self._controller.terminate()
-            return self._controller.await_termination()
+            result = self._controller.await_termination()
+            self._terminate()
+            return result
+        self._terminate()
 
     def plot(self, filename=None, format=None, source=None, targets=None, **kw):
         """plot/save graph using graphviz
@@ -1365,14 +1397,31 @@ def _init_async_objects(context, steps):
 
             elif not step.async_object or not hasattr(step.async_object, "_outlets"):
                 # if regular class, wrap with storey Map
-                step._async_object = storey.Map(
-                    step._handler,
-                    full_event=step.full_event or step._call_with_event,
-                    input_path=step.input_path,
-                    result_path=step.result_path,
-                    name=step.name,
-                    context=context,
-                )
+                handler = step._handler
+                step_object = getattr(step, "_object", None)
+                if hasattr(step_object, "async_do_event") and handler == getattr(
+                    step_object, "do_event", None
+                ):
+                    # prefer the class async event handler (awaited by storey)
+                    handler = step_object.async_do_event
+                profiler = getattr(context, "profiler", None)
+                if profiler is not None:
+                    # the profiled handler gets the full event to track the queue wait time
+                    step._async_object = storey.Map(
+                        profile_async_handler(step, handler, profiler),
+                        full_event=True,
+                        name=step.name,
+                        context=context,
+                    )
+                else:
+                    step._async_object = storey.Map(
+                        handler,
+                        full_event=step.full_event or step._call_with_event,
+                        input_path=step.input_path,
+                        result_path=step.result_path,
+                        name=step.name,
+                        context=context,
+                    )
             if not step.next and hasattr(step, "responder") and step.responder:
                 # if responder step (return result), add Complete()
                 step.async_object.to(storey.Complete(full_event=True))
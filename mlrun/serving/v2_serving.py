@@ -11,11 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import atexit
+import copy
+import hashlib
+import json
+import pickle
+import sys
 import threading
 import time
 import traceback
 from typing import Dict, Union
 
+import numpy as np
+import pandas as pd
+
 import mlrun
 from mlrun.api.schemas import (
     ModelEndpoint,
@@ -26,9 +36,12 @@ from mlrun.api.schemas import (
 )
 from mlrun.artifacts import ModelArtifact  # noqa: F401
 from mlrun.config import config
+from mlrun.errors import err_to_str
 from mlrun.utils import logger, now_date, parse_versioned_object_uri
+from mlrun.utils.lru_cache import LRUCache
 from mlrun.utils.model_monitoring import EndpointType
 
+from .encoding import has_array_values, json_default, to_json_compatible
 from .server import GraphServer
 from .utils import StepToDict, _extract_input_data, _update_result_body
 
@@ -98,6 +111,19 @@ class V2ModelServer(StepToDict):
                               event: {"x": 5} , result_path="resp" means the returned response will be written
                               to event["y"] resulting in {"x": 5, "resp": <result>}
         :param kwargs:     extra arguments (can be accessed using self.get_param(key))
+
+        adaptive micro-batching can be enabled by passing ``max_batch_size`` (and optionally
+        ``batch_max_wait_ms``, default 10) as extra arguments (or as function parameters), in which case
+        concurrent infer requests are coalesced into a single ``predict()`` call whose request "inputs" hold
+        the concatenated inputs of all the coalesced requests, ``predict()`` must return a list (or array)
+        with one output per input, which is scattered back to the individual requests. requests which arrive
+        while ``predict()`` runs are coalesced into the next batch, a lone request is dispatched right away and
+        ``batch_max_wait_ms`` is only spent waiting for a batch to fill when the previous batch was full
+
+        predict results can be cached by passing ``cache_size`` (max number of cached responses) and/or
+        ``cache_max_bytes`` (max estimated size of the cached outputs), with an optional ``cache_ttl``
+        (seconds), identical requests (after preprocess) are then served from the cache without calling
+        ``predict()``, the cache is cleared when the model is (re)loaded, see also cache_stats()
         """
         self.name = name
         self.version = ""
@@ -126,6 +152,8 @@ class V2ModelServer(StepToDict):
             self.model = model
             self.ready = True
         self.model_endpoint_uid = None
+        self._batcher = None
+        self._cache = None
 
     def _load_and_update_state(self):
         try:
@@ -134,11 +162,21 @@ class V2ModelServer(StepToDict):
             self.error = exc
             self.context.logger.error(traceback.format_exc())
             raise RuntimeError(f"failed to load model {self.name}") from exc
+        if self._cache:
+            # results of the previous model are no longer valid
+            self._cache.clear()
         self.ready = True
         self.context.logger.info(f"model {self.name} was loaded")
 
     def post_init(self, mode="sync"):
         """sync/async model loading, for internal use"""
+        cache_size = int(self.get_param("cache_size", 0) or 0)
+        cache_max_bytes = int(self.get_param("cache_max_bytes", 0) or 0)
+        if cache_size > 0 or cache_max_bytes > 0:
+            self._cache = _PredictionCache(
+                cache_size, cache_max_bytes, self.get_param("cache_ttl")
+            )
+
         if not self.ready:
             if mode == "async":
                 t = threading.Thread(target=self._load_and_update_state)
@@ -147,6 +185,14 @@ class V2ModelServer(StepToDict):
             else:
                 self._load_and_update_state()
 
+        max_batch_size = int(self.get_param("max_batch_size", 0) or 0)
+        if max_batch_size > 1:
+            self._batcher = _PredictBatcher(
+                self,
+                max_batch_size,
+                float(self.get_param("batch_max_wait_ms", 10)),
+            )
+
         server = getattr(self.context, "_server", None) or getattr(
             self.context, "server", None
         )
@@ -159,6 +205,11 @@ class V2ModelServer(StepToDict):
                 graph_server=server, model=self
             )
 
+    def terminate(self):
+        """push the buffered model monitoring records (called when the graph completes)"""
+        if self._model_logger:
+            self._model_logger.flush()
+
     def get_param(self, key: str, default=None):
         """get param by key (specified in the model or the function)"""
         if key in self._params:
@@ -169,6 +220,10 @@ class V2ModelServer(StepToDict):
         """set real time metric (for model monitoring)"""
         self.metrics[name] = value
 
+    def cache_stats(self) -> dict:
+        """return the prediction cache statistics (empty dict when the cache is disabled)"""
+        return self._cache.stats() if self._cache else {}
+
     def get_model(self, suffix=""):
         """get the model file(s) and metadata from model store
 
@@ -246,11 +301,13 @@ class V2ModelServer(StepToDict):
             # predict operation
             request = self._pre_event_processing_actions(event, event_body, op)
             try:
-                outputs = self.predict(request)
+                outputs = self._cached_predict(request)
             except Exception as exc:
                 request["id"] = event_id
                 if self._model_logger:
-                    self._model_logger.push(start, request, op=op, error=exc)
+                    self._model_logger.push(
+                        start, _to_logged_body(request), op=op, error=exc
+                    )
                 raise exc
 
             response = {
@@ -297,7 +354,9 @@ class V2ModelServer(StepToDict):
             except Exception as exc:
                 request["id"] = event_id
                 if self._model_logger:
-                    self._model_logger.push(start, request, op=op, error=exc)
+                    self._model_logger.push(
+                        start, _to_logged_body(request), op=op, error=exc
+                    )
                 raise exc
 
             response = {
@@ -321,7 +380,9 @@ class V2ModelServer(StepToDict):
         if self._model_logger:
             inputs, outputs = self.logged_results(request, response, op)
             if inputs is None and outputs is None:
-                self._model_logger.push(start, request, response, op)
+                self._model_logger.push(
+                    start, _to_logged_body(request), _to_logged_body(response), op
+                )
             else:
                 track_request = {"id": event_id, "inputs": inputs or []}
                 track_response = {"outputs": outputs or []}
@@ -329,6 +390,24 @@ class V2ModelServer(StepToDict):
         event.body = _update_result_body(self._result_path, original_body, response)
         return event
 
+    def _cached_predict(self, request: dict):
+        if not self._cache:
+            return self._predict(request)
+        key = self._cache.request_key(request, self.version)
+        found, outputs = self._cache.get(key) if key else (False, None)
+        if not found:
+            outputs = self._predict(request)
+            if key:
+                # copy, so postprocess() changes to the returned outputs would not affect the cached outputs
+                self._cache.set(key, copy.deepcopy(outputs))
+        self.set_metric("cache_hit_rate", self._cache.stats()["hit_rate"])
+        return copy.deepcopy(outputs) if found else outputs
+
+    def _predict(self, request: dict):
+        if self._batcher:
+            return self._batcher.predict(request)
+        return self.predict(request)
+
     def logged_results(self, request: dict, response: dict, op: str):
         """hook for controlling which results are tracked by the model monitoring
 
@@ -353,7 +432,7 @@ class V2ModelServer(StepToDict):
             if "inputs" not in request:
                 raise Exception('Expected key "inputs" in request body')
 
-            if not isinstance(request["inputs"], list):
+            if not isinstance(request["inputs"], (list, np.ndarray, pd.DataFrame)):
                 raise Exception('Expected "inputs" to be a list')
 
         return request
@@ -375,7 +454,199 @@ class V2ModelServer(StepToDict):
         raise NotImplementedError()
 
 
+class _PendingPrediction:
+    def __init__(self, request):
+        self.request = request
+        self.outputs = None
+        self.error = None
+        self.done = False
+
+
+class _PredictBatcher:
+    """coalesce concurrent predict requests into a single model predict() call
+
+    the first waiting request becomes the batch leader, it runs the model predict() over the inputs of
+    all the pending requests and scatters the outputs (or the error) back to them. requests which arrive
+    while a batch is running are coalesced into the next batch, so a request is dispatched right away when
+    no other request is waiting (e.g. when the events are delivered one at a time). only when the previous
+    batch was full (the requests arrive faster than they are served) the leader waits up to max_wait_ms
+    for the batch to fill, it never waits on an event loop thread (async flows).
+    """
+
+    def __init__(self, model, max_batch_size: int, max_wait_ms: float = 10):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._condition = threading.Condition()
+        self._pending = []
+        self._leader_active = False
+        self._last_batch_full = False
+
+    def predict(self, request: dict):
+        item = _PendingPrediction(request)
+        can_wait = not _in_event_loop()
+        with self._condition:
+            self._pending.append(item)
+            self._condition.notify_all()
+
+        while True:
+            with self._condition:
+                while not item.done and self._leader_active:
+                    self._condition.wait()
+                if item.done:
+                    break
+                self._leader_active = True
+                if can_wait and self._last_batch_full:
+                    deadline = time.monotonic() + self.max_wait
+                    while len(self._pending) < self.max_batch_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                self._last_batch_full = len(batch) >= self.max_batch_size
+
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._condition:
+                    for pending in batch:
+                        pending.done = True
+                    self._leader_active = False
+                    self._condition.notify_all()
+
+        if item.error is not None:
+            raise item.error
+        return item.outputs
+
+    def _run_batch(self, batch: list):
+        start = time.monotonic()
+        try:
+            if len(batch) == 1:
+                batch[0].outputs = self.model.predict(batch[0].request)
+            else:
+                self._predict_and_scatter(batch)
+        except Exception as exc:
+            for pending in batch:
+                pending.error = exc
+            return
+        self.model.set_metric("batch_size", len(batch))
+        self.model.set_metric(
+            "batch_latency_microsec", int((time.monotonic() - start) * 1000000)
+        )
+
+    def _predict_and_scatter(self, batch: list):
+        batch_inputs = [pending.request["inputs"] for pending in batch]
+        sizes = [len(inputs) for inputs in batch_inputs]
+        if all(isinstance(inputs, pd.DataFrame) for inputs in batch_inputs):
+            inputs = pd.concat(batch_inputs, ignore_index=True)
+        elif all(isinstance(inputs, np.ndarray) for inputs in batch_inputs):
+            inputs = np.concatenate(batch_inputs)
+        else:
+            inputs = []
+            for pending_inputs in batch_inputs:
+                inputs.extend(to_json_compatible(pending_inputs))
+        request = dict(batch[0].request)
+        request["inputs"] = inputs
+        outputs = self.model.predict(request)
+
+        if isinstance(outputs, dict) or not hasattr(outputs, "__len__"):
+            raise ValueError(
+                "batched predict() must return a list with one output per input"
+            )
+        if len(outputs) != len(inputs):
+            raise ValueError(
+                f"batched predict() returned {len(outputs)} outputs for {len(inputs)} inputs"
+            )
+        offset = 0
+        for pending, size in zip(batch, sizes):
+            chunk = outputs[offset : offset + size]
+            if hasattr(chunk, "tolist") and isinstance(inputs, list):
+                chunk = chunk.tolist()
+            pending.outputs = chunk
+            offset += size
+
+
+def _in_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _PredictionCache(LRUCache):
+    """in-process, size bounded (LRU) cache of model predict results
+
+    results are keyed by a hash of the request (without its id) and the model version, entries older
+    than ttl seconds are treated as a miss (ttl of 0/None means entries never expire), the least recently
+    used entries are evicted once the cache holds more than max_size entries or max_bytes (estimated)
+    bytes of outputs (0 means no limit).
+    """
+
+    def __init__(self, max_size: int = 0, max_bytes: int = 0, ttl: float = None):
+        super().__init__(max_size, max_bytes, ttl, size_func=_estimate_size)
+
+    @staticmethod
+    def request_key(request: dict, version: str = ""):
+        """return a stable hash of the request, or None when the request cannot be hashed"""
+        digest = hashlib.sha256(f"{version}:".encode())
+        try:
+            for key in sorted(request):
+                if key == "id":
+                    continue
+                digest.update(f"{key}:".encode())
+                _hash_value(digest, request[key])
+        except (TypeError, ValueError):
+            return None
+        return digest.hexdigest()
+
+
+def _hash_value(digest, value):
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            value = value.tolist()
+        else:
+            digest.update(f"ndarray:{value.dtype.str}:{value.shape}:".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+            return
+    if isinstance(value, pd.DataFrame):
+        digest.update(f"dataframe:{list(value.columns)}:".encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+        return
+    digest.update(json.dumps(value, sort_keys=True, default=json_default).encode())
+
+
+def _estimate_size(value) -> int:
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _to_logged_body(body):
+    # binary (npy/arrow) requests hold arrays/dataframes, the stream records are json
+    return to_json_compatible(body) if has_array_values(body) else body
+
+
 class _ModelLogPusher:
+    """push model requests/results (and errors) to the model monitoring stream
+
+    by default records are pushed in the request path, when the "log_stream_flush_interval" parameter
+    is set (in seconds) the records are buffered and pushed by a background thread every interval (or
+    once the buffer holds "log_stream_batch" records), up to "log_stream_max_pending" records are buffered,
+    additional records are dropped (and counted) until the stream catches up, the buffered records are
+    also pushed when the graph completes (terminate) and when the process exits
+    """
+
+    _batch_headers = ["request", "op", "resp", "when", "microsec", "metrics"]
+    _max_records_per_push = 500
+
     def __init__(self, model, context, output_stream=None):
         self.model = model
         self.verbose = context.verbose
@@ -384,11 +655,24 @@ class _ModelLogPusher:
         self.stream_path = context.stream.stream_uri
         self.stream_batch = int(context.get_param("log_stream_batch", 1))
         self.stream_sample = int(context.get_param("log_stream_sample", 1))
+        self.flush_interval = float(context.get_param("log_stream_flush_interval", 0))
+        self.max_pending = int(context.get_param("log_stream_max_pending", 10000))
         self.output_stream = output_stream or context.stream.output_stream
         self._worker = context.worker_id
         self._sample_iter = 0
         self._batch_iter = 0
         self._batch = []
+        self._base_data = None
+
+        # background flushing state, pending rows are kept as tuples and converted to records on flush
+        self.pushed_records = 0
+        self.dropped_records = 0
+        self.failed_pushes = 0
+        self._pending_samples = []
+        self._pending_errors = []
+        self._lock = threading.Lock()
+        self._flush_needed = threading.Event()
+        self._flusher = None
 
     def base_data(self):
         base_data = {
@@ -403,25 +687,45 @@ class _ModelLogPusher:
             base_data["labels"] = self.model.labels
         return base_data
 
+    def _new_record(self):
+        # the static metadata is computed once and copied into each record
+        if self._base_data is None:
+            self._base_data = self.base_data()
+        return dict(self._base_data)
+
     def push(self, start, request, resp=None, op=None, error=None):
         start_str = start.isoformat(sep=" ", timespec="microseconds")
         if error:
-            data = self.base_data()
-            data["request"] = request
-            data["op"] = op
-            data["when"] = start_str
             message = str(error)
             if self.verbose:
                 message = f"{message}\n{traceback.format_exc()}"
-            data["error"] = message
-            self.output_stream.push([data])
+            if self.flush_interval:
+                self._enqueue(self._pending_errors, (request, op, start_str, message))
+            else:
+                self.output_stream.push(
+                    [self._error_record(request, op, start_str, message)]
+                )
             return
 
         self._sample_iter = (self._sample_iter + 1) % self.stream_sample
         if self.output_stream and self._sample_iter == 0:
             microsec = (now_date() - start).microseconds
 
-            if self.stream_batch > 1:
+            if self.flush_interval:
+                metrics = getattr(self.model, "metrics", None)
+                self._enqueue(
+                    self._pending_samples,
+                    (
+                        request,
+                        op,
+                        resp,
+                        start,
+                        start_str,
+                        microsec,
+                        metrics and dict(metrics),
+                    ),
+                )
+            elif self.stream_batch > 1:
                 if self._batch_iter == 0:
                     self._batch = []
                 self._batch.append(
@@ -430,19 +734,12 @@ class _ModelLogPusher:
                 self._batch_iter = (self._batch_iter + 1) % self.stream_batch
 
                 if self._batch_iter == 0:
-                    data = self.base_data()
-                    data["headers"] = [
-                        "request",
-                        "op",
-                        "resp",
-                        "when",
-                        "microsec",
-                        "metrics",
-                    ]
+                    data = self._new_record()
+                    data["headers"] = self._batch_headers
                     data["values"] = self._batch
                     self.output_stream.push([data])
             else:
-                data = self.base_data()
+                data = self._new_record()
                 data["request"] = request
                 data["op"] = op
                 data["resp"] = resp
@@ -452,6 +749,93 @@ class _ModelLogPusher:
                     data["metrics"] = self.model.metrics
                 self.output_stream.push([data])
 
+    def _error_record(self, request, op, when, message):
+        data = self._new_record()
+        data["request"] = request
+        data["op"] = op
+        data["when"] = when
+        data["error"] = message
+        return data
+
+    def _enqueue(self, pending: list, row: tuple):
+        with self._lock:
+            if (
+                len(self._pending_samples) + len(self._pending_errors)
+                >= self.max_pending
+            ):
+                self.dropped_records += 1
+                return
+            pending.append(row)
+            size = len(self._pending_samples)
+        if self._flusher is None:
+            self._start_flusher()
+        if pending is self._pending_errors or size >= self.stream_batch:
+            self._flush_needed.set()
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="model-log-pusher", daemon=True
+            )
+            self._flusher.start()
+        # the flusher is a daemon thread, push the remaining records when the process exits
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            self._flush_needed.wait(self.flush_interval)
+            self._flush_needed.clear()
+            self.flush()
+
+    def flush(self):
+        """push all the buffered records to the output stream"""
+        with self._lock:
+            samples, self._pending_samples = self._pending_samples, []
+            errors, self._pending_errors = self._pending_errors, []
+        if not samples and not errors:
+            return
+
+        records = [self._error_record(*row) for row in errors]
+        if self.stream_batch > 1:
+            for index in range(0, len(samples), self.stream_batch):
+                data = self._new_record()
+                data["headers"] = self._batch_headers
+                data["values"] = [
+                    [request, op, resp, str(start), microsec, metrics]
+                    for request, op, resp, start, _, microsec, metrics in samples[
+                        index : index + self.stream_batch
+                    ]
+                ]
+                records.append(data)
+        else:
+            for request, op, resp, _, start_str, microsec, metrics in samples:
+                data = self._new_record()
+                data["request"] = request
+                data["op"] = op
+                data["resp"] = resp
+                data["when"] = start_str
+                data["microsec"] = microsec
+                if metrics:
+                    data["metrics"] = metrics
+                records.append(data)
+
+        for index in range(0, len(records), self._max_records_per_push):
+            chunk = records[index : index + self._max_records_per_push]
+            try:
+                self.output_stream.push(chunk)
+                self.pushed_records += len(chunk)
+            except Exception as exc:
+                self.failed_pushes += 1
+                self.dropped_records += len(chunk)
+                logger.warn(
+                    "Failed to push model monitoring records",
+                    model=self.model.name,
+                    records=len(chunk),
+                    exc=err_to_str(exc),
+                )
+
 
 def _init_endpoint_record(
     graph_server: GraphServer, model: V2ModelServer
@@ -0,0 +1,96 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import threading
+import time
+import typing
+
+
+class LRUCache:
+    """in-process, size bounded (LRU) cache with an optional ttl and hit/miss statistics
+
+    entries older than ttl seconds are treated as a miss (ttl of 0/None means entries never expire),
+    the least recently used entries are evicted once the cache holds more than max_size entries or
+    max_bytes bytes of values (0 means no limit), value sizes are measured with size_func.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        max_bytes: int = 0,
+        ttl: float = None,
+        size_func: typing.Callable[[typing.Any], int] = None,
+    ):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = float(ttl) if ttl else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size_func = size_func
+        self._bytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        """return the cache hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def get(self, key):
+        """return a (found, value) tuple for the key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                self._remove(key)
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        size = self._size_func(value) if self._size_func else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+            while (self.max_size and len(self._entries) > self.max_size) or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
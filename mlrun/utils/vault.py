@@ -21,7 +21,6 @@ import requests
 from mlrun.errors import MLRunInvalidArgumentError
 
 from ..config import config as mlconf
-from ..k8s_utils import get_k8s_helper
 from .helpers import logger
 
 vault_default_prefix = "v1/secret/data"
@@ -257,6 +256,9 @@ def init_project_vault_configuration(project):
     """
     logger.info("Initializing project vault configuration", project=project)
 
+    # importing here to avoid circular dependency (k8s_utils imports the platforms and the utils)
+    from ..k8s_utils import get_k8s_helper
+
     namespace = mlconf.namespace
     k8s = get_k8s_helper(silent=True)
     service_account_name = (
@@ -238,6 +238,42 @@ def test_list_artifacts(db: Session, client: TestClient) -> None:
         )
 
 
+def test_list_artifacts_pagination(db: Session, client: TestClient) -> None:
+    _create_project(client)
+    number_of_artifacts = 12
+    for counter in range(number_of_artifacts):
+        resp = client.post(
+            STORE_API_ARTIFACTS_PATH.format(
+                project=PROJECT, uid=f"{UID}{counter}", key=f"{KEY}{counter}", tag=TAG
+            ),
+            data="{}",
+        )
+        assert resp.status_code == HTTPStatus.OK.value
+
+    keys = []
+    params = {"page-size": 5, "tag": TAG}
+    page_sizes = []
+    while True:
+        resp = client.get(API_ARTIFACTS_PATH.format(project=PROJECT), params=params)
+        assert resp.status_code == HTTPStatus.OK.value
+        page_sizes.append(len(resp.json()["artifacts"]))
+        keys.extend(artifact["db_key"] for artifact in resp.json()["artifacts"])
+        page_token = resp.json()["pagination"]["page-token"]
+        if not page_token:
+            break
+        params["page-token"] = page_token
+    assert page_sizes == [5, 5, 2]
+    assert sorted(keys) == sorted(f"{KEY}{counter}" for counter in range(12))
+
+    resp = client.get(
+        API_ARTIFACTS_PATH.format(project=PROJECT),
+        params={"page-size": 5, "tag": TAG},
+        headers={"accept": mlrun.api.schemas.MediaTypes.ndjson},
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    assert len(resp.text.splitlines()) == number_of_artifacts
+
+
 def test_list_artifacts_with_format_query(db: Session, client: TestClient) -> None:
     _create_project(client)
     artifact = mlrun.artifacts.Artifact(key=KEY, body="123")
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
 import time
 import unittest.mock
 import uuid
@@ -386,6 +387,49 @@ def test_list_runs_single_and_multiple_uids(db: Session, client: TestClient):
         expected_uids.remove(run["metadata"]["uid"])
 
 
+def test_list_runs_pagination(db: Session, client: TestClient):
+    project = "my_project"
+    number_of_runs = 25
+    for counter in range(number_of_runs):
+        uid = f"uid_{counter}"
+        run = {
+            "metadata": {"name": f"run_{counter}", "uid": uid, "project": project},
+            # runs without start time are started now, and are listed first
+            "status": {}
+            if counter % 5 == 0
+            else {"start_time": datetime(2023, 1, 1 + counter % 3).isoformat()},
+        }
+        mlrun.api.crud.Runs().store_run(db, run, uid, project=project)
+
+    uids = []
+    params = {"project": project, "page-size": 10}
+    while True:
+        response = client.get(RUNS_API_V1, params=params)
+        assert response.status_code == HTTPStatus.OK.value
+        uids.extend(run["metadata"]["uid"] for run in response.json()["runs"])
+        page_token = response.json()["pagination"]["page-token"]
+        if not page_token:
+            break
+        params["page-token"] = page_token
+    assert len(uids) == number_of_runs
+    assert len(set(uids)) == number_of_runs
+    assert all(int(uid.split("_")[1]) % 5 == 0 for uid in uids[:5])
+
+    response = client.get(
+        RUNS_API_V1,
+        params={"project": project, "page-size": 7},
+        headers={"accept": mlrun.api.schemas.MediaTypes.ndjson},
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    streamed_runs = [json.loads(line) for line in response.text.splitlines()]
+    assert [run["metadata"]["uid"] for run in streamed_runs] == uids
+
+    response = client.get(
+        RUNS_API_V1, params={"project": project, "page-size": 10, "last": 5}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST.value
+
+
 def test_delete_runs_with_permissions(db: Session, client: TestClient):
     mlrun.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions = (
         unittest.mock.AsyncMock()
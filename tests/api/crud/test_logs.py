@@ -13,9 +13,13 @@
 # limitations under the License.
 #
 import fastapi.testclient
+import pytest
 import sqlalchemy.orm
 
 import mlrun.api.crud
+import mlrun.api.utils.singletons.k8s
+from mlrun.api.constants import LogSources
+from mlrun.runtimes.constants import RunStates
 
 
 class TestLogs:
@@ -43,3 +47,88 @@ class TestLogs:
         mlrun.api.crud.Logs().store_log(data1, project, uid, append=False)
         log = mlrun.api.crud.Logs()._get_logs_legacy_method(db, project, uid)
         assert data1 == log, "get log append=False"
+
+    @staticmethod
+    def test_read_pod_log_range(monkeypatch):
+        log = b"".join(f"line {index}\n".encode() for index in range(100))
+        requested_limits = []
+
+        def logs_stream(name, namespace=None, limit_bytes=None, **kwargs):
+            requested_limits.append(limit_bytes)
+            # limitBytes is not exact, return a bit more than requested
+            data = log[: limit_bytes + 2] if limit_bytes else log
+            for index in range(0, len(data), 7):
+                yield data[index : index + 7]
+
+        monkeypatch.setattr(
+            mlrun.api.utils.singletons.k8s.get_k8s(), "logs_stream", logs_stream
+        )
+        for offset, size in [
+            (0, -1),
+            (0, 10),
+            (13, 25),
+            (100, -1),
+            (len(log) - 3, 10),
+            (len(log) + 5, 10),
+        ]:
+            log_contents = mlrun.api.crud.Logs()._read_pod_log_range(
+                "pod-name", size, offset
+            )
+            assert log_contents == log[offset : offset + size if size > 0 else None]
+        assert requested_limits == [None, 10, 38, None, len(log) + 7, len(log) + 15]
+        assert mlrun.api.crud.Logs()._read_pod_log_range("pod-name", 0, 0) == b""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_follow_logs(
+        db: sqlalchemy.orm.Session, client: fastapi.testclient.TestClient
+    ):
+        project = "project-name"
+        uid = "m33"
+        mlrun.mlconf.httpdb.logs.follow.interval = 0
+        mlrun.api.crud.Runs().store_run(
+            db,
+            {
+                "metadata": {"name": "run-name"},
+                "status": {"state": RunStates.running},
+            },
+            uid,
+            project=project,
+        )
+        mlrun.api.crud.Logs().store_log(b"ab", project, uid)
+        log_stream = mlrun.api.crud.Logs().follow_logs(db, project, uid, offset=1)
+        assert await log_stream.__anext__() == b"b"
+
+        # new logs are followed until the run ends
+        mlrun.api.crud.Logs().store_log(b"cd", project, uid)
+        mlrun.api.crud.Runs().update_run(
+            db, project, uid, 0, {"status.state": RunStates.completed}
+        )
+        assert [log async for log in log_stream] == [b"cd"]
+
+        # a running run is followed until the timeout
+        mlrun.api.crud.Runs().update_run(
+            db, project, uid, 0, {"status.state": RunStates.running}
+        )
+        logs = [
+            log
+            async for log in mlrun.api.crud.Logs().follow_logs(
+                db, project, uid, offset=0, timeout=0.1
+            )
+        ]
+        assert logs == [b"abcd"]
+        _, log_stream = await mlrun.api.crud.Logs().get_logs(
+            db, project, uid, source=LogSources.PERSISTENCY
+        )
+        assert [log async for log in log_stream] == [b"abcd"]
+
+        # a run which keeps writing full chunks is followed until the timeout as well
+        mlrun.api.crud.Logs().store_log(b"x" * 100000, project, uid, append=True)
+        mlrun.mlconf.httpdb.logs.follow.chunk_size = 1
+        logs = [
+            log
+            async for log in mlrun.api.crud.Logs().follow_logs(
+                db, project, uid, offset=0, timeout=0.05
+            )
+        ]
+        assert 0 < len(logs) < 100004
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import pickle
+
 import deepdiff
 import numpy
 import pandas
 import pytest
+import sqlalchemy
 from sqlalchemy.orm import Session
 
+import mlrun.api.db.sqldb.models
 import mlrun.api.initial_data
 import mlrun.errors
 from mlrun.api import schemas
@@ -527,6 +531,56 @@ def test_list_artifacts_exact_name_match(db: DBInterface, db_session: Session):
     _list_and_assert_count("~key", iter=666, count=0)
 
 
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_artifacts_tags_query_count(db: DBInterface, db_session: Session):
+    executed_queries = []
+
+    def _count_query(*args, **kwargs):
+        executed_queries.append(args)
+
+    def _store_artifacts(start, end):
+        for index in range(start, end):
+            key = f"artifact_key_{index}"
+            db.store_artifact(
+                db_session,
+                key,
+                _generate_artifact(key, uid=f"uid_{index}"),
+                f"uid_{index}",
+                tag=f"tag_{index}",
+            )
+
+    def _list_artifacts_and_count_queries():
+        executed_queries.clear()
+        sqlalchemy.event.listen(
+            db_session.get_bind(), "before_cursor_execute", _count_query
+        )
+        try:
+            artifacts = db.list_artifacts(db_session, tag="*")
+        finally:
+            sqlalchemy.event.remove(
+                db_session.get_bind(), "before_cursor_execute", _count_query
+            )
+        return artifacts, len(executed_queries)
+
+    _store_artifacts(0, 5)
+    artifacts, small_list_queries = _list_artifacts_and_count_queries()
+    # every artifact has its own tag and the latest tag
+    assert len(artifacts) == 10
+
+    _store_artifacts(5, 100)
+    artifacts, large_list_queries = _list_artifacts_and_count_queries()
+    assert len(artifacts) == 200
+    assert large_list_queries == small_list_queries
+    assert sorted(
+        artifact["metadata"]["tag"]
+        for artifact in artifacts
+        if artifact["metadata"]["tag"] != "latest"
+    ) == sorted(f"tag_{index}" for index in range(100))
+
+
 def _generate_artifact_with_iterations(
     db, db_session, key, uid, num_iters, best_iter, kind, project=""
 ):
@@ -959,3 +1013,95 @@ def _generate_artifact(name, uid=None, kind=None):
         artifact["metadata"]["uid"] = uid
 
     return artifact
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_data_migration_encode_artifacts_bodies(db: DBInterface, db_session: Session):
+    project = "project1"
+    db.store_artifact(
+        db_session,
+        "chart",
+        _generate_artifact("chart", kind=ChartArtifact.kind),
+        "chart-uid",
+        project=project,
+    )
+    _generate_artifact_with_iterations(
+        db, db_session, "hyper", "hyper-uid", 3, 2, ArtifactCategories.model, project
+    )
+
+    # change the records to be as they are in field (before the migration) - pickled body and no summary columns
+    artifacts = db._find_artifacts(db_session, project, "*")
+    assert len(artifacts) == 4
+    for artifact in artifacts:
+        artifact.body = pickle.dumps(artifact.struct)
+        artifact.kind = None
+        artifact.link_iteration = None
+        db._upsert(db_session, [artifact], ignore=True)
+
+    mlrun.api.initial_data._encode_bodies_and_fill_summary_columns(
+        db, db_session, mlrun.api.db.sqldb.models.Artifact, batch_size=3
+    )
+
+    artifacts = db._find_artifacts(db_session, project, "*")
+    assert len(artifacts) == 4
+    assert sorted(artifact.kind for artifact in artifacts) == [
+        "chart",
+        "link",
+        "model",
+        "model",
+    ]
+    assert [
+        artifact.link_iteration for artifact in artifacts if artifact.kind == "link"
+    ] == [2]
+    assert len(db.list_artifacts(db_session, project=project, kind="model")) == 2
+    best_iteration = db.list_artifacts(
+        db_session, project=project, name="hyper", best_iteration=True
+    )
+    assert len(best_iteration) == 1
+    assert best_iteration[0]["spec"]["iter"] == 2
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_artifacts_page_kind_and_category_filters(
+    db: DBInterface, db_session: Session
+):
+    project = "project1"
+    for counter in range(6):
+        kind = ModelArtifact.kind if counter % 3 == 0 else ChartArtifact.kind
+        db.store_artifact(
+            db_session,
+            f"artifact-{counter}",
+            _generate_artifact(f"artifact-{counter}", kind=kind),
+            f"uid-{counter}",
+            project=project,
+        )
+    # a link artifact pointing at a model iteration, and a link pointing at a missing iteration
+    _generate_artifact_with_iterations(
+        db, db_session, "hyper", "hyper-uid", 3, 2, ArtifactCategories.model, project
+    )
+    link = _generate_artifact("missing-link", kind="link")
+    link["spec"]["link_iteration"] = 1
+    db.store_artifact(db_session, "missing-link", link, "link-uid", project=project)
+
+    # the filters are applied before the page limit, so the pages are full
+    for kwargs, expected_count in [
+        ({"kind": ModelArtifact.kind}, 4),
+        ({"category": ArtifactCategories.model}, 5),
+        ({"category": ArtifactCategories.other}, 6),
+    ]:
+        page_sizes, page_token = [], None
+        while True:
+            artifacts, page_token = db.list_artifacts_page(
+                db_session, 2, page_token, project=project, **kwargs
+            )
+            page_sizes.append(len(artifacts))
+            if not page_token:
+                break
+        assert sum(page_sizes) == expected_count
+        assert all(page_size == 2 for page_size in page_sizes[:-1])
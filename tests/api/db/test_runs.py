@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import math
+import pickle
 from datetime import datetime, timezone
 
 import pytest
 from sqlalchemy.orm import Session
 
 import mlrun.api.db.sqldb.helpers
+import mlrun.api.db.sqldb.models
 import mlrun.api.initial_data
+import mlrun.model
 from mlrun.api.db.base import DBInterface
+from mlrun.api.utils.db.struct_body import StructBodyUtil
 from tests.api.db.conftest import dbs
 
 
@@ -364,6 +369,144 @@ def test_list_runs_limited_unsorted_failure(db: DBInterface, db_session: Session
         )
 
 
+@pytest.mark.parametrize(
+    "db,db_session", [(db, db) for db in dbs], indirect=["db", "db_session"]
+)
+def test_list_runs_page(db: DBInterface, db_session: Session):
+    project = "project"
+    for counter in range(3):
+        _create_new_run(db, db_session, project=project, uid=f"uid-{counter}")
+
+    uids, page_token = [], None
+    while True:
+        runs, page_token = db.list_runs_page(db_session, 2, page_token, project=project)
+        uids.extend(run["metadata"]["uid"] for run in runs)
+        if not page_token:
+            break
+    # the filedb doesn't paginate, it returns a single page with all the runs
+    assert sorted(uids) == ["uid-0", "uid-1", "uid-2"]
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_runs_page_with_notifications(db: DBInterface, db_session: Session):
+    project = "project"
+    for counter in range(5):
+        uid = f"uid-{counter}"
+        _create_new_run(db, db_session, project=project, uid=uid)
+        if counter != 2:
+            db.store_run_notifications(
+                db_session,
+                [
+                    mlrun.model.Notification(
+                        kind="slack",
+                        name=f"notification-{index}",
+                        message="completed",
+                        severity="info",
+                        condition="",
+                        when=["completed"],
+                    )
+                    for index in range(3)
+                ],
+                uid,
+                project,
+            )
+
+    # the page size limits the number of runs, not the number of (run, notification) rows
+    uids, page_token = [], None
+    while True:
+        runs, page_token = db.list_runs_page(
+            db_session, 2, page_token, project=project, with_notifications=True
+        )
+        assert len(runs) == 2 or not page_token
+        for run in runs:
+            assert len(run["spec"]["notifications"]) == 3
+        uids.extend(run["metadata"]["uid"] for run in runs)
+        if not page_token:
+            break
+    assert sorted(uids) == ["uid-0", "uid-1", "uid-3", "uid-4"]
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_data_migration_encode_runs_bodies(db: DBInterface, db_session: Session):
+    project = "project"
+    for index in range(3):
+        run = {
+            "metadata": {
+                "name": f"run-name-{index}",
+                "uid": f"run-uid-{index}",
+                "project": project,
+                "labels": {"kind": "job", "owner": f"owner-{index}"},
+            },
+            "status": {"state": mlrun.runtimes.constants.RunStates.completed},
+        }
+        db.store_run(db_session, run, f"run-uid-{index}", project)
+
+    # change the records to be as they are in field (before the migration) - pickled body
+    runs = db._find_runs(db_session, None, "*", None).all()
+    for run in runs:
+        assert StructBodyUtil.is_json(run.body)
+        run.body = pickle.dumps(run.struct)
+        db._upsert(db_session, [run], ignore=True)
+
+    # the old bodies can still be decoded
+    runs = db.list_runs(db_session, project=project)
+    assert len(runs) == 3
+
+    mlrun.api.initial_data._encode_bodies_and_fill_summary_columns(
+        db, db_session, mlrun.api.db.sqldb.models.Run, batch_size=2
+    )
+
+    runs = db._find_runs(db_session, None, "*", None).all()
+    assert len(runs) == 3
+    for run in runs:
+        assert StructBodyUtil.is_json(run.body)
+
+    # the summary is built from the columns only
+    summaries = db.list_runs(
+        db_session, project=project, format_=mlrun.api.schemas.RunsFormat.summary
+    )
+    full_runs = db.list_runs(db_session, project=project)
+    assert len(summaries) == 3
+    for summary, full_run in zip(summaries, full_runs):
+        assert "spec" not in summary
+        for key in ["name", "uid", "project", "labels"]:
+            assert summary["metadata"][key] == full_run["metadata"][key]
+        assert summary["metadata"]["iter"] == 0
+        for key in ["state", "start_time", "last_update"]:
+            assert summary["status"][key] == full_run["status"][key]
+
+
+def test_struct_body_json_encoding_keeps_lossy_structs_pickled():
+    struct = {"metadata": {"name": "run"}, "status": {"results": {"accuracy": 0.9}}}
+    body = StructBodyUtil.encode(struct, StructBodyUtil.Formats.json)
+    assert body.startswith(StructBodyUtil.json_body_prefix)
+    assert StructBodyUtil.decode(body) == struct
+
+    for lossy_struct in [
+        {"columns": {1: "a", 2: "b"}},
+        {"updated": datetime.now(timezone.utc)},
+        {"values": {1, 2}},
+    ]:
+        body = StructBodyUtil.encode(lossy_struct, StructBodyUtil.Formats.json)
+        assert not StructBodyUtil.is_json(body)
+        assert StructBodyUtil.decode(body) == lossy_struct
+
+    # stored as the API returns them
+    body = StructBodyUtil.encode(
+        {"shape": (2, 3), "value": math.nan}, StructBodyUtil.Formats.json
+    )
+    assert StructBodyUtil.decode(body) == {"shape": [2, 3], "value": None}
+
+    # pickled bodies are never taken for JSON ones
+    assert not StructBodyUtil.is_json(pickle.dumps(struct, protocol=0))
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
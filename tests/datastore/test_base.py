@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import datetime
 import os
 import string
 from contextlib import nullcontext as does_not_raise
 
 import dask.dataframe as dd
+import pandas as pd
 import pytest
+import sqlalchemy
 
 import mlrun.datastore
 import mlrun.datastore.wasbfs
@@ -132,3 +135,72 @@ def test_schema_to_store(schemas, expected_class, expected):
     with expected:
         stores = [schema_to_store(schema) for schema in schemas]
         assert all(store == expected_class for store in stores)
+
+
+def test_sql_target_as_df_pushdown(tmpdir):
+    db_url = f"sqlite:///{tmpdir}/test.db"
+    start = datetime.datetime(2022, 1, 1)
+    df = pd.DataFrame(
+        {
+            "key": range(10),
+            "time": [start + datetime.timedelta(hours=i) for i in range(10)],
+            **{f"c{i}": range(10) for i in range(20)},
+        }
+    )
+    df.to_sql("items", sqlalchemy.create_engine(db_url), index=False)
+
+    target = mlrun.datastore.targets.SQLTarget(
+        db_url=db_url,
+        table_name="items",
+        primary_key_column="key",
+        time_fields=["time"],
+    )
+    result = target.as_df(
+        columns=["time", "c3"],
+        start_time=start + datetime.timedelta(hours=2),
+        end_time=start + datetime.timedelta(hours=5),
+        time_column="time",
+    )
+    assert list(result.columns) == ["time", "c3"]
+    assert list(result.index) == [2, 3, 4]
+
+    chunks = list(target.as_df(columns=["c1"], chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert list(pd.concat(chunks)["c1"]) == list(range(10))
+
+    # without a time column the time range is ignored
+    assert len(target.as_df(start_time=start + datetime.timedelta(hours=2))) == 10
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_sql_target_write_dataframe_upsert(tmpdir, batch_size):
+    db_url = f"sqlite:///{tmpdir}/test.db"
+    engine = sqlalchemy.create_engine(db_url)
+    metadata = sqlalchemy.MetaData()
+    table = sqlalchemy.Table(
+        "items",
+        metadata,
+        sqlalchemy.Column("key", sqlalchemy.String(10), primary_key=True),
+        sqlalchemy.Column("value", sqlalchemy.Float),
+    )
+    metadata.create_all(engine)
+
+    target = mlrun.datastore.targets.SQLTarget(
+        db_url=db_url,
+        table_name="items",
+        primary_key_column="key",
+        if_exists="upsert",
+    )
+    df = pd.DataFrame({"key": ["a", "b", "c"], "value": [1.0, 2.0, None]})
+    target.write_dataframe(df.set_index("key"), batch_size=batch_size)
+    df = pd.DataFrame({"key": ["b", "d"], "value": [20.0, 4.0]})
+    target.write_dataframe(df.set_index("key"), batch_size=batch_size)
+
+    with engine.connect() as conn:
+        rows = conn.execute(table.select().order_by(table.c.key)).fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("a", 1.0),
+        ("b", 20.0),
+        ("c", None),
+        ("d", 4.0),
+    ]
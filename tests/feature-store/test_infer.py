@@ -20,6 +20,8 @@ import pytest
 import mlrun
 import mlrun.feature_store as fstore
 from mlrun.data_types import InferOptions
+from mlrun.data_types.infer import get_df_stats
+from mlrun.data_types.stats import DFStatsAccumulator
 from mlrun.datastore.targets import ParquetTarget
 from mlrun.feature_store import Entity
 from mlrun.feature_store.api import _infer_from_static_df
@@ -176,3 +178,38 @@ def test_check_timestamp_key_is_entity():
         fstore.FeatureSet(
             "imp1", entities=[Entity("time_stamp")], timestamp_key="time_stamp"
         )
+
+
+def test_stats_accumulator_chunks_and_merge():
+    df = pd.DataFrame(
+        {
+            "number": [float(i % 17) for i in range(1000)],
+            "name": [f"n{i % 3}" for i in range(1000)],
+        }
+    )
+    expected = get_df_stats(df, InferOptions.Histogram)
+    expected_hist = expected["number"].pop("hist")
+    described = df.describe()["number"]
+    for stat in ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]:
+        assert expected["number"][stat] == pytest.approx(described[stat])
+    assert expected["name"] == {"count": 1000, "unique": 3, "top": "n0", "freq": 334}
+
+    # chunked stats (with a sketch holding all the values) equal the single dataframe stats
+    chunks = [df.iloc[i : i + 300] for i in range(0, len(df), 300)]
+    stats = get_df_stats(iter(chunks), InferOptions.Histogram)
+    assert stats["name"] == expected["name"]
+    assert stats["number"].pop("hist") == expected_hist
+    assert stats["number"] == pytest.approx(expected["number"])
+
+    # partitions accumulated separately and merged
+    first = DFStatsAccumulator(sketch_size=None).update(df.iloc[:400])
+    second = DFStatsAccumulator(sketch_size=None).update(df.iloc[400:])
+    merged = first.merge(second).to_dict()
+    assert merged["number"].pop("hist") == expected_hist
+    assert merged["number"] == pytest.approx(expected["number"])
+
+    # fixed bins histograms
+    stats = DFStatsAccumulator(bins={"number": [0, 5, 10, 20]})
+    for chunk in chunks:
+        stats.update(chunk)
+    assert stats.to_dict()["number"]["hist"] == [[295, 295, 410], [0, 5, 10, 20]]
@@ -11,11 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import unittest.mock
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 import mlrun
+import mlrun.feature_store as fstore
 from mlrun.data_types.data_types import ValueType
 from mlrun.datastore import ParquetSource
 from mlrun.feature_store import Entity, Feature, FeatureSet
@@ -147,3 +150,51 @@ def test_parquet_source_with_iso_start_or_end_time(
             _test_parquet_source_with_iso_start_or_end_time(
                 time_for_source, is_through_init, time_delta
             )
+
+
+class _FakeController:
+    def __init__(self, features):
+        self.features = features
+        self.emitted = []
+
+    def emit(self, event, return_awaitable_result=False):
+        self.emitted.append(dict(event))
+        body = dict(event, **self.features.get(event["id"], {}))
+        if event["id"] not in self.features:
+            body = {}
+        result = unittest.mock.Mock(body=body)
+        return unittest.mock.Mock(await_result=unittest.mock.Mock(return_value=result))
+
+
+def test_online_vector_service_batch_and_cache():
+    vector = fstore.FeatureVector("vec", ["set1.a", "set1.b"])
+    vector.status.features = [Feature(name="a"), Feature(name="b")]
+    controller = _FakeController(
+        {"x": {"a": 1.0, "b": 2}, "n": {"a": float("nan"), "b": np.inf}}
+    )
+    service = fstore.OnlineVectorService(
+        vector,
+        unittest.mock.Mock(controller=controller),
+        ["id"],
+        cache_size=10,
+        cache_ttl=0,
+    )
+    service._impute_values = {"a": -1, "b": -2}
+
+    rows = [{"id": "x"}, {"id": "n"}, {"id": "x"}, {"id": "missing"}]
+    assert service.get(rows) == [
+        {"a": 1.0, "b": 2},
+        {"a": -1, "b": -2},
+        {"a": 1.0, "b": 2},
+        None,
+    ]
+    # identical entity rows are emitted once
+    assert len(controller.emitted) == 3
+
+    assert service.get([["x"], ["n"]], as_list=True) == [[1.0, 2], [-1, -2]]
+    assert len(controller.emitted) == 3
+    assert service.cache_stats()["hits"] == 2
+
+    service.clear_cache()
+    service.get([{"id": "x"}])
+    assert len(controller.emitted) == 4
@@ -0,0 +1,68 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np
+import pytest
+
+from mlrun.model_monitoring.model_monitoring_batch import (
+    HellingerDistance,
+    KullbackLeiblerDivergence,
+    TotalVarianceDistance,
+    VirtualDrift,
+)
+
+
+def _generate_histograms(n_features: int, n_bins: int = 20) -> dict:
+    histograms = {}
+    for i in range(n_features):
+        hist = np.random.randint(0, 50, n_bins)
+        hist[np.random.randint(0, n_bins, 3)] = 0
+        histograms[f"feature_{i}"] = {
+            "hist": [hist.tolist(), list(range(n_bins + 1))],
+            "count": int(hist.sum()),
+        }
+    return histograms
+
+
+def test_compute_metrics_over_arrays():
+    sample_stats = _generate_histograms(50)
+    inputs_stats = _generate_histograms(50)
+    virtual_drift = VirtualDrift(inf_capping=10)
+    base_histograms = virtual_drift.dict_to_histogram(sample_stats)
+    latest_histograms = virtual_drift.dict_to_histogram(inputs_stats)
+    assert base_histograms.shape == (20, 50)
+
+    metrics = virtual_drift.compute_metrics_over_arrays(
+        base_histograms.to_numpy(), latest_histograms.to_numpy()
+    )
+
+    # the vectorized metrics must match the per feature computation
+    for index, feature in enumerate(base_histograms.columns):
+        base, latest = base_histograms[feature], latest_histograms[feature]
+        for metric in [
+            TotalVarianceDistance,
+            HellingerDistance,
+            KullbackLeiblerDivergence,
+        ]:
+            assert metrics[metric.NAME][index] == pytest.approx(
+                metric(base.to_numpy(), latest.to_numpy()).compute()
+            )
+
+    drift_result = virtual_drift.compute_drift_from_histograms(
+        sample_stats, inputs_stats
+    )
+    assert drift_result["tvd_mean"] == pytest.approx(np.mean(metrics["tvd"]))
+    assert drift_result["feature_3"]["hellinger"] == pytest.approx(
+        metrics["hellinger"][3]
+    )
@@ -17,3 +17,7 @@
 def hyper_func(context, p1, p2, p3):
     print(f"p2={p2}, p3={p3}")
     context.log_result("r1", p2 * p3)
+
+
+def hyper_halving_func(context, p2, epochs):
+    context.log_result("r1", p2 * epochs)
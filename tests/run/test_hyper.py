@@ -16,12 +16,13 @@
 import pathlib
 
 import pandas as pd
+import pytest
 
 import mlrun
 from mlrun import new_function, new_task
 from tests.conftest import out_path, tag_test, tests_root_directory, verify_state
 
-from .assets.hyper_func import hyper_func
+from .assets.hyper_func import hyper_func, hyper_halving_func
 from .common import my_func
 
 base_spec = new_task(params={"p1": 8}, out_path=out_path)
@@ -83,6 +84,34 @@ def test_hyper_grid_parallel():
     assert len(run.status.iterations) == 1 + 2 * 3, "wrong number of iterations"
 
 
+def test_hyper_halving(tmp_path):
+    run_spec = mlrun.new_task(params={"p1": 1}, out_path=str(tmp_path))
+    run_spec.with_hyper_params(
+        {"p2": [3, 1, 9, 4, 2, 8, 5, 7, 6]},
+        selector="max.r1",
+        strategy="halving",
+        resource_param="epochs",
+        max_resource=9,
+    )
+    run = new_function().run(run_spec, handler=hyper_halving_func)
+
+    verify_state(run)
+    # 9 combinations with 1 epoch, the best 3 with 3 epochs and the best one with 9 epochs
+    assert len(run.status.iterations) == 1 + 9 + 3 + 1, "wrong number of iterations"
+    assert run.output("best_iteration") == 13, "wrong best iteration"
+    assert run.output("r1") == 81, "wrong best result"
+
+    for hyperparams in [{}, {"p2": [1, 2], "epochs": [1, 2]}]:
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            mlrun.new_task().with_hyper_params(
+                hyperparams,
+                selector="max.r1",
+                strategy="halving",
+                resource_param="epochs",
+                max_resource=9,
+            )
+
+
 def test_hyper_list():
     list_params = '{"p2": [2,3,1], "p3": [10,30,20]}'
     mlrun.datastore.set_in_memory_item("params.json", list_params)
@@ -118,14 +147,33 @@ def test_hyper_list_with_stop():
     assert run.output("best_iteration") == 3, "wrong best iteration"
 
 
-def test_hyper_parallel_with_stop():
+def test_hyper_parallel_with_stop(tmp_path):
     list_params = '{"p2": [2,3,7,4,5], "p3": [10,10,10,10,10]}'
     mlrun.datastore.set_in_memory_item("params.json", list_params)
 
-    run_spec = mlrun.new_task(params={"p1": 1})
+    run_spec = mlrun.new_task(params={"p1": 1}, out_path=str(tmp_path))
+    run_spec.with_hyper_params(
+        {"p2": [2, 3, 7, 4, 5], "p3": [10, 10, 10, 10, 10]},
+        parallel_runs=2,
+        selector="max.r1",
+        strategy="list",
+        stop_condition="r1>=70",
+    )
+    run = new_function().run(run_spec, handler=hyper_func)
+
+    verify_state(run)
+    # result: r1 = p2 * p3, r1 >= 70 lead to stop on third run
+    # may have one extra iterations in flight so checking both 4 or 5
+    assert len(run.status.iterations) in [4, 5], "wrong number of iterations"
+    assert run.output("best_iteration") == 3, "wrong best iteration"
+
+
+def test_hyper_parallel_processes_with_stop(tmp_path):
+    run_spec = mlrun.new_task(params={"p1": 1}, out_path=str(tmp_path))
     run_spec.with_hyper_params(
         {"p2": [2, 3, 7, 4, 5], "p3": [10, 10, 10, 10, 10]},
         parallel_runs=2,
+        parallel_mode="process",
         selector="max.r1",
         strategy="list",
         stop_condition="r1>=70",
@@ -188,13 +236,14 @@ def hyper_func2(context, p1=1):
     context.log_dataset("df2", df=df)
 
 
-def test_hyper_get_artifact():
+def test_hyper_get_artifact(tmp_path):
     fn = mlrun.new_function("test_hyper_get_artifact")
     run = mlrun.run_function(
         fn,
         handler=hyper_func2,
         hyperparams={"p1": [1, 2, 3]},
         selector="max.accuracy",
+        artifact_path=str(tmp_path),
     )
     assert run.artifact("df1").meta, "df1 (with db_key) not returned"
     assert run.artifact("df2").meta, "df2 (without db_key) not returned"
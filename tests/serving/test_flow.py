@@ -156,6 +156,37 @@ def return_type(event):
     return event.__class__.__name__
 
 
+@pytest.mark.parametrize("engine", engines)
+def test_graph_profiling(engine):
+    function = mlrun.new_function("tests", kind="serving")
+    graph = function.set_topology("flow", engine=engine)
+    graph.to(name="s1", class_name="Echo").to(
+        "*", name="r1", input_path="x", result_path="y"
+    ).to(name="s3", class_name="Echo").respond()
+    function.add_model("m1", class_name="ModelTestingClass", model_path=".")
+    function.spec.profile = True
+    server = function.to_mock_server()
+
+    resp = server.test("/v2/models/m1/infer", body={"x": {"inputs": [5]}})
+    server.wait_for_completion()
+    assert resp["y"]["outputs"] == [5], "wrong output"
+
+    metrics = server.test("/_profile", method="GET")
+    # the router steps time include the route (model) run
+    for step in ["s1", "r1", "r1/m1", "s3"]:
+        assert metrics[step]["wall"]["count"] == 1, f"missing {step} metrics"
+        assert sum(metrics[step]["wall"]["counts"]) == 1
+    if engine == "async":
+        assert metrics["s1"]["queue_wait"]["count"] == 1, "missing queue wait"
+    assert (
+        metrics["r1"]["wall"]["total_ms"] >= metrics["r1/m1"]["wall"]["total_ms"]
+    ), "router time should include the route time"
+
+    server.test("/_profile", method="DELETE")
+    assert server.test("/_profile", method="GET") == {}
+    assert server.context.profiler.get_metrics() == {}
+
+
 def test_content_type():
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology("flow", engine="sync")
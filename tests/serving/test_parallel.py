@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import concurrent.futures
+import time
+
+import numpy as np
+import pandas as pd
 import pytest
 
 import mlrun
@@ -36,6 +42,29 @@ def my_hnd(event):
     return {"mul": event["x"] * 2}
 
 
+def inc_hnd(event):
+    """example handler which modifies its input"""
+    event["x"] += 1
+    return {"inc": event["x"]}
+
+
+def sum_hnd(event):
+    """example handler"""
+    return {"sum": float(np.sum(event["data"]))}
+
+
+def slow_hnd(event):
+    """example handler"""
+    time.sleep(3)
+    return {"slow": True}
+
+
+async def async_hnd(event):
+    """example async handler"""
+    await asyncio.sleep(0.5)
+    return {"async": event["x"]}
+
+
 @pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
 def test_parallel(executor):
     fn = mlrun.new_function("tests", kind="serving")
@@ -54,3 +83,116 @@ def test_parallel(executor):
 
     resp = server.test("", {"x": 9})
     assert resp == {"x": 9, "a": 1, "b": 2, "c": 7, "mul": 18}
+
+
+@pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
+def test_parallel_array_body(executor):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(executor_type=executor),
+    )
+    graph.add_route("c1", handler="sum_hnd")
+    graph.add_route("c2", class_name="Echo", data={"c": 7})
+
+    server = fn.to_mock_server()
+
+    # large enough to be passed to the process pool through shared memory
+    data = np.ones((200, 100))
+    for _ in range(2):
+        resp = server.test(body={"data": data})
+        assert resp == {"sum": 20000.0, "c": 7}
+
+    # the pool is kept alive between requests (also after health checks)
+    server.test("/", method="GET")
+    assert server.graph._object._pool is not None or executor in ["array", "asyncio"]
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_parallel_asyncio(engine):
+    fn = mlrun.new_function("tests", kind="serving")
+    flow = fn.set_topology("flow", engine=engine)
+    router = flow.add_step(
+        "*mlrun.serving.routers.ParallelRun",
+        name="parallel",
+        executor_type="asyncio",
+        extend_event=True,
+    ).respond()
+    router.add_route("c1", handler="async_hnd")
+    router.add_route(
+        "c2", mlrun.serving.states.TaskStep(handler="async_hnd", result_path="c2")
+    )
+    router.add_route("c3", handler="my_hnd")
+    router.add_route("c4", handler="inc_hnd")
+
+    server = fn.to_mock_server()
+
+    start = time.monotonic()
+    resp = server.test(body={"x": 8})
+    server.wait_for_completion()
+    # the async routes are awaited concurrently
+    assert time.monotonic() - start < 1
+    # each route gets its own copy of the body
+    assert resp == {"x": 8, "async": 8, "c2": {"async": 8}, "mul": 16, "inc": 9}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "asyncio"])
+def test_parallel_route_timeout(executor):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(executor_type=executor, route_timeout=1),
+    )
+    graph.add_route("c1", class_name="Echo", data={"c": 7})
+    graph.add_route("c2", handler="slow_hnd")
+
+    server = fn.to_mock_server()
+
+    resp = server.test(body={"x": 8})
+    assert resp == {"c": 7}
+
+
+def test_parallel_shared_buffers_released_when_done():
+    shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+    buffer = shared_memory.SharedMemory(create=True, size=1024)
+    futures = [concurrent.futures.Future(), concurrent.futures.Future()]
+    mlrun.serving.routers._release_buffers_when_done(futures, [buffer])
+
+    # a route which is still queued/running (e.g. after a timeout) can attach to the buffer
+    futures[0].set_result(None)
+    attached = shared_memory.SharedMemory(name=buffer.name)
+    attached.close()
+
+    futures[1].cancel()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=buffer.name)
+
+
+def test_parallel_shared_dataframe_keeps_dtypes():
+    pytest.importorskip("multiprocessing.shared_memory")
+    size = 20000
+    df = pd.DataFrame(
+        {
+            "float": np.arange(size, dtype=np.float64),
+            "category": pd.Categorical(["a", "b"] * (size // 2)),
+            "nullable": pd.array(range(size), dtype="Int64"),
+            "time": pd.date_range("2022-01-01", periods=size, freq="s", tz="UTC"),
+        }
+    )
+    shared_buffers = []
+    shared = mlrun.serving.routers._share_body({"inputs": df}, shared_buffers)
+    try:
+        # only the plain numeric column is placed in shared memory
+        assert len(shared_buffers) == 1
+        attached_buffers = []
+        attached = mlrun.serving.routers._attach_value(
+            shared["inputs"], attached_buffers
+        )
+        pd.testing.assert_frame_equal(attached, df)
+        del attached
+        for buffer in attached_buffers:
+            buffer.close()
+    finally:
+        for buffer in shared_buffers:
+            buffer.close()
+            buffer.unlink()
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import io
 import json
 import os
 import pathlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 import pytest
 from nuclio_sdk import Context as NuclioContext
@@ -206,6 +210,43 @@ class AsyncModelTestingClass(V2ModelServer):
         return resp
 
 
+class BatchModelTestingClass(V2ModelServer):
+    def load(self):
+        self.batch_sizes = []
+        # cleared by the tests to hold the model busy
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, request):
+        self.batch_sizes.append(len(request["inputs"]))
+        self.release.wait(10)
+        return [value * self.get_param("multiplier") for value in request["inputs"]]
+
+
+class ArrayModelTestingClass(V2ModelServer):
+    def load(self):
+        pass
+
+    def predict(self, request):
+        return np.asarray(request["inputs"]).sum(axis=1) * self.get_param("multiplier")
+
+
+class CountingModelTestingClass(V2ModelServer):
+    def load(self):
+        self.predict_calls = 0
+
+    def predict(self, request):
+        self.predict_calls += 1
+        return [value * self.get_param("multiplier") for value in request["inputs"]]
+
+
+class PostprocessModelTestingClass(CountingModelTestingClass):
+    def postprocess(self, request):
+        # changes the outputs in place
+        request["outputs"].append("postprocessed")
+        return request
+
+
 def init_ctx(
     spec=spec, context=None, extra_class_args=None, extra_class_args_names=None
 ):
@@ -380,6 +421,13 @@ def test_ensemble_infer_classification(executor):
     run_model("", 1)
 
 
+def test_ensemble_weighted_majority_vote():
+    ensemble = mlrun.serving.routers.VotingEnsemble(vote_type="classification")
+    predictions = [[0, 1, 1], [2, 2, 0], [1, 0, 0]]
+    votes = ensemble._majority_vote(predictions, [0.6, 0.3, 0.1])
+    assert votes == [0, 2, 1], f"wrong weighted majority votes {votes}"
+
+
 @pytest.mark.parametrize(
     "ensemble_spec_parm",
     [ensemble_spec, ensemble_spec_classification],
@@ -586,6 +634,176 @@ def test_v2_mock():
     assert resp["outputs"] == 5 * 100, f"wrong health response {resp}"
 
 
+def _init_batching_host():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my",
+        class_name=BatchModelTestingClass,
+        model_path="",
+        multiplier=100,
+        max_batch_size=4,
+        batch_max_wait_ms=2000,
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+    return host, host.graph["my"]._object
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timeout waiting for condition"
+        time.sleep(0.01)
+
+
+def test_v2_batching():
+    host, model = _init_batching_host()
+
+    def infer(value):
+        return host.test("/v2/models/my/infer", {"inputs": [value]})
+
+    # hold the first predict, the requests which arrive meanwhile are coalesced into one batch
+    model.release.clear()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(infer, 0)
+        _wait_for(lambda: model.batch_sizes == [1])
+        others = [executor.submit(infer, value) for value in range(1, 4)]
+        _wait_for(lambda: len(model._batcher._pending) == 3)
+        model.release.set()
+        responses = [first.result()] + [future.result() for future in others]
+
+    for value, resp in enumerate(responses):
+        assert resp["outputs"] == [value * 100], f"wrong model response {resp}"
+    assert model.batch_sizes == [1, 3], "expected the waiting requests to be batched"
+    assert model.metrics["batch_size"] == 3
+
+
+def test_v2_batching_sequential_requests_dont_wait():
+    host, model = _init_batching_host()
+
+    start = time.monotonic()
+    for value in range(3):
+        resp = host.test("/v2/models/my/infer", {"inputs": [value]})
+        assert resp["outputs"] == [value * 100]
+    # a lone request is dispatched right away (not after batch_max_wait_ms)
+    assert time.monotonic() - start < 2
+    assert model.batch_sizes == [1, 1, 1]
+
+
+def test_v2_binary_protocol():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my", class_name=ArrayModelTestingClass, model_path="", multiplier=10
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+
+    inputs = np.arange(6, dtype=np.float64).reshape(3, 2)
+    buffer = io.BytesIO()
+    np.save(buffer, inputs)
+    resp = host.test(
+        "/v2/models/my/infer",
+        buffer.getvalue(),
+        content_type="application/x-npy",
+        get_body=False,
+    )
+    assert resp.content_type == "application/x-npy", "expected an npy response"
+    outputs = np.load(io.BytesIO(resp.body))
+    assert outputs.tolist() == [10.0, 50.0, 90.0], f"wrong model response {outputs}"
+
+    # JSON response (Accept header) to a binary request
+    resp = host.test(
+        "/v2/models/my/infer",
+        buffer.getvalue(),
+        headers={"Accept": "application/json"},
+        content_type="application/x-npy",
+        get_body=False,
+    )
+    assert json.loads(resp.body)["outputs"] == [10.0, 50.0, 90.0]
+
+    # bodies which are not arrays (e.g. the model metadata) are returned as JSON
+    resp = host.test(
+        "/v2/models/my/",
+        method="GET",
+        headers={"Accept": "application/x-npy"},
+        get_body=False,
+    )
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.body)["name"] == "my"
+
+    # the JSON protocol is unchanged
+    resp = host.test("/v2/models/my/infer", {"inputs": inputs.tolist()})
+    assert resp["outputs"].tolist() == [10.0, 50.0, 90.0]
+
+    resp = host.test(
+        "/v2/models/my/infer",
+        b"not an array",
+        content_type="application/x-npy",
+        silent=True,
+    )
+    assert resp.status_code == 400, "expected a bad request response"
+
+
+def test_v2_prediction_cache():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my",
+        class_name=CountingModelTestingClass,
+        model_path="",
+        multiplier=100,
+        cache_size=2,
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+    model = host.graph["my"]._object
+
+    def infer(value, request_id=None):
+        body = {"inputs": [value]}
+        if request_id:
+            body["id"] = request_id
+        return host.test("/v2/models/my/infer", body)["outputs"]
+
+    assert infer(1) == [100]
+    # the request id is not part of the cache key
+    assert infer(1, request_id="x") == [100]
+    assert model.predict_calls == 1, "expected a cached response"
+
+    # evict the least recently used response (2)
+    assert infer(2) == [200]
+    assert infer(1) == [100]
+    assert infer(3) == [300]
+    assert infer(2) == [200]
+    assert model.predict_calls == 4
+    stats = model.cache_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 4 and stats["evictions"] == 2
+    assert model.metrics["cache_hit_rate"] == stats["hit_rate"]
+
+    # the cache is cleared when the model is reloaded
+    model._load_and_update_state()
+    assert infer(2) == [200]
+    assert model.predict_calls == 1
+    assert model.cache_stats()["size"] == 1
+
+
+def test_v2_prediction_cache_postprocess_changes():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my",
+        class_name=PostprocessModelTestingClass,
+        model_path="",
+        multiplier=100,
+        cache_size=2,
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+
+    # postprocess() changes to the outputs don't affect the cached outputs
+    for _ in range(3):
+        resp = host.test("/v2/models/my/infer", {"inputs": [1]})
+        assert resp["outputs"] == [100, "postprocessed"]
+    assert host.graph["my"]._object.predict_calls == 1
+
+
 def test_function():
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology("router")
@@ -66,6 +66,32 @@ def test_custom_tracking():
     assert rec_to_data(fake_stream[0]) == ("my", "ModelTestingCustomTrack", [[1]], [2])
 
 
+def test_tracking_background_flush():
+    # test that records are buffered and pushed together by the background flusher
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake",
+        stream_args={"mock": True, "access_key": "x"},
+        flush_interval=600,
+    )
+
+    server = fn.to_mock_server()
+    for _ in range(3):
+        server.test("/v2/models/my/infer", testdata)
+
+    fake_stream = server.context.stream.output_stream._mock_queue
+    assert len(fake_stream) == 0
+
+    # the buffered records are pushed when the graph completes
+    server.wait_for_completion()
+    model_logger = server.graph.routes["my"]._object._model_logger
+    assert len(fake_stream) == 3
+    assert model_logger.pushed_records == 3
+    for rec in fake_stream:
+        assert rec_to_data(rec) == ("my", "ModelTestingClass", [[5, 6]], [10])
+
+
 def test_ensemble_tracking():
     # test proper tracking of an ensemble (router + models are logged)
     fn = mlrun.new_function("tests", kind="serving")
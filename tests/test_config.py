@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import unittest.mock
 from contextlib import contextmanager
 from os import environ
 from tempfile import NamedTemporaryFile
@@ -555,3 +556,51 @@ def test_verify_security_context_enrichment_mode_is_allowed_failure():
         "Unable to determine if security context enrichment mode is allowed. Missing iguazio version"
         in str(exc.value)
     )
+
+
+def test_config_snapshot(config):
+    snapshot = config.snapshot()
+    assert snapshot.datastore.async_source_mode == config.datastore.async_source_mode
+    assert config.snapshot() is snapshot, "expected a cached snapshot"
+    with pytest.raises(AttributeError):
+        snapshot.namespace = "other"
+
+    # nested set, update and reload invalidate the snapshot
+    config.datastore.async_source_mode = "enabled"
+    assert config.snapshot().datastore.async_source_mode == "enabled"
+    assert snapshot.datastore.async_source_mode != "enabled", "snapshot changed"
+
+    config.update({"httpdb": {"logs": {"decode": {"errors": "replace"}}}})
+    assert config.snapshot().httpdb.logs.decode.errors == "replace"
+
+    with patch_env({namespace_env_key: "snapshot-namespace"}):
+        config.reload()
+    assert config.snapshot().namespace == "snapshot-namespace"
+
+
+def test_config_snapshot_reads_dont_allocate(config):
+    # the config wraps every nested section in a new object on each access, the snapshot sections are prebuilt
+    assert config.httpdb.logs is not config.httpdb.logs
+    snapshot = config.snapshot()
+    assert snapshot.httpdb.logs is snapshot.httpdb.logs
+    assert snapshot.httpdb.logs.decode.errors == config.httpdb.logs.decode.errors
+
+    # compare the objects created by nested config reads and by snapshot reads
+    number = 1000
+    created = []
+    config_init = mlconf.Config.__init__
+
+    def counting_init(self, cfg=None):
+        created.append(self)
+        config_init(self, cfg)
+
+    with unittest.mock.patch.object(mlconf.Config, "__init__", counting_init):
+        for _ in range(number):
+            config.httpdb.logs.decode.errors
+        config_reads_objects = len(created)
+        created.clear()
+        for _ in range(number):
+            config.snapshot().httpdb.logs.decode.errors
+        snapshot_reads_objects = len(created)
+    assert config_reads_objects == 3 * number
+    assert snapshot_reads_objects == 0
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import datetime
 import os
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock
@@ -99,6 +100,121 @@ def test_file():
         }, "failed artifact update test"
 
 
+def test_iter_chunks():
+    with TemporaryDirectory() as tmpdir:
+        data = mlrun.run.get_dataitem(tmpdir + "/test1.txt")
+        data.put(b"abcdefg")
+        assert list(data.iter_chunks(chunk_size=3)) == [b"abc", b"def", b"g"]
+
+    data = mlrun.datastore.set_in_memory_item("chunks", "abcdefg")
+    assert list(data.iter_chunks(chunk_size=4)) == [b"abcd", b"efg"]
+
+
+def test_as_df_directory():
+    with TemporaryDirectory() as tmpdir:
+        for i in range(4):
+            mlrun.run.get_dataitem(f"{tmpdir}/data.csv/part-{i}.csv").put(
+                f"a,b\n{i},{i * 2}\n"
+            )
+        mlrun.run.get_dataitem(f"{tmpdir}/data.csv/_SUCCESS").put("")
+
+        data = mlrun.run.get_dataitem(f"{tmpdir}/data.csv")
+        df = data.as_df(usecols=["a"])
+        assert sorted(df["a"].tolist()) == [0, 1, 2, 3]
+        assert list(df.columns) == ["a"]
+
+        dfs = list(data.as_df_iter())
+        assert len(dfs) == 4
+        assert sorted(df["b"][0] for df in dfs) == [0, 2, 4, 6]
+
+
+def test_as_df_iter_chunks():
+    with TemporaryDirectory() as tmpdir:
+        data = mlrun.run.get_dataitem(f"{tmpdir}/data.csv")
+        data.put("a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(10)))
+
+        dfs = list(data.as_df_iter(chunksize=4))
+        assert [len(df) for df in dfs] == [4, 4, 2]
+        df = pd.concat(
+            data.as_df_iter(chunksize=4, columns=["b"], filters=[("a", ">=", 7)])
+        )
+        assert df.to_dict("list") == {"b": [14, 16, 18]}
+
+        pd.DataFrame({"a": range(10), "b": range(10)}).to_parquet(
+            f"{tmpdir}/data.parquet", row_group_size=4
+        )
+        data = mlrun.run.get_dataitem(f"{tmpdir}/data.parquet")
+        assert [len(df) for df in data.as_df_iter(chunksize=10)] == [4, 4, 2]
+        df = pd.concat(data.as_df_iter(columns=["a"], filters=[("b", "<", 2)]))
+        assert df.to_dict("list") == {"a": [0, 1]}
+        # list style predicates are accepted as well
+        df = pd.concat(data.as_df_iter(columns=["a"], filters=[["b", "<", 2]]))
+        assert df.to_dict("list") == {"a": [0, 1]}
+
+
+def test_as_df_iter_time_range():
+    with TemporaryDirectory() as tmpdir:
+        data = mlrun.run.get_dataitem(f"{tmpdir}/data.csv")
+        data.put(
+            "time,a\n"
+            + "".join(f"2022-01-01 {hour:02d}:00:00,{hour}\n" for hour in range(10))
+        )
+        start_time = datetime.datetime(2022, 1, 1, 2)
+        end_time = datetime.datetime(2022, 1, 1, 5)
+
+        df = pd.concat(
+            data.as_df_iter(
+                columns=["a"],
+                chunksize=3,
+                start_time=start_time,
+                end_time=end_time,
+                time_column="time",
+            )
+        )
+        assert df.to_dict("list") == {"a": [3, 4, 5]}
+        df = pd.concat(
+            data.as_df_iter(
+                filters=[[("a", "!=", 4)], [("a", "<", 1)]],
+                start_time=start_time,
+                time_column="time",
+            )
+        )
+        assert list(df["a"]) == [3, 5, 6, 7, 8, 9]
+
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            list(data.as_df_iter(start_time=start_time))
+
+
+def test_local_cache():
+    with TemporaryDirectory() as tmpdir:
+        data = mlrun.run.get_dataitem(tmpdir + "/data/test1.csv")
+        data.put("a,b\n1,2\n")
+        cache = mlrun.datastore.local_cache.LocalFileCache(
+            os.path.join(tmpdir, "cache"), max_size=1024
+        )
+
+        cached_path = cache.get_local_path(data.store, data._path, data.url, ".csv")
+        assert cache.get_local_path(data.store, data._path, data.url, ".csv") == (
+            cached_path
+        )
+        assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+        assert pd.read_csv(cached_path).to_dict() == {"a": {0: 1}, "b": {0: 2}}
+
+        # modified objects are downloaded again, the least recently used files are evicted
+        data.put("a,b\n" + "1,2\n" * 300)
+        new_path = cache.get_local_path(data.store, data._path, data.url, ".csv")
+        assert new_path != cached_path
+        assert not os.path.exists(cached_path) and os.path.exists(new_path)
+        assert cache.stats()["evictions"] == 1
+
+        # copies are private, changing or deleting them doesn't affect the cache
+        copy_path = os.path.join(tmpdir, "copy.csv")
+        assert cache.copy_to(data.store, data._path, data.url, copy_path, ".csv")
+        os.remove(copy_path)
+        assert os.path.exists(new_path)
+        assert cache.stats()["hits"] == 2
+
+
 def test_parse_url_preserve_case():
     url = "store://Hedi/mlrun-dbd7ef-training_mymodel#a5dc8e34a46240bb9a07cd9deb3609c7"
     expected_endpoint = "Hedi"
@@ -0,0 +1,71 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import subprocess
+import sys
+
+import mlrun
+
+# modules which should not be imported by a plain "import mlrun"
+heavy_modules = [
+    "mlrun.projects",
+    "mlrun.projects.pipelines",
+    "mlrun.run",
+]
+
+
+def _import_times(statement: str) -> dict:
+    """return the cumulative import time (us) per module, using python -X importtime"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_mlrun_is_lazy():
+    times = _import_times("import mlrun")
+    imported = [module for module in heavy_modules if module in times]
+    assert not imported, f"import mlrun imported heavy modules {imported}"
+
+
+def test_lazy_attributes():
+    assert mlrun.new_function is mlrun.run.new_function
+    assert mlrun.get_or_create_ctx is mlrun.run.get_or_create_ctx
+    assert mlrun.load_project is mlrun.projects.load_project
+    assert mlrun.get_version() == mlrun.__version__
+    assert "code_to_function" in dir(mlrun)
+    # sub packages are imported on access as well
+    assert mlrun.k8s_utils.__name__ == "mlrun.k8s_utils"
+
+    # the lazy objects are imported with importlib (not listed by -X importtime)
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from mlrun import get_or_create_ctx; print('mlrun.run' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert process.stdout.splitlines()[-1] == "True"
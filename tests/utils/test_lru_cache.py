@@ -0,0 +1,43 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest.mock
+
+import mlrun.utils.lru_cache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = mlrun.utils.lru_cache.LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1) and cache.get("c") == (True, 3)
+    stats = cache.stats()
+    assert stats["size"] == 2 and stats["evictions"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+
+def test_lru_cache_max_bytes_and_ttl():
+    cache = mlrun.utils.lru_cache.LRUCache(max_bytes=10, ttl=5, size_func=len)
+    cache.set("big", "x" * 11)
+    assert cache.get("big") == (False, None)
+    cache.set("a", "x" * 6)
+    cache.set("b", "x" * 6)
+    assert cache.stats()["bytes"] == 6 and cache.get("a") == (False, None)
+
+    with unittest.mock.patch("time.monotonic", return_value=10**9):
+        assert cache.get("b") == (False, None)
+    assert cache.stats()["size"] == 0